@@ -0,0 +1,73 @@
+# bench/bench_batch_dml.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+executemany INSERTs and UPDATEs, and an ORM flush, with plain executemany,
+``fast_executemany`` and ``batch_dml``, against a server ``--latency``
+seconds away:
+
+    python bench/bench_batch_dml.py --rows 5000 --latency 0.002
+"""
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, bindparam
+from sqlalchemy.orm import Session, declarative_base
+
+import benchutil
+
+Base = declarative_base()
+
+
+class Order(Base):
+    __tablename__ = "bench_orders"
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    status = Column(String(10))
+
+
+def run(args, label, **engine_kwargs):
+    engine = benchutil.engine(args, **engine_kwargs)
+    items = Table(
+        "bench_items",
+        MetaData(),
+        Column("id", Integer, primary_key=True, autoincrement=False),
+        Column("name", String(20)),
+        Column("qty", Integer),
+    )
+    items.drop(engine, checkfirst=True)
+    items.create(engine)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    rows = [{"id": i, "name": "item %d" % i, "qty": i % 7} for i in range(args.rows)]
+    with engine.begin() as connection:
+        with benchutil.Timer() as insert:
+            connection.execute(items.insert(), rows)
+        with benchutil.Timer() as update:
+            connection.execute(
+                items.update().where(items.c.id == bindparam("key")).values(qty=bindparam("qty")),
+                [{"key": row["id"], "qty": row["qty"] + 1} for row in rows],
+            )
+    with Session(engine) as session:
+        with benchutil.Timer() as flush:
+            session.add_all(Order(id=i, status="new") for i in range(args.rows // 10))
+            session.commit()
+
+    print("%-18s insert %s   update %s   ORM flush %s" % (label, insert, update, flush))
+    items.drop(engine)
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+def main():
+    parser = benchutil.parser(__doc__)
+    parser.add_argument("--rows", type=int, default=2000)
+    args = parser.parse_args()
+
+    run(args, "executemany")
+    run(args, "fast_executemany", fast_executemany=True)
+    run(args, "batch_dml", batch_dml=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# bench/bench_concurrency.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+Multi-threaded stress of dialect initialization, driver import and the
+prepared cursor cache, and query throughput as threads are added:
+
+    python bench/bench_concurrency.py --threads 1 --threads 16 --threads 64 --threads 128
+
+Errors and inconsistent dialect state are reported; throughput should
+grow with the thread count until the pool or the server is saturated.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import text
+
+import benchutil
+from sqlalchemy_ingres.pyodbc import Ingres_pyodbc
+
+
+def together(threads, fn):
+    """Run ``fn(i)`` on ``threads`` threads released at the same moment; returns results and errors"""
+    barrier = threading.Barrier(threads)
+
+    def run(i):
+        barrier.wait()
+        try:
+            return fn(i), None
+        except Exception as err:
+            return None, err
+
+    with ThreadPoolExecutor(threads) as pool:
+        outcomes = list(pool.map(run, range(threads)))
+    return [result for result, _ in outcomes], [err for _, err in outcomes if err is not None]
+
+
+def stress_import(threads):
+    try:
+        Ingres_pyodbc._import_driver()
+    except ImportError:
+        print("driver import            skipped, neither pyodbc nor pypyodbc is installed")
+        return
+    modules, errors = together(threads, lambda i: Ingres_pyodbc._import_driver())
+    print("driver import            %d threads, %d errors, %d module(s)" % (threads, len(errors), len(set(modules))))
+
+
+def stress_first_connect(args, threads, rounds):
+    errors = []
+    inconsistent = 0
+    for _ in range(rounds):
+        engine = benchutil.engine(args, pool_size=threads, max_overflow=0)
+
+        def first_connect(i):
+            with engine.connect() as connection:
+                capabilities = connection.dialect.iidbcapabilities
+                return capabilities is not None and "DBMS_TYPE" in capabilities
+
+        results, round_errors = together(threads, first_connect)
+        errors.extend(round_errors)
+        inconsistent += results.count(False)
+        engine.dispose()
+    print(
+        "first connect            %d threads x %d engines, %d errors, %d saw partial iidbcapabilities"
+        % (threads, rounds, len(errors), inconsistent)
+    )
+    for err in errors[:3]:
+        print("    %r" % err)
+
+
+def throughput(engine, threads, queries):
+    statements = [text("SELECT %d" % i) for i in range(16)]
+
+    def work(i):
+        with engine.connect() as connection:
+            for j in range(queries):
+                connection.execute(statements[(i + j) % len(statements)]).scalar()
+        return queries
+
+    with benchutil.Timer() as timer:
+        results, errors = together(threads, work)
+    done = sum(result or 0 for result in results)
+    print(
+        "throughput %4d threads  %s %10.0f queries/s %d errors" % (threads, timer, done / timer.elapsed, len(errors))
+    )
+
+
+def main():
+    parser = benchutil.parser(__doc__)
+    parser.add_argument("--threads", type=int, action="append")
+    parser.add_argument("--queries", type=int, default=200, help="queries per thread")
+    parser.add_argument("--rounds", type=int, default=10, help="engines created for the first connect stress")
+    parser.add_argument("--cursor-cache-size", type=int, default=8)
+    args = parser.parse_args()
+    thread_counts = args.threads or [1, 8, 32, 64, 128]
+
+    stress_import(max(thread_counts))
+    stress_first_connect(args, max(64, max(thread_counts)), args.rounds)
+
+    engine = benchutil.engine(args, pool_size=max(thread_counts), max_overflow=0, cursor_cache_size=args.cursor_cache_size)
+    for threads in thread_counts:
+        throughput(engine, threads, args.queries)
+    cache_sizes = set()
+    for record in list(engine.pool._pool.queue):
+        cache = record.dbapi_connection is not None and record.info.get("ingres_cursor_cache")
+        if cache:
+            cache_sizes.add(len(cache._idle))
+    print("cursor cache entries per connection: %s" % sorted(cache_sizes))
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
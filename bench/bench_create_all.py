@@ -0,0 +1,69 @@
+# bench/bench_create_all.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+DDL compilation and create_all() / drop_all() of a large MetaData, with
+MetaData.create_all() and with sqlalchemy_ingres.ddl.create_all():
+
+    python bench/bench_create_all.py --tables 1000 --columns 30
+"""
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, UniqueConstraint
+from sqlalchemy.schema import CreateTable
+
+import benchutil
+from sqlalchemy_ingres import ddl
+
+
+def metadata(tables, columns):
+    metadata = MetaData()
+    for i in range(tables):
+        Table(
+            "bench_ddl_%d" % i,
+            metadata,
+            Column("id", Integer, primary_key=True, autoincrement=False),
+            Column("name", String()),
+            Column("code", String(10)),
+            UniqueConstraint("code"),
+            *[Column("c%d" % j, Integer) for j in range(columns)]
+        )
+    return metadata
+
+
+def main():
+    parser = benchutil.parser(__doc__)
+    parser.add_argument("--tables", type=int, default=1000)
+    parser.add_argument("--columns", type=int, default=30)
+    args = parser.parse_args()
+
+    engine = benchutil.engine(args)
+    tables = metadata(args.tables, args.columns)
+    with engine.connect() as connection:
+        # first connect reads iidbcapabilities, used by the DDL compiler
+        pass
+
+    with benchutil.Timer() as timer:
+        for table in tables.sorted_tables:
+            CreateTable(table).compile(dialect=engine.dialect)
+    print("%-24s %s" % ("compile CREATE TABLE", timer))
+
+    tables.drop_all(engine)
+    for label, create_all, drop_all in [
+        ("MetaData", tables.create_all, tables.drop_all),
+        ("ddl", lambda bind: ddl.create_all(bind, tables), lambda bind: ddl.drop_all(bind, tables)),
+    ]:
+        with benchutil.Timer() as timer:
+            create_all(engine)
+        print("%-24s %s" % (label + ".create_all", timer))
+        with benchutil.Timer() as timer:
+            create_all(engine)
+        print("%-24s %s" % (label + ".create_all again", timer))
+        with benchutil.Timer() as timer:
+            drop_all(engine)
+        print("%-24s %s" % (label + ".drop_all", timer))
+
+
+if __name__ == "__main__":
+    main()
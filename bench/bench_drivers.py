@@ -0,0 +1,77 @@
+# bench/bench_drivers.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+The pyodbc and ingresdbi dialects side by side, each with its default
+settings and tuned: executemany INSERT, a large SELECT and single-row
+queries.
+
+    python bench/bench_drivers.py --rows 20000 --latency 0.001
+    python bench/bench_drivers.py --url ingres://dbhost/benchdb --ingresdbi-url ingres+ingresdbi://dbhost/benchdb
+"""
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, select
+
+import benchutil
+
+CONFIGURATIONS = [
+    ("pyodbc", "pyodbc", {}),
+    ("pyodbc tuned", "pyodbc", {"fast_executemany": True}),
+    ("ingresdbi", "ingresdbi", {}),
+    ("ingresdbi tuned", "ingresdbi", {"arraysize": 1000, "setinputsizes": True, "batch_dml": True}),
+]
+
+
+def make_engine(args, driver, kwargs):
+    if args.url or args.ingresdbi_url:
+        url = args.url if driver == "pyodbc" else args.ingresdbi_url
+        return create_engine(url, **kwargs) if url else None
+    return benchutil.engine(args, driver=driver, **kwargs)
+
+
+def run(args, label, engine):
+    items = Table(
+        "bench_drivers",
+        MetaData(),
+        Column("id", Integer, primary_key=True, autoincrement=False),
+        Column("name", String(40)),
+        Column("qty", Integer),
+    )
+    items.drop(engine, checkfirst=True)
+    items.create(engine)
+
+    rows = [{"id": i, "name": "item %d" % i, "qty": i % 7} for i in range(args.rows)]
+    with engine.begin() as connection:
+        with benchutil.Timer() as insert:
+            connection.execute(items.insert(), rows)
+    with engine.connect() as connection:
+        with benchutil.Timer() as scan:
+            for row in connection.execute(select(items)):
+                pass
+        lookup = select(items.c.name).where(items.c.id == 0)
+        with benchutil.Timer() as lookups:
+            for i in range(args.lookups):
+                connection.execute(lookup.params(id_1=i)).scalar()
+
+    print("%-16s insert %s   select %s   %d lookups %s" % (label, insert, scan, args.lookups, lookups))
+    items.drop(engine)
+    engine.dispose()
+
+
+def main():
+    parser = benchutil.parser(__doc__)
+    parser.add_argument("--ingresdbi-url", help="Ingres database URL for the ingresdbi dialect")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--lookups", type=int, default=500)
+    args = parser.parse_args()
+
+    for label, driver, kwargs in CONFIGURATIONS:
+        engine = make_engine(args, driver, kwargs)
+        if engine is not None:
+            run(args, label, engine)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# bench/bench_lob.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+Client memory and time of moving one large LONG BYTE value whole and with
+sqlalchemy_ingres.lob, for several chunk sizes:
+
+    python bench/bench_lob.py --size-mb 256 --chunk-mb 1 --chunk-mb 16
+"""
+
+import tracemalloc
+
+from sqlalchemy import Column, Integer, LargeBinary, MetaData, Table, select
+
+import benchutil
+from sqlalchemy_ingres.lob import open_lob, write_lob
+
+MB = 1024 * 1024
+
+
+class Source(object):
+    """File-like source of ``size`` generated bytes, holding only what read() returns"""
+
+    def __init__(self, size):
+        self.size = size
+        self.position = 0
+
+    def read(self, n=-1):
+        n = self.size - self.position if n < 0 else min(n, self.size - self.position)
+        self.position += n
+        return bytes([self.position // MB % 256]) * n
+
+
+def measure(label, fn):
+    tracemalloc.start()
+    with benchutil.Timer() as timer:
+        fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print("%-28s %s %10.1f MB peak" % (label, timer, peak / float(MB)))
+
+
+def main():
+    parser = benchutil.parser(__doc__)
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--chunk-mb", type=float, action="append")
+    args = parser.parse_args()
+    size = args.size_mb * MB
+
+    engine = benchutil.engine(args)
+    documents = Table(
+        "bench_lob", MetaData(), Column("id", Integer, primary_key=True, autoincrement=False), Column("body", LargeBinary)
+    )
+    documents.drop(engine, checkfirst=True)
+    documents.create(engine)
+    where = documents.c.id == 1
+
+    with engine.begin() as connection:
+        connection.execute(documents.insert(), {"id": 1, "body": b""})
+
+        def whole_write():
+            connection.execute(documents.update().where(where), {"body": Source(size).read()})
+
+        def whole_read():
+            connection.execute(select(documents.c.body).where(where)).scalar()
+
+        measure("whole value write", whole_write)
+        measure("whole value read", whole_read)
+
+        if not args.url:
+            print("(stand-in: CONCAT runs in this process, so write_lob peaks include the value appended to)")
+        for chunk_mb in args.chunk_mb or [1, 16]:
+            chunk_size = int(chunk_mb * MB)
+
+            def chunked_write():
+                write_lob(connection, documents.c.body, where, Source(size), chunk_size)
+
+            def chunked_read():
+                with open_lob(connection, documents.c.body, where, chunk_size=chunk_size) as lob:
+                    for chunk in lob:
+                        pass
+
+            measure("write_lob %gMB chunks" % chunk_mb, chunked_write)
+            measure("open_lob %gMB chunks" % chunk_mb, chunked_read)
+
+    documents.drop(engine)
+
+
+if __name__ == "__main__":
+    main()
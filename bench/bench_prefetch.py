@@ -0,0 +1,65 @@
+# bench/bench_prefetch.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+Rows per second of a large SELECT processed row by row, with and without
+the ``ingres_prefetch`` execution option, for a given amount of Python work
+per row:
+
+    python bench/bench_prefetch.py --rows 200000 --work-us 20 --latency 0.002
+"""
+
+import time
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, select
+
+import benchutil
+
+
+def process(row, work):
+    # stands in for per-row application work holding the GIL
+    deadline = time.perf_counter() + work
+    while time.perf_counter() < deadline:
+        pass
+
+
+def main():
+    parser = benchutil.parser(__doc__)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--work-us", type=float, default=10.0, help="microseconds of processing per row")
+    parser.add_argument("--prefetch", type=int, action="append", help="rowsets fetched ahead (default 1, 4)")
+    parser.add_argument("--prefetch-rows", type=int, default=1000)
+    args = parser.parse_args()
+    work = args.work_us / 1e6
+
+    engine = benchutil.engine(args)
+    rows = Table(
+        "bench_prefetch",
+        MetaData(),
+        Column("id", Integer, primary_key=True, autoincrement=False),
+        Column("name", String(40)),
+    )
+    rows.drop(engine, checkfirst=True)
+    rows.create(engine)
+    with engine.begin() as connection:
+        connection.execute(rows.insert(), [{"id": i, "name": "row %d" % i} for i in range(args.rows)])
+
+    query = select(rows).order_by(rows.c.id)
+    options = [{}] + [
+        {"ingres_prefetch": n, "ingres_prefetch_rows": args.prefetch_rows} for n in args.prefetch or [1, 4]
+    ]
+    with engine.connect() as connection:
+        for opts in options:
+            with benchutil.Timer() as timer:
+                for row in connection.execution_options(**opts).execute(query):
+                    process(row, work)
+            label = "ingres_prefetch=%d" % opts["ingres_prefetch"] if opts else "no prefetch"
+            print("%-20s %s %10.0f rows/s" % (label, timer, args.rows / timer.elapsed))
+
+    rows.drop(engine)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# bench/benchutil.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+Shared setup of the benchmark scripts.
+
+Each script runs against the Ingres database given by ``--url``, or by
+default against the sqlite-backed stand-in driver of the tests
+(tests/standin.py), where ``--latency`` seconds are added per round trip to
+the "server".  Stand-in timings show the round trips and client-side costs
+a change saves, not Ingres server performance.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "tests"))
+
+
+def parser(description):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--url", help="Ingres database URL (default: sqlite stand-in)")
+    parser.add_argument("--latency", type=float, default=0.0005, help="stand-in seconds per round trip")
+    return parser
+
+
+def engine(args, **kwargs):
+    """Engine for ``args.url``, or for a fresh stand-in database"""
+    if args.url:
+        return create_engine(args.url, **kwargs)
+    import standin
+
+    path = os.path.join(tempfile.mkdtemp(prefix="ingres-bench-"), "bench.db")
+    return standin.engine(path, latency=args.latency, **kwargs)
+
+
+def round_trips():
+    """Round trips made to the stand-in so far, or None against a real server"""
+    standin = sys.modules.get("standin")
+    return None if standin is None else standin.stats["round_trips"]
+
+
+class Timer(object):
+    def __enter__(self):
+        self.trips = round_trips()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.elapsed = time.perf_counter() - self.start
+        trips = round_trips()
+        self.trips = None if trips is None else trips - self.trips
+        return False
+
+    def __str__(self):
+        text = "%8.3f s" % self.elapsed
+        if self.trips is not None:
+            text += " %8d round trips" % self.trips
+        return text
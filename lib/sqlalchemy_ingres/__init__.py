@@ -12,4 +12,9 @@ from sqlalchemy_ingres import (
 
 from ._version import __version__, __version_info__
 
+# SQL constructs, like those of sqlalchemy.dialects.*; helper modules such as
+# sqlalchemy_ingres.lob or sqlalchemy_ingres.export are imported by their own name
+from .ddl import create_table_as
+from .dml import merge
+
 base.dialect = pyodbc.Ingres_pyodbc
@@ -25,17 +25,27 @@ where server is the remote server name, or (LOCAL) if local,
 
 """
 
+import collections
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import sqlalchemy
-from sqlalchemy import types, schema
+from sqlalchemy import event, exc, types, schema
 from sqlalchemy.engine import cursor as _cursor
 from sqlalchemy.engine import default, reflection
-from sqlalchemy.schema import DDLElement
 from sqlalchemy.sql import compiler
-from sqlalchemy.sql.expression import func
-from sqlalchemy.sql.dml import DMLState
+from sqlalchemy.sql.expression import and_, exists, func, literal_column, select
+from sqlalchemy.sql.dml import DMLState, Insert
 from sqlalchemy.sql.selectable import TableClause
 from typing import TYPE_CHECKING
 
+from sqlalchemy_ingres.prefetch import _PrefetchCursorFetchStrategy
+from sqlalchemy_ingres.profiling import _ProfilingCursor, _timed_processor
+from sqlalchemy_ingres.resultcache import _MODIFYING, _ResultCache
+from sqlalchemy_ingres.spill import _SpillingCursorFetchStrategy
+
 try:
     from sqlalchemy.sql._typing import is_sql_compiler
 except ImportError:
@@ -58,6 +68,19 @@ isolation_lookup = set(
     ]
 )
 
+class _IngresIntervalYearToMonth(types.Interval):
+    """INTERVAL YEAR TO MONTH, a number of years and months which has no timedelta equivalent.
+
+    Values are passed as the driver gives them, e.g. ``"1-02"``.
+    """
+
+    def bind_processor(self, dialect):
+        return None
+
+    def result_processor(self, dialect, coltype):
+        return None
+
+
 ischema_names = {
     "ANSIDATE": types.Date,
     "BIGINT": types.BigInteger,
@@ -71,7 +94,7 @@ ischema_names = {
     "FLOAT": types.Float,
     "INGRESDATE": types.DateTime,
     "INTEGER": types.Integer,
-    "INTERVAL YEAR TO MONTH": types.Interval,
+    "INTERVAL YEAR TO MONTH": _IngresIntervalYearToMonth,
     "INTERVAL DAY TO SECOND": types.Interval,
     "LONG BYTE": types.LargeBinary,
     "LONG NVARCHAR": types.UnicodeText,
@@ -132,6 +155,36 @@ class _IngresDateWithoutTime(types.Date):
 
 colspecs = {types.Boolean: _IngresBoolean}
 
+# Python types reported by the driver in cursor.description, used to describe
+# session tables which do not appear in the standard catalogs
+session_column_types = {
+    "bool": types.Boolean,
+    "bytearray": types.LargeBinary,
+    "bytes": types.LargeBinary,
+    "date": types.Date,
+    "datetime": types.TIMESTAMP,
+    "Decimal": types.DECIMAL,
+    "float": types.Float,
+    "int": types.Integer,
+    "str": types.VARCHAR,
+    "time": types.TIME,
+    "timedelta": types.Interval,
+}
+
+
+def _is_session_table(table):
+    """True for global temporary (session) tables.
+
+    These are Tables declared with a TEMPORARY prefix or ``ingres_temporary=True``,
+    or placed in the ``session`` schema.
+    """
+    if (getattr(table, "schema", None) or "").lower() == "session":
+        return True
+    if "TEMPORARY" in " ".join(getattr(table, "_prefixes", None) or ()).upper():
+        return True
+    kwargs = getattr(table, "kwargs", None) or {}
+    return bool(kwargs.get("ingres_temporary"))
+
 
 class IngresTypeCompiler(compiler.GenericTypeCompiler):
     def visit_TIME(self, type_):
@@ -179,15 +232,103 @@ class IngresTypeCompiler(compiler.GenericTypeCompiler):
         return self.visit_NCLOB(type_)
 
 
+class IngresIdentifierPreparer(compiler.IdentifierPreparer):
+    def schema_for_object(self, obj):
+        # session tables are always referenced as session.<name>
+        schema = getattr(obj, "schema", None)
+        if schema is None and _is_session_table(obj):
+            return "session"
+        return schema
+
+    def _with_schema_translate(self, schema_translate_map):
+        prep = compiler.IdentifierPreparer._with_schema_translate(self, schema_translate_map)
+        translated_schema = prep.schema_for_object
+
+        def schema_for_object(obj):
+            # session tables are not subject to schema_translate_map
+            if _is_session_table(obj):
+                return "session"
+            return translated_schema(obj)
+
+        prep.schema_for_object = schema_for_object
+        return prep
+
+
 class IngresSQLCompiler(compiler.SQLCompiler):
+    _ingres_compile_time = 0.0
+
+    def __init__(self, dialect, statement, *args, **kwargs):
+        # reported by the ingres_profiler execution option, so only timed once
+        # the option is in use
+        timed = dialect._ingres_profiling or "ingres_profiler" in getattr(statement, "_execution_options", ())
+        if timed:
+            start = time.perf_counter()
+        # names of the tables the statement uses, for result cache invalidation
+        self._ingres_tables = set()
+        # IN lists sent as session tables by the execution each thread is setting
+        # up; one compiled statement may be executed by several threads at once
+        self._ingres_inlists = threading.local()
+        compiler.SQLCompiler.__init__(self, dialect, statement, *args, **kwargs)
+        if timed:
+            self._ingres_compile_time = time.perf_counter() - start
+
+    def visit_table(self, table, **kw):
+        self._ingres_tables.add(table.name.lower())
+        return compiler.SQLCompiler.visit_table(self, table, **kw)
+
     def visit_sequence(self, seq, **kwargs):
         # NOTE this now silently ignores keyword argument 'literal_binds', etc.
         return "NEXT VALUE FOR %s" % self.preparer.format_sequence(seq)
 
+    def visit_ingres_lob_substring(self, element, **kw):
+        # ANSI form, which also takes LONG VARCHAR / LONG BYTE values; used by sqlalchemy_ingres.lob
+        return "SUBSTRING(%s FROM %s FOR %s)" % (
+            self.process(element.value, **kw),
+            self.process(element.start, **kw),
+            self.process(element.length, **kw),
+        )
+
+    def _literal_execute_expanding_parameter(self, name, parameter, values):
+        threshold = self.dialect.inlist_threshold
+        if (
+            threshold
+            and values
+            and len(values) > threshold
+            and not parameter.literal_execute
+            and not parameter.type._isnull
+            and not parameter.type._is_tuple_type
+            and not getattr(parameter.type, "_has_bind_expression", False)
+            and not isinstance(values[0], (tuple, list))
+        ):
+            # Render IN (SELECT v FROM session.x) rather than one bind per value;
+            # IngresExecutionContext.pre_exec() loads the values into session.x
+            inlists = self._ingres_inlists.current
+            table_name = "ingres_inlist_%d" % len(inlists)
+            inlists.append((table_name, parameter.type, values))
+            return [], "SELECT v FROM session.%s" % table_name
+        return compiler.SQLCompiler._literal_execute_expanding_parameter(self, name, parameter, values)
+
+    def _process_parameters_for_postcompile(self, parameters, _populate_self=False):
+        self._ingres_inlists.current = []
+        return compiler.SQLCompiler._process_parameters_for_postcompile(self, parameters, _populate_self)
+
+    def _take_inlists(self):
+        """(table name, type, values) of the IN lists of the execution this thread just set up"""
+        inlists = getattr(self._ingres_inlists, "current", None)
+        self._ingres_inlists.current = None
+        return inlists or None
+
+    def _is_nested_select(self):
+        # The SELECT of INSERT ... SELECT is a query in its own right, so it keeps
+        # its DISTINCT / LIMIT; dropping them would change which rows are inserted
+        if len(self.stack) == 2 and isinstance(self.stack[0]["selectable"], Insert):
+            return False
+        return self.is_subquery()
+
     def limit_clause(self, select, **kwargs):
         # NOTE this now silently ignores keyword argument 'literal_binds', 'enclosing_alias', 'include_table', etc.
         text = ""
-        if not self.is_subquery():
+        if not self._is_nested_select():
             if is_integer_greater_than_zero(select._offset):
                 text += "\nOFFSET %s" % select._offset
             if is_integer_greater_than_zero(select._limit):
@@ -201,25 +342,127 @@ class IngresSQLCompiler(compiler.SQLCompiler):
         # FIXME SA 1.4 code indicates this is going away and being replaced with -- `_expression.Select.prefix_with` should be used for special keywords at the start of a SELECT.
         # NOTE this now silently ignores keyword argument 'literal_binds', 'enclosing_alias', 'eager_grouping', etc.
         s = ""
-        if select._distinct and not self.is_subquery():
+        if select._distinct and not self._is_nested_select():
             s = " DISTINCT "
         return s
 
+    def update_tables_clause(self, update_stmt, from_table, extra_froms, **kw):
+        # Ingres puts the FROM list before SET: UPDATE t FROM t2 SET ... WHERE ...
+        text = compiler.SQLCompiler.update_tables_clause(self, update_stmt, from_table, extra_froms, **kw)
+        if extra_froms:
+            kw["asfrom"] = True
+            text += " FROM " + ", ".join(t._compiler_dispatch(self, **kw) for t in extra_froms)
+        return text
+
+    def update_from_clause(self, update_stmt, from_table, extra_froms, from_hints, **kw):
+        # already rendered by update_tables_clause()
+        return None
+
+    def visit_delete(self, delete_stmt, **kw):
+        extra_froms = delete_stmt._compile_state_factory(delete_stmt, self, **kw)._extra_froms
+        if extra_froms:
+            # Ingres DELETE has no FROM/USING list, so the other tables move into
+            # a correlated EXISTS: DELETE FROM t WHERE EXISTS (SELECT 1 FROM t2 WHERE ...)
+            subquery = (
+                select(literal_column("1"))
+                .select_from(*extra_froms)
+                .where(and_(*delete_stmt._where_criteria))
+                .correlate(delete_stmt.table)
+            )
+            delete_stmt = delete_stmt._generate()
+            delete_stmt._where_criteria = (exists(subquery),)
+        return compiler.SQLCompiler.visit_delete(self, delete_stmt, **kw)
+
+    def visit_merge(self, merge, **kw):
+        text = "MERGE INTO %s\nUSING %s\nON %s" % (
+            self.preparer.format_table(merge.target),
+            self.process(merge.source, asfrom=True, **kw),
+            self.process(merge.on, **kw),
+        )
+        for condition, where, action, values in merge.when_clauses:
+            text += "\nWHEN %s" % condition
+            if where is not None:
+                text += " AND %s" % self.process(where, **kw)
+            if action == "UPDATE":
+                text += " THEN UPDATE SET %s" % ", ".join(
+                    "%s = %s" % (self.preparer.format_column(column), self.process(value, **kw))
+                    for column, value in values
+                )
+            elif action == "INSERT":
+                text += " THEN INSERT (%s) VALUES (%s)" % (
+                    ", ".join(self.preparer.format_column(column) for column, _ in values),
+                    ", ".join(self.process(value, **kw) for _, value in values),
+                )
+            else:
+                text += " THEN DELETE"
+        return text
+
     def visit_release_savepoint(self, savepoint_stmt):
         return ""
 
 
-class _Modify(DDLElement):
-    """Represents a MODIFY Statment"""
-
-    __visit_name__ = "modify"
+class IngresDDLCompiler(compiler.DDLCompiler):
 
-    def __init__(self, target, **kwargs):
-        self.target = target
-        self.kwargs = kwargs
+    def _with_options(self, kwargs):
+        """Storage options from ``ingres_`` table keyword arguments, for a WITH clause"""
+        options = []
+        if kwargs.get("ingres_structure"):
+            options.append("STRUCTURE=%s" % kwargs["ingres_structure"])
+            if kwargs.get("ingres_structure_keys"):
+                options.append(
+                    "KEY=(%s)"
+                    % ", ".join(self.preparer.quote(getattr(key, "name", key)) for key in kwargs["ingres_structure_keys"])
+                )
+                if kwargs.get("ingres_structure_key_unique"):
+                    options.append("UNIQUE")
+        if kwargs.get("ingres_partition"):
+            options.append("PARTITION=(%s)" % kwargs["ingres_partition"])
+        if kwargs.get("ingres_location"):
+            options.append("LOCATION=(%s)" % kwargs["ingres_location"])
+        if kwargs.get("ingres_nojournaling") is not None:
+            options.append("NOJOURNALING" if kwargs["ingres_nojournaling"] else "JOURNALING")
+        options.extend(kwargs.get("ingres_with") or ())
+        return options
+
+    def _table_suffix(self, element):
+        text = ""
+        options = self._with_options(element.kwargs)
+        if _is_session_table(element):
+            text += "\nON COMMIT %s" % element.kwargs.get("ingres_on_commit", "PRESERVE ROWS")
+            options.insert(0, "NORECOVERY")
+        if options:
+            text += "\nWITH %s" % ", ".join(options)
+        return text
 
+    def visit_create_table_as(self, create, **kw):
+        if _is_session_table(create):
+            text = "\nDECLARE GLOBAL TEMPORARY TABLE session.%s" % self.preparer.quote(create.name)
+        elif create.schema:
+            text = "\nCREATE TABLE %s.%s" % (self.preparer.quote_schema(create.schema), self.preparer.quote(create.name))
+        else:
+            text = "\nCREATE TABLE %s" % self.preparer.quote(create.name)
+        if create.columns:
+            text += " (%s)" % ", ".join(self.preparer.quote(name) for name in create.columns)
+        # the query keeps its bound parameters, which IngresExecutionContext._init_ddl()
+        # passes with the statement
+        select = create.selectable.compile(dialect=self.dialect, schema_translate_map=self.schema_translate_map)
+        self._ingres_select_state = select.construct_expanded_state()
+        self._ingres_inlists = select._take_inlists() if isinstance(select, IngresSQLCompiler) else None
+        text += " AS\n%s" % self._ingres_select_state.statement
+        return text + self._table_suffix(create)
+
+    def visit_create_table(self, create, **kw):
+        text = compiler.DDLCompiler.visit_create_table(self, create, **kw)
+        if _is_session_table(create.element):
+            # CREATE [prefixes] TABLE -> DECLARE GLOBAL TEMPORARY TABLE
+            text = re.sub(r"^\s*CREATE\s+(?:\w+\s+)*?TABLE\b", "\nDECLARE GLOBAL TEMPORARY TABLE", text, count=1)
+        return text
 
-class IngresDDLCompiler(compiler.DDLCompiler):
+    def create_table_constraints(self, table, **kw):
+        if _is_session_table(table):
+            # constraints are not allowed on temporary tables
+            return ""
+        return compiler.DDLCompiler.create_table_constraints(self, table, **kw)
 
     def visit_drop_constraint(self, drop):
         table = drop.element.table
@@ -245,23 +488,38 @@ class IngresDDLCompiler(compiler.DDLCompiler):
         else:
             return None
 
+    def _unique_constraint_columns(self, table):
+        # columns of the table's unique constraints, computed once per table
+        # rather than scanning every constraint for every column
+        cache = self.__dict__.setdefault("_ingres_unique_columns", {})
+        if table not in cache:
+            cache[table] = set(
+                column
+                for constraint in table.constraints
+                if isinstance(constraint, sqlalchemy.sql.schema.UniqueConstraint)
+                for column in constraint.columns
+            )
+        return cache[table]
+
     def get_column_specification(self, column, **kwargs):
 
-        if str(column.type) == "VARCHAR":
-            if column.type.length is None:  # If no length is provided for VARCHAR column
-                column.type.length = 255  # Set length to 255
+        type_ = column.type
+        if isinstance(type_, types.String) and type_.length is None and str(type_) == "VARCHAR":
+            # If no length is provided for VARCHAR column, use 255 without changing the user's type
+            type_ = type_.copy()
+            type_.length = 255
 
         if sqlalchemy_version_tuple >= (2, 0):
             colspec = (
                 self.preparer.format_column(column)
                 + " "
-                + self.dialect.type_compiler_instance.process(column.type, type_expression=column)
+                + self.dialect.type_compiler_instance.process(type_, type_expression=column)
             )
         else:  # SQLAlchemy v1.x path
             colspec = (
                 self.preparer.format_column(column)
                 + " "
-                + self.dialect.type_compiler.process(column.type, type_expression=column)
+                + self.dialect.type_compiler.process(type_, type_expression=column)
             )
 
         default = self.get_column_default_string(column)
@@ -293,20 +551,10 @@ class IngresDDLCompiler(compiler.DDLCompiler):
             or (column.unique is True and self.dialect.iidbcapabilities["DBMS_TYPE"] == "INGRES")
         ):
             colspec += " NOT NULL"
-        else:
-            for constraint in column.table.constraints:
-                if constraint.contains_column(column):  # Maybe redundant since checked again in for loop
-                    for constraint_column in constraint:
-                        if constraint_column == column:
-                            if (
-                                constraint_column.nullable is False
-                                or constraint_column.unique is True
-                                or constraint_column.primary_key is True
-                                or isinstance(constraint, sqlalchemy.sql.schema.UniqueConstraint)
-                            ):
-                                if self.dialect.iidbcapabilities["DBMS_TYPE"] == "INGRES":
-                                    colspec += " NOT NULL"
-                                    break
+        elif self.dialect.iidbcapabilities["DBMS_TYPE"] == "INGRES" and column in self._unique_constraint_columns(
+            column.table
+        ):
+            colspec += " NOT NULL"
         return colspec
 
     def visit_create_index(self, create):
@@ -326,39 +574,359 @@ class IngresDDLCompiler(compiler.DDLCompiler):
         return text
 
     def post_create_table(self, table):
-        if "ingres_structure" in table.kwargs:
-            _Modify(table, **(table.kwargs)).execute_at("after-create", table)
-        return ""
-
-    def visit_modify(self, modify):
-        text = "MODIFY %s TO " % modify.target
-        if "ingres_structure" in modify.kwargs:
-            text += "%s" % modify.kwargs["ingres_structure"]
-
-            if "ingres_structure_keys" in modify.kwargs:
-                if (
-                    "ingres_structure_key_unique" in modify.kwargs
-                    and modify.kwargs["ingres_structure_key_unique"]
-                ):
-                    text += " UNIQUE "
-                text += " ON "
-                text += ", ".join(["%s" % col for col in modify.kwargs["ingres_structure_keys"]])
-        return text
+        return self._table_suffix(table)
+
+
+def _raw_dbapi_connection(pooled_connection):
+    """The DBAPI connection behind a pool proxy, which is only valid for one checkout"""
+    return getattr(pooled_connection, "dbapi_connection", None) or pooled_connection.connection
+
+
+class _CursorCache(object):
+    """LRU cache of DBAPI cursors for one DBAPI connection, keyed by SQL text.
+
+    pyodbc only prepares a statement again when the SQL given to a cursor
+    differs from the previous one, so keeping one cursor per distinct
+    statement means hot queries are prepared once per connection.
+    """
+
+    def __init__(self, dbapi_connection, size):
+        self.dbapi_connection = dbapi_connection
+        self.size = size
+        self._idle = collections.OrderedDict()
+        # a connection is used by one thread at a time, but results may be
+        # closed (and their cursors released) from another, e.g. by GC
+        self._lock = threading.Lock()
+
+    def acquire(self, statement):
+        with self._lock:
+            cursor = self._idle.pop(statement, None)
+        if cursor is None:
+            cursor = self.dbapi_connection.cursor()
+        return cursor
+
+    def release(self, statement, cursor):
+        evicted = []
+        with self._lock:
+            if statement in self._idle or self.size <= 0:
+                # same statement already cached (e.g. nested use), keep only one
+                evicted.append(cursor)
+            else:
+                self._idle[statement] = cursor
+                while len(self._idle) > self.size:
+                    evicted.append(self._idle.popitem(last=False)[1])
+        for cursor in evicted:
+            cursor.close()
+
+    def clear(self):
+        with self._lock:
+            cursors = list(self._idle.values())
+            self._idle.clear()
+        for cursor in cursors:
+            try:
+                cursor.close()
+            except Exception:
+                # the connection may already be broken or closed
+                pass
+
+
+class _CachedCursor(object):
+    """DBAPI cursor proxy handing out cursors from a :class:`_CursorCache`.
+
+    The real cursor is picked when a statement is executed, as the final SQL
+    text is not known when SQLAlchemy creates the cursor.  Closing the proxy
+    returns the real cursor to the cache instead of closing it.
+    """
+
+    def __init__(self, cache):
+        object.__setattr__(self, "_cache", cache)
+        object.__setattr__(self, "_cursor", None)
+        object.__setattr__(self, "_statement", None)
+        object.__setattr__(self, "_pending", {})
+        object.__setattr__(self, "_inputsizes", None)
+
+    def _bind(self, statement):
+        if self._cursor is not None:
+            if statement == self._statement:
+                return self._cursor
+            self._release()
+        cursor = self._cache.acquire(statement)
+        for name, value in self._pending.items():
+            setattr(cursor, name, value)
+        object.__setattr__(self, "_cursor", cursor)
+        object.__setattr__(self, "_statement", statement)
+        return cursor
+
+    def _release(self):
+        cursor = self._cursor
+        if cursor is not None:
+            object.__setattr__(self, "_cursor", None)
+            self._cache.release(self._statement, cursor)
+
+    def _bind_sizes(self, statement):
+        cursor = self._bind(statement)
+        if self._inputsizes is not None:
+            cursor.setinputsizes(self._inputsizes)
+        return cursor
+
+    def setinputsizes(self, sizes):
+        # called before execute(), when the real cursor is not yet known
+        object.__setattr__(self, "_inputsizes", sizes)
+
+    def execute(self, statement, *args):
+        return self._bind_sizes(statement).execute(statement, *args)
+
+    def executemany(self, statement, *args):
+        return self._bind_sizes(statement).executemany(statement, *args)
+
+    def close(self):
+        self._release()
+
+    @property
+    def description(self):
+        return None if self._cursor is None else self._cursor.description
+
+    @property
+    def rowcount(self):
+        return -1 if self._cursor is None else self._cursor.rowcount
+
+    def __getattr__(self, name):
+        cursor = self._cursor
+        if cursor is None:
+            raise AttributeError(name)
+        return getattr(cursor, name)
+
+    def __setattr__(self, name, value):
+        # attributes such as pyodbc fast_executemany may be set before execute
+        self._pending[name] = value
+        if self._cursor is not None:
+            setattr(self._cursor, name, value)
 
 
 class IngresExecutionContext(default.DefaultExecutionContext):
     _select_lastrowid = False
     _lastrowid = None
+    _ingres_rowcounts = None
+    _ingres_cache_key = None
+    _ingres_cached = None
+    _ingres_inlists = None
 
     def __init__(self, *args, **kwargs):
         default.DefaultExecutionContext.__init__(self, *args, **kwargs)
 
+    @classmethod
+    def _init_compiled(cls, dialect, connection, dbapi_connection, execution_options, compiled, *args, **kwargs):
+        self = super(IngresExecutionContext, cls)._init_compiled(
+            dialect, connection, dbapi_connection, execution_options, compiled, *args, **kwargs
+        )
+        if compiled.post_compile_params and isinstance(compiled, IngresSQLCompiler):
+            # collected while expanding this execution's parameters
+            self._ingres_inlists = compiled._take_inlists()
+        return self
+
+    @classmethod
+    def _init_ddl(cls, dialect, connection, dbapi_connection, execution_options, compiled_ddl):
+        self = super(IngresExecutionContext, cls)._init_ddl(
+            dialect, connection, dbapi_connection, execution_options, compiled_ddl
+        )
+        state = getattr(compiled_ddl, "_ingres_select_state", None)
+        if state is not None:
+            # bound parameters of the query of CREATE TABLE ... AS SELECT
+            values = dict(
+                (key, state.processors[key](value) if key in state.processors else value)
+                for key, value in state.parameters.items()
+            )
+            if dialect.positional:
+                self.parameters = [dialect.execute_sequence_format([values[key] for key in state.positiontup])]
+            else:
+                self.parameters = [values]
+            self._ingres_inlists = compiled_ddl._ingres_inlists
+        return self
+
+    _ingres_profile = None
+
+    def create_cursor(self):
+        cursor = self._create_cursor()
+        profiler = self.execution_options.get("ingres_profiler")
+        if profiler is not None:
+            # statements compiled from now on are timed, see IngresSQLCompiler
+            self.dialect._ingres_profiling = True
+            statement = self.compiled.string if self.compiled is not None else getattr(self, "statement", "")
+            self._ingres_profile = profiler._start(statement)
+            if self.cache_hit is not default.CACHE_HIT:
+                # a statement from the compiled cache took no compilation
+                self._ingres_profile.add("compile", getattr(self.compiled, "_ingres_compile_time", 0.0))
+            cursor = _ProfilingCursor(cursor, self._ingres_profile)
+        return cursor
+
+    def _create_cursor(self):
+        timeout = self.execution_options.get("ingres_timeout")
+        if timeout is not None:
+            # the query timeout is fixed when a cursor is created, so such
+            # statements get their own cursor rather than a cached one
+            self._is_server_side = False
+            return self.dialect._create_timeout_cursor(self._dbapi_connection, timeout)
+
+        if not self.dialect.cursor_cache_size or not self.execution_options.get("ingres_cursor_cache", True):
+            return default.DefaultExecutionContext.create_cursor(self)
+
+        try:
+            info = self._dbapi_connection.info
+        except NotImplementedError:
+            # ad-hoc connection used during first connect has no info dict
+            return default.DefaultExecutionContext.create_cursor(self)
+
+        self._is_server_side = False
+        cache = info.get("ingres_cursor_cache")
+        if cache is None:
+            # the cache lives as long as the pooled connection, beyond this checkout
+            cache = info["ingres_cursor_cache"] = _CursorCache(
+                _raw_dbapi_connection(self._dbapi_connection), self.dialect.cursor_cache_size
+            )
+        return _CachedCursor(cache)
+
     def fire_sequence(self, seq, type_):
         return self._execute_scalar(
             "SELECT NEXT VALUE FOR %s" % self.dialect.identifier_preparer.format_sequence(seq), type_
         )
 
+    def _load_inlists(self, inlists):
+        """Load large IN-list values into the session tables referenced by the statement"""
+        try:
+            declared = self._dbapi_connection.info.setdefault("ingres_inlist_tables", {})
+        except NotImplementedError:
+            declared = {}
+        cursor = self._dbapi_connection.cursor()
+        try:
+            for table_name, type_, values in inlists:
+                table = schema.Table(table_name, schema.MetaData(), schema.Column("v", type_), prefixes=["TEMPORARY"])
+                ddl = str(schema.CreateTable(table).compile(dialect=self.dialect))
+
+                # the session table survives commits, so reuse it when it has the right type
+                previous = declared.pop(table_name, None)
+                reused = False
+                if previous is not None:
+                    try:
+                        if previous == ddl:
+                            cursor.execute("DELETE FROM session.%s" % table_name)
+                            reused = True
+                        else:
+                            cursor.execute("DROP TABLE session.%s" % table_name)
+                    except self.dialect.dbapi.Error:
+                        # declaration was rolled back along with its transaction
+                        pass
+                if not reused:
+                    cursor.execute(ddl)
+                declared[table_name] = ddl
+
+                processor = type_._cached_bind_processor(self.dialect)
+                if processor is not None:
+                    values = [processor(value) for value in values]
+                self.dialect._insert_inlist(cursor, "session.%s" % table_name, values, self)
+        finally:
+            cursor.close()
+
+    def _timed(self, phase, method):
+        if self._ingres_profile is None:
+            return method()
+        with self._ingres_profile.timing(phase):
+            return method()
+
     def pre_exec(self):
+        self._timed("pre_exec", self._pre_exec)
+
+    def post_exec(self):
+        self._timed("post_exec", self._post_exec)
+
+    def get_result_processor(self, type_, colname, coltype):
+        processor = default.DefaultExecutionContext.get_result_processor(self, type_, colname, coltype)
+        if processor is not None and self._ingres_profile is not None:
+            processor = _timed_processor(processor, self._ingres_profile)
+        return processor
+
+    def _statement_tables(self):
+        """Names of the tables used by the statement, or None if they are not known"""
+        if self.compiled is None or self.is_text or self.isddl:
+            return None
+        tables = set(getattr(self.compiled, "_ingres_tables", ()))
+        if self.isinsert or self.isupdate or self.isdelete:
+            tables.add(self.compiled.compile_state.dml_table.name.lower())
+        return tuple(sorted(tables)) if tables else None
+
+    def _lookup_result_cache(self, cache, inlists):
+        if self.executemany or self.isinsert or self.isupdate or self.isdelete or self.isddl:
+            return
+        try:
+            dirty = self._dbapi_connection.info.get("ingres_dirty_tables")
+        except NotImplementedError:
+            return
+        if dirty:
+            # results read by a transaction with uncommitted changes are its own,
+            # they are neither served from nor stored in the shared cache
+            return
+        parameters = self.parameters[0] if self.parameters else ()
+        if isinstance(parameters, dict):
+            parameters = tuple(sorted(parameters.items()))
+        # values of large IN lists are not parameters of the statement but
+        # rows of session tables, so they are part of the key too
+        key = (self.statement, tuple(parameters), tuple((name, tuple(values)) for name, _, values in inlists or ()))
+        try:
+            hash(key)
+        except TypeError:
+            # e.g. bytearray parameter values
+            return
+        self._ingres_cached = cache.get(key)
+        if self._ingres_cached is None:
+            self._ingres_cache_key = key
+            self._ingres_cache_tables = self._statement_tables()
+            self._ingres_cache_snapshot = cache.snapshot(self._ingres_cache_tables)
+
+    def _record_session_table(self):
+        """Note session tables declared or dropped on the connection, for has_table()"""
+        statement = self.compiled.statement
+        target = getattr(statement, "element", statement)
+        if not _is_session_table(target):
+            return
+        try:
+            declared = self._dbapi_connection.info.setdefault("ingres_session_tables", set())
+        except NotImplementedError:
+            return
+        if statement.__visit_name__ in ("create_table", "create_table_as"):
+            declared.add(target.name.lower())
+        elif statement.__visit_name__ == "drop_table":
+            declared.discard(target.name.lower())
+
+    def _record_changes(self):
+        """Note the tables the statement may change as dirty until the transaction ends.
+
+        Returns the table names, [None] meaning any table, or None when the
+        statement changes nothing.
+        """
+        if self.isinsert or self.isupdate or self.isdelete:
+            tables = list(self._statement_tables())
+        elif self.isddl or _MODIFYING.match(self.statement or ""):
+            tables = [None]
+        else:
+            return None
+        try:
+            self._dbapi_connection.info.setdefault("ingres_dirty_tables", set()).update(tables)
+        except NotImplementedError:
+            pass
+        return tables
+
+    def _pre_exec(self):
+        inlists = self._ingres_inlists
+
+        cache = self.dialect.result_cache
+        if cache is not None and self.execution_options.get("ingres_cache_ttl"):
+            self._lookup_result_cache(cache, inlists)
+
+        if inlists and self._ingres_cached is None:
+            self._load_inlists(inlists)
+
+        if self.executemany and getattr(self.compiled, "_insertmanyvalues", None) is not None:
+            self._ingres_rowcounts = []
+
         if self.isinsert:
             if TYPE_CHECKING:
                 if is_sql_compiler:
@@ -386,10 +954,41 @@ class IngresExecutionContext(default.DefaultExecutionContext):
                 )
             )
 
-    def post_exec(self):
+    def _post_exec(self):
         conn = self.root_connection
 
-        if self.isinsert or self.isupdate or self.isdelete:
+        if self._ingres_cached is not None:
+            entry = self._ingres_cached
+            self.cursor_fetch_strategy = _cursor.FullyBufferedCursorFetchStrategy(None, entry.description, entry.rows)
+            return
+
+        if self.isddl and self.compiled is not None:
+            self._record_session_table()
+        changed = self._record_changes()
+        cache = self.dialect.result_cache
+        if cache is not None:
+            if changed:
+                # invalidated again when the transaction ends, as results read
+                # meanwhile by this connection may include changes rolled back
+                cache.invalidate(None if None in changed else changed)
+            if self._ingres_cache_key is not None and self.cursor.description is not None:
+                description = self.cursor.description
+                rows = tuple(tuple(row) for row in self.cursor.fetchall())
+                cache.put(
+                    self._ingres_cache_key,
+                    self.execution_options["ingres_cache_ttl"],
+                    description,
+                    rows,
+                    self._ingres_cache_tables,
+                    self._ingres_cache_snapshot,
+                )
+                self.cursor_fetch_strategy = _cursor.FullyBufferedCursorFetchStrategy(self.cursor, description, rows)
+                return
+
+        if self._ingres_rowcounts:
+            rowcounts = self._ingres_rowcounts
+            self._rowcount = -1 if min(rowcounts) < 0 else sum(rowcounts)
+        elif self.isinsert or self.isupdate or self.isdelete:
             self._rowcount = self.cursor.rowcount
 
         if self._select_lastrowid:
@@ -405,18 +1004,34 @@ class IngresExecutionContext(default.DefaultExecutionContext):
                 self._lastrowid = int(row[0])
 
             self.cursor_fetch_strategy = _cursor._NO_CURSOR_DML
-        elif self.compiled is not None:
-            if (
-                sqlalchemy_version_tuple >= (2, 0)
-                and (is_sql_compiler(self.compiled) if is_sql_compiler else True)
-                and self.compiled.effective_returning
-                or ((self.isinsert or self.isupdate or self.isdelete) and self.compiled.returning)
-            ):
-                self.cursor_fetch_strategy = _cursor.FullyBufferedCursorFetchStrategy(
-                    self.cursor,
-                    self.cursor.description,
-                    self.cursor.fetchall(),
-                )
+        elif self.compiled is not None and (
+            sqlalchemy_version_tuple >= (2, 0)
+            and (is_sql_compiler(self.compiled) if is_sql_compiler else True)
+            and self.compiled.effective_returning
+            or ((self.isinsert or self.isupdate or self.isdelete) and self.compiled.returning)
+        ):
+            self._buffer_result()
+        elif self.cursor.description is not None and self.execution_options.get("ingres_buffer_rows") is not None:
+            self._buffer_result()
+        elif self.cursor.description is not None and self.execution_options.get("ingres_prefetch"):
+            self.cursor_fetch_strategy = _PrefetchCursorFetchStrategy(
+                self.cursor,
+                self.execution_options["ingres_prefetch"],
+                self.execution_options.get("ingres_prefetch_rows", 1000),
+                self.cursor.description,
+            )
+
+    def _buffer_result(self):
+        limit = self.execution_options.get("ingres_buffer_rows")
+        if limit is None:
+            self.cursor_fetch_strategy = _cursor.FullyBufferedCursorFetchStrategy(
+                self.cursor,
+                self.cursor.description,
+                self.cursor.fetchall(),
+            )
+        else:
+            # rows beyond the limit are spilled to a temporary file
+            self.cursor_fetch_strategy = _SpillingCursorFetchStrategy(self.cursor, limit, self.cursor.description)
 
     def get_lastrowid(self):
         return self._lastrowid
@@ -432,6 +1047,7 @@ class IngresDialect(default.DefaultDialect):
     type_compiler = IngresTypeCompiler
     statement_compiler = IngresSQLCompiler
     ddl_compiler = IngresDDLCompiler
+    preparer = IngresIdentifierPreparer
     execution_ctx_cls = IngresExecutionContext
     supports_identity_columns = True
     supports_sequences = True
@@ -447,16 +1063,202 @@ class IngresDialect(default.DefaultDialect):
     sequences_optional = False
     _isolation_lookup = isolation_lookup
     iidbcapabilities = None
+    result_cache = None
+    cursor_cache_size = 0
+    # set once the ingres_profiler execution option is used
+    _ingres_profiling = False
+    reflection_workers = 0
+    inlist_threshold = 0
+    batch_dml = False
+    reflect_table_options = False
+    # the driver can time out a statement, for the ingres_timeout execution option
+    supports_statement_timeout = False
+    # batch_dml: rows per multi-row INSERT (engine parameter insertmanyvalues_page_size)
+    # and bind parameters per statement, well within what server and drivers accept
+    insertmanyvalues_page_size = 100
+    insertmanyvalues_max_parameters = 1000
     # TODO get_isolation_level()
     # TODO _check_max_identifier_length()
 
-    def __init__(self, **kwargs):
+    def __init__(
+        self,
+        cursor_cache_size=0,
+        reflection_workers=0,
+        inlist_threshold=0,
+        batch_dml=False,
+        result_cache_size=0,
+        reflect_table_options=False,
+        **kwargs
+    ):
         default.DefaultDialect.__init__(self, **kwargs)
+        if result_cache_size:
+            # results of statements executed with the ingres_cache_ttl execution option
+            self.result_cache = _ResultCache(result_cache_size)
+        self.cursor_cache_size = cursor_cache_size
+        self.reflection_workers = reflection_workers
+        self.inlist_threshold = inlist_threshold
+        self.batch_dml = batch_dml
+        self.reflect_table_options = reflect_table_options
+        if batch_dml:
+            # executemany INSERTs are sent as multi-row INSERT ... VALUES (...), (...)
+            # statements of up to insertmanyvalues_page_size rows and
+            # insertmanyvalues_max_parameters parameters each (SQLAlchemy 2.x)
+            self.supports_multivalues_insert = True
+            self.use_insertmanyvalues = True
+            self.use_insertmanyvalues_wo_returning = True
 
     def initialize(self, connection):
         super().initialize(connection)
         self._load_iidbcapabilities(connection)
 
+    def _error_codes(self, e):
+        """(SQLSTATE, Ingres generic error number) of a DBAPI exception, where present"""
+        if isinstance(e, exc.DBAPIError):
+            e = e.orig
+        args = getattr(e, "args", ())
+        sqlstate = args[0] if args and isinstance(args[0], str) and len(args[0]) == 5 else None
+        # pyodbc messages end in "... (4700) (SQLExecDirectW)"; a number elsewhere
+        # in the message text is not the native error
+        match = re.search(r"\((-?\d+)\)\s*(?:\(SQL\w+\))?\s*$", str(args[-1])) if args else None
+        return sqlstate, abs(int(match.group(1))) if match else None
+
+    def is_deadlock(self, e):
+        """True if ``e`` reports a deadlock, after which the server has rolled back the transaction"""
+        sqlstate, code = self._error_codes(e)
+        return sqlstate == "40001" or code == 4700
+
+    def is_lock_timeout(self, e):
+        """True if ``e`` reports that a lock wait timed out (SET LOCKMODE ... TIMEOUT)"""
+        sqlstate, code = self._error_codes(e)
+        return code == 4702
+
+    def is_retryable(self, e):
+        """True for errors after which re-running the whole transaction may succeed"""
+        return self.is_deadlock(e) or self.is_lock_timeout(e)
+
+    @classmethod
+    def engine_created(cls, engine):
+        if not engine.dialect.cursor_cache_size:
+            return
+
+        # cached cursors go with the DBAPI connection they belong to
+        @event.listens_for(engine, "close")
+        def _close_cursors(dbapi_connection, connection_record):
+            cache = connection_record.info.pop("ingres_cursor_cache", None)
+            if cache is not None:
+                cache.clear()
+
+        @event.listens_for(engine, "invalidate")
+        def _close_cursors_invalidated(dbapi_connection, connection_record, exception):
+            _close_cursors(dbapi_connection, connection_record)
+
+        @event.listens_for(engine, "soft_invalidate")
+        def _close_cursors_soft_invalidated(dbapi_connection, connection_record, exception):
+            _close_cursors(dbapi_connection, connection_record)
+
+    def _check_execution_options(self, opts):
+        if opts.get("ingres_profiler") is not None:
+            self._ingres_profiling = True
+        if opts.get("ingres_timeout") is not None and not self.supports_statement_timeout:
+            raise exc.ArgumentError("The ingres_timeout execution option is not supported by the %s driver" % self.driver)
+
+    def set_engine_execution_options(self, engine, opts):
+        self._check_execution_options(opts)
+        default.DefaultDialect.set_engine_execution_options(self, engine, opts)
+
+    def set_connection_execution_options(self, connection, opts):
+        self._check_execution_options(opts)
+        default.DefaultDialect.set_connection_execution_options(self, connection, opts)
+
+    def _create_timeout_cursor(self, dbapi_connection, timeout):
+        """Return a cursor whose statements time out after ``timeout`` seconds"""
+        # reached with the option given to a statement rather than a connection
+        self._check_execution_options({"ingres_timeout": timeout})
+
+    def _track_cursor(self, cursor, context):
+        # remember the cursor executing on the connection, for cancel()
+        if context is not None:
+            try:
+                context._dbapi_connection.info["ingres_active_cursor"] = cursor
+            except NotImplementedError:
+                pass
+
+    def _untrack_cursor(self, cursor, context):
+        # once executed, the statement is only running while it has rows to fetch;
+        # the cursor is forgotten when the transaction ends
+        if context is not None and cursor.description is None:
+            try:
+                info = context._dbapi_connection.info
+            except NotImplementedError:
+                return
+            if info.get("ingres_active_cursor") is cursor:
+                del info["ingres_active_cursor"]
+
+    def do_execute(self, cursor, statement, parameters, context=None):
+        if context is not None and context._ingres_cached is not None:
+            # result comes from the result cache
+            return
+        self._track_cursor(cursor, context)
+        try:
+            cursor.execute(statement, parameters)
+        finally:
+            self._untrack_cursor(cursor, context)
+        if context is not None and context._ingres_rowcounts is not None:
+            # one page of a multi-row INSERT; the rowcount is reported per page
+            context._ingres_rowcounts.append(cursor.rowcount)
+
+    def do_execute_no_params(self, cursor, statement, context=None):
+        if context is not None and context._ingres_cached is not None:
+            return
+        self._track_cursor(cursor, context)
+        try:
+            cursor.execute(statement)
+        finally:
+            self._untrack_cursor(cursor, context)
+
+    def do_executemany(self, cursor, statement, parameters, context=None):
+        self._track_cursor(cursor, context)
+        try:
+            cursor.executemany(statement, parameters)
+        finally:
+            self._untrack_cursor(cursor, context)
+
+    def _insert_inlist(self, cursor, table_name, values, context):
+        """Insert the values of a large IN list into its session table.
+
+        Sent as multi-row INSERTs of up to ``insertmanyvalues_max_parameters``
+        values, a round trip per statement; dialects whose driver binds
+        parameter arrays send them in one.
+        """
+        page = max(self.insertmanyvalues_max_parameters, 1)
+        for start in range(0, len(values), page):
+            rows = values[start : start + page]
+            self.do_execute(
+                cursor,
+                "INSERT INTO %s (v) VALUES %s" % (table_name, ", ".join(["(?)"] * len(rows))),
+                tuple(rows),
+                context,
+            )
+
+    def _end_transaction(self, dbapi_connection):
+        # the transaction's changes are now visible to other connections, or gone;
+        # drop cached results of the tables changed in it
+        try:
+            dbapi_connection.info.pop("ingres_active_cursor", None)
+            dirty = dbapi_connection.info.pop("ingres_dirty_tables", None)
+        except (AttributeError, NotImplementedError):
+            return
+        if dirty and self.result_cache is not None:
+            self.result_cache.invalidate(None if None in dirty else dirty)
+
+    def do_commit(self, dbapi_connection):
+        default.DefaultDialect.do_commit(self, dbapi_connection)
+        self._end_transaction(dbapi_connection)
+
+    def do_rollback(self, dbapi_connection):
+        default.DefaultDialect.do_rollback(self, dbapi_connection)
+        self._end_transaction(dbapi_connection)
+
     def _load_iidbcapabilities(self, connection):
         sqltext = """
             SELECT
@@ -468,15 +1270,124 @@ class IngresDialect(default.DefaultDialect):
         rs = None
         try:
             rs = connection.exec_driver_sql(sqltext)
-            self.iidbcapabilities = {}
-            for row in rs.fetchall():
-                self.iidbcapabilities[row[0].rstrip()] = row[1].rstrip()
+            # build the dict before publishing it, other threads may be compiling with this dialect
+            iidbcapabilities = {}
+            for row in rs:
+                iidbcapabilities[row[0].rstrip()] = row[1].rstrip()
+            self.iidbcapabilities = iidbcapabilities
 
             rs.close()
         finally:
             if rs:
                 rs.close()
 
+    def _parallel_multi_reflect(self, single_tbl_method, connection, workers, **kw):
+        """Run a per-table reflection method for many tables on a thread pool.
+
+        Tables are split between ``workers`` threads, each using its own pooled
+        connection and reflection cache.  Results are returned, and worker
+        caches merged into the Inspector cache, in table order so the outcome
+        does not depend on thread scheduling.
+
+        Worker connections do not see changes the caller's transaction has
+        not committed, nor its session tables, so reflection stays serial on
+        the caller's connection once that transaction has changed anything or
+        session tables were declared, and tables the workers could not find
+        are reflected again on the caller's connection.
+        """
+        info_cache = kw.pop("info_cache", None)
+        unreflectable = kw.get("unreflectable", {})
+        if connection.info.get("ingres_dirty_tables") or connection.info.get("ingres_session_tables"):
+            return list(self._default_multi_reflect(single_tbl_method, connection, info_cache=info_cache, **kw))
+
+        # resolve the table names exactly as the default implementation does
+        keys = [
+            key
+            for key, _ in self._default_multi_reflect(
+                lambda connection, table, **kw: None, connection, info_cache=info_cache, **kw
+            )
+        ]
+        workers = min(workers, len(keys))
+        if workers <= 1:
+            return list(self._default_multi_reflect(single_tbl_method, connection, info_cache=info_cache, **kw))
+
+        kw.pop("unreflectable", None)
+        for name in ("kind", "scope", "filter_names"):
+            kw.pop(name, None)
+        schema = kw.pop("schema", None)
+        engine = connection.engine
+        # such as schema_translate_map, which the workers must apply the same way
+        options = connection.get_execution_options()
+
+        def reflect(share):
+            worker_cache = {}
+            results = {}
+            with engine.connect() as worker_connection:
+                worker_connection = worker_connection.execution_options(**options)
+                for key in share:
+                    try:
+                        results[key] = single_tbl_method(
+                            worker_connection, key[1], schema=schema, info_cache=worker_cache, **kw
+                        )
+                    except exc.UnreflectableTableError as err:
+                        results[key] = err
+                    except exc.NoSuchTableError:
+                        pass
+            return results, worker_cache
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(reflect, [keys[i::workers] for i in range(workers)]))
+
+        results = {}
+        for worker_results, worker_cache in outcomes:
+            results.update(worker_results)
+            if info_cache is not None:
+                info_cache.update(worker_cache)
+
+        missing = [key for key in keys if key not in results]
+        if missing:
+            # not visible to the worker connections, e.g. created in the caller's transaction
+            for key in missing:
+                try:
+                    results[key] = single_tbl_method(connection, key[1], schema=schema, info_cache=info_cache, **kw)
+                except exc.UnreflectableTableError as err:
+                    results[key] = err
+                except exc.NoSuchTableError:
+                    pass
+
+        reflected = []
+        for key in keys:
+            if key not in results:
+                continue
+            value = results[key]
+            if isinstance(value, exc.UnreflectableTableError):
+                unreflectable.setdefault(key, value)
+            else:
+                reflected.append((key, value))
+        return reflected
+
+    def _multi_reflect(self, single_tbl_method, connection, **kw):
+        workers = connection.get_execution_options().get("ingres_reflection_workers", self.reflection_workers)
+        if workers and workers > 1:
+            return self._parallel_multi_reflect(single_tbl_method, connection, workers, **kw)
+        return self._default_multi_reflect(single_tbl_method, connection, **kw)
+
+    # SQLAlchemy 2.0+ reflects all tables of MetaData.reflect() through these
+    def get_multi_columns(self, connection, **kw):
+        return self._multi_reflect(self.get_columns, connection, **kw)
+
+    def get_multi_pk_constraint(self, connection, **kw):
+        return self._multi_reflect(self.get_pk_constraint, connection, **kw)
+
+    def get_multi_foreign_keys(self, connection, **kw):
+        return self._multi_reflect(self.get_foreign_keys, connection, **kw)
+
+    def get_multi_indexes(self, connection, **kw):
+        return self._multi_reflect(self.get_indexes, connection, **kw)
+
+    def get_multi_unique_constraints(self, connection, **kw):
+        return self._multi_reflect(self.get_unique_constraints, connection, **kw)
+
     def get_isolation_level_values(self, connection):
         return list(self._isolation_lookup)
 
@@ -509,8 +1420,42 @@ class IngresDialect(default.DefaultDialect):
             if rs:
                 rs.close()
 
+    def _get_session_table_columns(self, connection, table_name):
+        sqltext = "SELECT * FROM session.%s WHERE 1 = 0" % self.identifier_preparer.quote(table_name)
+
+        rs = None
+        columns = []
+        try:
+            rs = connection.exec_driver_sql(sqltext)
+            for name, type_code, _, internal_size, precision, scale, null_ok in rs.cursor.description:
+                coltype = session_column_types.get(getattr(type_code, "__name__", None), types.NullType)
+                if coltype is types.VARCHAR and internal_size:
+                    coltype = coltype(internal_size)
+                elif coltype is types.DECIMAL:
+                    coltype = coltype(precision, scale)
+                elif coltype is types.Integer and precision and precision > 10:
+                    coltype = types.BigInteger
+                columns.append(
+                    {
+                        "name": name.rstrip(),
+                        "type": coltype,
+                        "nullable": bool(null_ok),
+                        "default": None,
+                        "autoincrement": False,
+                        "comment": None,
+                    }
+                )
+            return columns
+        finally:
+            if rs:
+                rs.close()
+
     @reflection.cache
     def get_columns(self, connection, table_name, schema=None, **kw):
+        if self._is_session_table_name(connection, table_name, schema):
+            # session tables are not in iicolumns, describe them from a query instead
+            return self._get_session_table_columns(connection, table_name)
+
         sqltext = """
             SELECT
                 column_name,
@@ -541,7 +1486,7 @@ class IngresDialect(default.DefaultDialect):
         try:
             rs = connection.exec_driver_sql(sqltext, params)
 
-            for row in rs.fetchall():
+            for row in rs:
                 coldata = {}
                 coldata["name"] = row[0].rstrip()
                 coltype = row[1].rstrip()
@@ -593,6 +1538,9 @@ class IngresDialect(default.DefaultDialect):
 
     @reflection.cache
     def get_unique_constraints(self, connection, table_name, schema=None, **kw):
+        if self._is_session_table_name(connection, table_name, schema):
+            # session tables have no entries in the constraint and index catalogs
+            return []
         sqltext = """
             SELECT
                 k.constraint_name,
@@ -617,7 +1565,7 @@ class IngresDialect(default.DefaultDialect):
             rs = connection.exec_driver_sql(sqltext, params)
 
             constraints = []
-            for row in rs.fetchall():
+            for row in rs:
                 constraint_name = row[0].rstrip()
                 column_name = row[1].rstrip()
 
@@ -642,6 +1590,8 @@ class IngresDialect(default.DefaultDialect):
 
     @reflection.cache
     def get_primary_keys(self, connection, table_name, schema=None, **kw):
+        if self._is_session_table_name(connection, table_name, schema):
+            return {"constrained_columns": [], "name": None}
         sqltext = """
             SELECT
                 k.column_name
@@ -664,7 +1614,7 @@ class IngresDialect(default.DefaultDialect):
         try:
             rs = connection.exec_driver_sql(sqltext, params)
 
-            cols = [row[0].rstrip() for row in rs.fetchall()]
+            cols = [row[0].rstrip() for row in rs]
             return {"constrained_columns": [] if cols is None else cols, "name": None}
 
         finally:
@@ -677,6 +1627,8 @@ class IngresDialect(default.DefaultDialect):
 
     @reflection.cache
     def get_foreign_keys(self, connection, table_name, schema=None, **kw):
+        if self._is_session_table_name(connection, table_name, schema):
+            return []
         sqltext = """
             SELECT
                 f.constraint_name AS name,
@@ -712,7 +1664,7 @@ class IngresDialect(default.DefaultDialect):
         try:
             rs = connection.exec_driver_sql(sqltext, params)
 
-            for row in rs.fetchall():
+            for row in rs:
                 name = row[0].rstrip()
                 if name in foreign_keys:
                     constraint = foreign_keys[name]
@@ -775,10 +1727,195 @@ class IngresDialect(default.DefaultDialect):
                 # sqlalchemy assumes anything after query text is a list/tuple of values
                 rs = connection.exec_driver_sql(sqltext)
 
-            return [row[0].rstrip() for row in rs.fetchall()]
+            return [row[0].rstrip() for row in rs]
+        finally:
+            if rs:
+                rs.close()
+
+    def _owner_filter(self, schema, table_name):
+        """WHERE conditions and parameters restricting a catalog query to ``schema`` and ``table_name``"""
+        conditions = []
+        params = ()
+        if schema:
+            conditions.append("table_owner = ?")
+            params += (self.denormalize_name(schema),)
+        if table_name:
+            conditions.append("table_name = ?")
+            params += (self.denormalize_name(table_name),)
+        return conditions, params
+
+    def _query_table_stats(self, connection, schema=None, table_name=None):
+        """Statistics from iitables and iistats for one table, or every table of ``schema``"""
+        conditions, params = self._owner_filter(schema, table_name)
+
+        sqltext = """
+            SELECT
+                table_name,
+                num_rows,
+                number_pages,
+                overflow_pages,
+                storage_structure,
+                table_pagesize,
+                phys_partitions,
+                is_journalled,
+                is_compressed
+            FROM
+                iitables
+            WHERE
+                %s""" % "\n                AND ".join(["table_type = 'T'"] + conditions)
+
+        stats = {}
+        rs = None
+        try:
+            rs = connection.exec_driver_sql(sqltext, params)
+            for row in rs:
+                stats[row[0].rstrip()] = {
+                    # num_rows is kept by the server and optimizedb, no table scan
+                    "row_count": row[1] if row[1] is not None and row[1] >= 0 else None,
+                    "pages": row[2],
+                    "overflow_pages": row[3],
+                    "structure": row[4].rstrip() if row[4] else None,
+                    "page_size": row[5],
+                    "partitions": row[6],
+                    "journaled": (row[7] or "").rstrip() != "N",
+                    "compressed": (row[8] or "").rstrip() == "Y",
+                    "columns": {},
+                }
+        finally:
+            if rs:
+                rs.close()
+
+        sqltext = """
+            SELECT
+                table_name,
+                column_name,
+                num_unique,
+                rept_factor,
+                pct_nulls,
+                has_unique,
+                num_cells
+            FROM
+                iistats"""
+        if conditions:
+            sqltext += """
+            WHERE
+                %s""" % "\n                AND ".join(conditions)
+
+        rs = None
+        try:
+            rs = connection.exec_driver_sql(sqltext, params)
+            for row in rs:
+                table = stats.get(row[0].rstrip())
+                if table is not None:
+                    table["columns"][row[1].rstrip()] = {
+                        "distinct": row[2],
+                        "repetition_factor": row[3],
+                        "null_fraction": row[4],
+                        "unique": (row[5] or "").rstrip() == "Y",
+                        "histogram_cells": row[6],
+                    }
+        finally:
+            if rs:
+                rs.close()
+        return stats
+
+    def _query_storage_keys(self, connection, schema=None, table_name=None):
+        """Key columns of the storage structure of each table, from iicolumns.key_sequence"""
+        conditions, params = self._owner_filter(schema, table_name)
+        sqltext = """
+            SELECT
+                table_name,
+                column_name
+            FROM
+                iicolumns
+            WHERE
+                %s
+            ORDER BY
+                table_name,
+                key_sequence""" % "\n                AND ".join(["key_sequence > 0"] + conditions)
+
+        keys = collections.defaultdict(list)
+        rs = None
+        try:
+            rs = connection.exec_driver_sql(sqltext, params)
+            for row in rs:
+                keys[row[0].rstrip()].append(row[1].rstrip())
         finally:
             if rs:
                 rs.close()
+        return keys
+
+    @reflection.cache
+    def _get_schema_table_stats(self, connection, schema=None, **kw):
+        return self._query_table_stats(connection, schema)
+
+    @reflection.cache
+    def _get_schema_storage_keys(self, connection, schema=None, **kw):
+        return self._query_storage_keys(connection, schema)
+
+    def get_table_stats(self, connection, table_name, schema=None, **kw):
+        """Row estimate, page counts, storage structure and column statistics of a table.
+
+        Returns a dict with ``row_count``, ``pages``, ``overflow_pages``,
+        ``structure``, ``page_size``, ``partitions``, ``journaled``,
+        ``compressed`` and ``columns``, which maps each column with optimizedb
+        statistics to ``distinct``, ``repetition_factor``, ``null_fraction``,
+        ``unique`` and ``histogram_cells``.  No table data is read.
+        """
+        stats = self._query_table_stats(connection, schema, table_name)
+        try:
+            return stats[self.denormalize_name(table_name)]
+        except KeyError:
+            raise exc.NoSuchTableError(table_name)
+
+    def get_multi_table_stats(self, connection, schema=None, filter_names=None, **kw):
+        """:meth:`get_table_stats` for the tables of ``schema``, keyed by ``(schema, table_name)``.
+
+        Reads iitables and iistats with one query each for the whole schema.
+        """
+        stats = self._get_schema_table_stats(connection, schema, info_cache=kw.get("info_cache"))
+        return dict(
+            ((schema, name), table_stats)
+            for name, table_stats in stats.items()
+            if filter_names is None or name in filter_names
+        )
+
+    def _table_options(self, stats, keys):
+        # reflected as the keyword arguments IngresDDLCompiler renders in CREATE TABLE ... WITH
+        options = {"ingres_nojournaling": not stats["journaled"]}
+        if stats["structure"]:
+            options["ingres_structure"] = stats["structure"]
+            if keys:
+                options["ingres_structure_keys"] = keys
+        return options
+
+    def _reflects_table_options(self, connection):
+        # off by default: reflected tables would otherwise be created again
+        # with the source's storage structure and journaling
+        return connection.get_execution_options().get("ingres_reflect_table_options", self.reflect_table_options)
+
+    def get_table_options(self, connection, table_name, schema=None, **kw):
+        if not self._reflects_table_options(connection) or self._is_session_table_name(connection, table_name, schema):
+            return {}
+        stats = self.get_table_stats(connection, table_name, schema=schema)
+        keys = self._query_storage_keys(connection, schema, table_name)
+        return self._table_options(stats, keys.get(self.denormalize_name(table_name)))
+
+    if sqlalchemy_version_tuple >= (2, 0):
+
+        def get_multi_table_options(self, connection, schema=None, filter_names=None, **kw):
+            if (
+                (schema and schema.lower() == "session")
+                or (filter_names is not None and len(filter_names) == 1)
+                or not self._reflects_table_options(connection)
+            ):
+                return default.DefaultDialect.get_multi_table_options(
+                    self, connection, schema=schema, filter_names=filter_names, **kw
+                )
+            # reflecting several tables: three catalog queries for the schema rather than three per table
+            keys = self._get_schema_storage_keys(connection, schema, info_cache=kw.get("info_cache"))
+            stats = self.get_multi_table_stats(connection, schema, filter_names=filter_names, **kw)
+            return [(key, self._table_options(table_stats, keys.get(key[1]))) for key, table_stats in stats.items()]
 
     @reflection.cache
     def get_schema_names(self, connection, **kw):
@@ -793,7 +1930,7 @@ class IngresDialect(default.DefaultDialect):
         try:
             rs = connection.exec_driver_sql(sqltext)
 
-            return [row[0].rstrip() for row in rs.fetchall()]
+            return [row[0].rstrip() for row in rs]
         finally:
             if rs:
                 rs.close()
@@ -828,7 +1965,7 @@ class IngresDialect(default.DefaultDialect):
             else:
                 rs = connection.exec_driver_sql(sqltext)
 
-            return [row[0].rstrip() for row in rs.fetchall()]
+            return [row[0].rstrip() for row in rs]
         finally:
             if rs:
                 rs.close()
@@ -861,13 +1998,15 @@ class IngresDialect(default.DefaultDialect):
         try:
             rs = connection.exec_driver_sql(sqltext, params)
 
-            return "".join([row[0] for row in rs.fetchall()])
+            return "".join([row[0] for row in rs])
         finally:
             if rs:
                 rs.close()
 
     @reflection.cache
     def get_indexes(self, connection, table_name, schema=None, **kw):
+        if self._is_session_table_name(connection, table_name, schema):
+            return []
         sqltext = """
             SELECT
                 i.index_name,
@@ -904,7 +2043,7 @@ class IngresDialect(default.DefaultDialect):
         try:
             rs = connection.exec_driver_sql(sqltext, params)
 
-            for row in rs.fetchall():
+            for row in rs:
                 name = row[0].rstrip()
                 if name in indexes:
                     index = indexes[name]
@@ -935,7 +2074,44 @@ class IngresDialect(default.DefaultDialect):
         else:
             return name
 
+    def _has_session_table(self, connection, table_name):
+        # session tables are not in iitables, probe for one instead
+        sqltext = "SELECT 1 FROM session.%s WHERE 1 = 0" % self.identifier_preparer.quote(table_name)
+        try:
+            connection.exec_driver_sql(sqltext).close()
+            return True
+        except exc.DBAPIError:
+            return False
+
+    def _is_session_table_name(self, connection, table_name, schema):
+        """True if reflection of ``table_name`` in ``schema`` is of a session table.
+
+        Tables with a TEMPORARY prefix or ingres_temporary=True have no schema
+        of their own, so MetaData.create_all() / drop_all() and Table reflection
+        ask without one; a name declared as a session table on this connection
+        refers to the session table as long as it exists.
+        """
+        if schema:
+            return schema.lower() == "session"
+        declared = connection.info.get("ingres_session_tables")
+        if declared and table_name.lower() in declared:
+            if self._has_session_table(connection, table_name):
+                return True
+            # declared in a transaction since rolled back
+            declared.discard(table_name.lower())
+        return False
+
     def has_table(self, connection, table_name, schema=None, **kw):
+        if schema and schema.lower() == "session":
+            return self._has_session_table(connection, table_name)
+        if self._is_session_table_name(connection, table_name, schema):
+            return True
+
+        existing = connection.info.get("ingres_existing_tables")
+        if existing is not None and schema in existing:
+            # prefetched by sqlalchemy_ingres.ddl.create_all() / drop_all()
+            return table_name in existing[schema]
+
         sqltext = """
             SELECT
                 table_name
@@ -954,7 +2130,34 @@ class IngresDialect(default.DefaultDialect):
         rs = None
         try:
             rs = connection.exec_driver_sql(sqltext, params)
-            return len(rs.fetchall()) > 0
+            return rs.first() is not None
+        finally:
+            if rs:
+                rs.close()
+
+    def _get_existing_tables(self, connection, schema=None):
+        """Names of all tables has_table() would find in ``schema``, in one query"""
+        sqltext = """
+            SELECT
+                table_name
+            FROM
+                iitables
+            WHERE
+                table_type = 'T'"""
+        params = None
+
+        if schema:
+            sqltext += """
+                AND table_owner = ?"""
+            params = (self.denormalize_name(schema),)
+
+        rs = None
+        try:
+            if params:
+                rs = connection.exec_driver_sql(sqltext, params)
+            else:
+                rs = connection.exec_driver_sql(sqltext)
+            return set(row[0].rstrip() for row in rs)
         finally:
             if rs:
                 rs.close()
@@ -978,7 +2181,7 @@ class IngresDialect(default.DefaultDialect):
 
         try:
             rs = connection.exec_driver_sql(sqltext, params)
-            return len(rs.fetchall()) > 0
+            return rs.first() is not None
         finally:
             if rs:
                 rs.close()
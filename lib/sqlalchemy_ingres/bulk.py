@@ -0,0 +1,95 @@
+# ingres/bulk.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+Streaming bulk insert.
+
+``connection.execute(table.insert(), rows)`` needs all of ``rows`` in memory.
+:func:`bulk_insert` reads rows from any iterable, such as a generator over a
+file, and sends them ``batch_size`` at a time with executemany, so memory use
+is bounded by one batch.
+
+    def read_rows(path):
+        with open(path, newline="") as f:
+            for record in csv.reader(f):
+                yield record
+
+    bulk_insert(
+        connection,
+        sales,
+        read_rows("sales.csv"),
+        batch_size=50000,
+        commit_every=10,
+        progress=lambda p: log.info("%d rows, %.0f rows/s", p.rows, p.rows_per_second),
+    )
+
+Create the engine with ``fast_executemany=True`` to have pyodbc send each
+batch as ODBC parameter arrays rather than row by row.
+"""
+
+import collections
+import itertools
+import time
+from collections.abc import Mapping
+
+from sqlalchemy.exc import ArgumentError
+
+BulkProgress = collections.namedtuple("BulkProgress", "rows batches elapsed rows_per_second")
+
+
+def bulk_insert(connection, table, rows, columns=None, batch_size=10000, commit_every=None, progress=None):
+    """Insert ``rows`` into ``table`` in batches of ``batch_size``; returns the number of rows inserted.
+
+    Rows may be mappings of column name to value, or sequences of values in
+    the order of ``columns`` (all columns of ``table`` by default).  With
+    ``commit_every`` the rows are inserted in transactions of that many
+    batches, begun and committed by bulk_insert() itself, so ``connection``
+    must not have a transaction in progress; a failing transaction is rolled
+    back, leaving the earlier ones committed.  Without it the rows are
+    inserted in the caller's transaction.  ``progress`` is called with a
+    :class:`BulkProgress` after each batch.
+    """
+    if commit_every and connection.in_transaction():
+        raise ArgumentError(
+            "bulk_insert() with commit_every commits its own transactions; "
+            "commit or roll back the connection's transaction first"
+        )
+    if columns is None:
+        columns = [column.key for column in table.c]
+    else:
+        columns = [getattr(column, "key", column) for column in columns]
+    stmt = table.insert()
+
+    start = time.time()
+    total = 0
+    batches = 0
+    transaction = None
+    iterator = iter(rows)
+    try:
+        while True:
+            batch = [
+                row if isinstance(row, Mapping) else dict(zip(columns, row)) for row in itertools.islice(iterator, batch_size)
+            ]
+            if not batch:
+                break
+            if commit_every and transaction is None:
+                transaction = connection.begin()
+            connection.execute(stmt, batch)
+            total += len(batch)
+            batches += 1
+            if commit_every and batches % commit_every == 0:
+                transaction.commit()
+                transaction = None
+            if progress is not None:
+                elapsed = time.time() - start
+                progress(BulkProgress(total, batches, elapsed, total / elapsed if elapsed else 0.0))
+
+        if transaction is not None:
+            transaction.commit()
+    except BaseException:
+        if transaction is not None and transaction.is_active:
+            transaction.rollback()
+        raise
+    return total
@@ -0,0 +1,75 @@
+# ingres/cancel.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+Cancellation of running statements.
+
+A statement blocks the thread executing it, so cancellation comes from
+another thread: :func:`cancel` asks the driver to cancel the statement most
+recently executed on a connection, and the blocked ``execute()`` (or fetch)
+then raises an error, returning the connection to the caller promptly.
+
+    timer = threading.Timer(30, cancel, [connection])
+    timer.start()
+    try:
+        rows = connection.execute(slow_query).fetchall()
+    finally:
+        timer.cancel()
+
+For asyncio services, :func:`run_cancellable` runs blocking work in an
+executor and cancels the statement when the awaiting task is cancelled,
+including by ``asyncio.wait_for()`` timeouts:
+
+    rows = await asyncio.wait_for(
+        run_cancellable(connection, lambda: connection.execute(slow_query).fetchall()), 5
+    )
+
+For a fixed limit per statement the ``ingres_timeout`` execution option sets
+the ODBC query timeout instead.
+"""
+
+import asyncio
+import functools
+
+
+def cancel(connection):
+    """Cancel the statement running on ``connection``, from any thread.
+
+    Returns True if the driver accepted the request; False if no statement
+    is executing or has rows left to fetch on the connection.
+    """
+    try:
+        # Connection.info and the pooled DBAPI connection's info are the same dict
+        cursor = connection.info.get("ingres_active_cursor")
+    except (AttributeError, NotImplementedError):
+        return False
+    if cursor is None:
+        return False
+    try:
+        cursor.cancel()
+    except Exception:
+        # cursor closed, or driver without SQLCancel support
+        return False
+    return True
+
+
+async def run_cancellable(connection, fn, *args, **kwargs):
+    """Run ``fn(*args, **kwargs)`` in the default executor; cancel its statement if the task is cancelled.
+
+    ``fn`` must use ``connection``.  On cancellation the statement is
+    cancelled and the worker is waited for, so the connection is no longer
+    in use when CancelledError propagates.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(None, functools.partial(fn, *args, **kwargs))
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        cancel(connection)
+        try:
+            await future
+        except BaseException:
+            pass
+        raise
@@ -0,0 +1,123 @@
+# ingres/ddl.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+CREATE TABLE ... AS SELECT construct.
+
+Creates and fills a table in a single server-side statement, so the data
+never passes through the client.  Storage options are given with the same
+``ingres_`` keyword arguments accepted by Table:
+
+    from sqlalchemy_ingres import create_table_as
+
+    stmt = create_table_as(
+        "sales_2024",
+        select(sales).where(sales.c.year == 2024),
+        ingres_structure="X100",
+        ingres_partition="HASH ON id 16 PARTITIONS",
+        ingres_nojournaling=True,
+    )
+    connection.execute(stmt)
+    # CREATE TABLE sales_2024 AS SELECT ... WITH STRUCTURE=X100, PARTITION=(HASH ON id 16 PARTITIONS), NOJOURNALING
+
+    connection.execute(stmt.table.insert().from_select(stmt.table.c, more_sales))
+
+create_all() and drop_all() run MetaData.create_all() / drop_all() in a
+single transaction, checking for existing tables with one catalog query per
+schema instead of one per table:
+
+    create_all(engine, metadata)
+
+The CREATE / DROP statements themselves are not batched; each table and
+index is still created or dropped by a statement of its own.
+"""
+
+import contextlib
+
+from sqlalchemy import column, table
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import DDLElement
+from sqlalchemy_ingres.base import _is_session_table
+
+
+class CreateTableAs(DDLElement):
+    """Represents a CREATE TABLE name [(columns)] AS SELECT ... statement"""
+
+    __visit_name__ = "create_table_as"
+
+    def __init__(self, name, selectable, schema=None, columns=None, **kwargs):
+        self.name = name
+        self.selectable = selectable
+        self.schema = schema
+        self.columns = columns
+        self.kwargs = kwargs
+
+    @property
+    def table(self):
+        """A lightweight ``table()`` construct for the table being created"""
+        names = self.columns or [c.name for c in self.selectable.selected_columns]
+        return table(
+            self.name,
+            *[column(name, c.type) for name, c in zip(names, self.selectable.selected_columns)],
+            schema="session" if _is_session_table(self) else self.schema
+        )
+
+
+def create_table_as(name, selectable, schema=None, columns=None, **kwargs):
+    """Construct a :class:`CreateTableAs` statement.
+
+    ``columns`` optionally renames the selected columns.  Keyword arguments
+    are ``ingres_structure``, ``ingres_structure_keys``,
+    ``ingres_structure_key_unique``, ``ingres_partition``,
+    ``ingres_location``, ``ingres_nojournaling`` and ``ingres_with`` (a list of
+    further WITH options); ``ingres_temporary=True`` or ``schema="session"``
+    declares a session table instead.
+    """
+    return CreateTableAs(name, selectable, schema=schema, columns=columns, **kwargs)
+
+
+@contextlib.contextmanager
+def _transaction(bind):
+    if isinstance(bind, Engine):
+        with bind.begin() as connection:
+            yield connection
+    elif bind.in_transaction():
+        yield bind
+    else:
+        with bind.begin():
+            yield bind
+
+
+@contextlib.contextmanager
+def _prefetched_tables(connection, tables):
+    # session tables are not in the catalogs, has_table() probes for them
+    schemas = set(connection.schema_for_object(t) for t in tables if not _is_session_table(t))
+    connection.info["ingres_existing_tables"] = dict(
+        (schema, connection.dialect._get_existing_tables(connection, schema)) for schema in schemas
+    )
+    try:
+        yield
+    finally:
+        del connection.info["ingres_existing_tables"]
+
+
+def create_all(bind, metadata, tables=None, checkfirst=True):
+    """Like ``metadata.create_all(bind)``, as one transaction with one existence query per schema"""
+    with _transaction(bind) as connection:
+        if not checkfirst:
+            metadata.create_all(connection, tables=tables, checkfirst=False)
+            return
+        with _prefetched_tables(connection, tables or metadata.tables.values()):
+            metadata.create_all(connection, tables=tables, checkfirst=True)
+
+
+def drop_all(bind, metadata, tables=None, checkfirst=True):
+    """Like ``metadata.drop_all(bind)``, as one transaction with one existence query per schema"""
+    with _transaction(bind) as connection:
+        if not checkfirst:
+            metadata.drop_all(connection, tables=tables, checkfirst=False)
+            return
+        with _prefetched_tables(connection, tables or metadata.tables.values()):
+            metadata.drop_all(connection, tables=tables, checkfirst=True)
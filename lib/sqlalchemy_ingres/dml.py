@@ -0,0 +1,125 @@
+# ingres/dml.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+MERGE statement construct for Actian X 11+ and Vector.
+
+MERGE performs an upsert as a single server-side statement instead of a
+SELECT of existing keys followed by separate INSERTs and UPDATEs.
+
+    from sqlalchemy_ingres import merge
+
+    stmt = (
+        merge(accounts)
+        .using(staging, accounts.c.id == staging.c.id)
+        .when_matched_then_update({accounts.c.balance: staging.c.balance})
+        .when_not_matched_then_insert({accounts.c.id: staging.c.id, accounts.c.balance: staging.c.balance})
+    )
+    connection.execute(stmt)
+
+    # executemany over parameter sets, keyed on the primary key
+    connection.execute(merge(accounts).from_parameters(), [{"id": 1, "balance": 10}, ...])
+"""
+
+from sqlalchemy import bindparam, cast, select, types
+from sqlalchemy.sql.base import Executable, Generative
+from sqlalchemy.sql.elements import ClauseElement, and_
+
+# longest VARCHAR and NVARCHAR values Ingres allows
+MAX_VARCHAR_LENGTH = 32000
+MAX_NVARCHAR_LENGTH = 16000
+
+
+def _as_expression(column, value):
+    if isinstance(value, ClauseElement):
+        return value
+    return bindparam(None, value, type_=column.type, unique=True)
+
+
+def _parameter_type(type_):
+    """Type a source parameter is cast to; CAST(? AS VARCHAR) would be VARCHAR(1)"""
+    if isinstance(type_, types.String) and not isinstance(type_, types.Text) and type_.length is None:
+        type_ = type_.copy()
+        if isinstance(type_, (types.Unicode, types.NCHAR, types.NVARCHAR)):
+            type_.length = MAX_NVARCHAR_LENGTH
+        else:
+            type_.length = MAX_VARCHAR_LENGTH
+    return type_
+
+
+class Merge(Generative, Executable, ClauseElement):
+    """Represents a MERGE INTO ... USING ... ON ... statement"""
+
+    __visit_name__ = "merge"
+    inherit_cache = False  # custom construct, not part of the statement cache
+    _execution_options = Executable._execution_options.union({"autocommit": True})  # SQLAlchemy 1.x
+
+    def __init__(self, target):
+        self.target = target
+        self.source = None
+        self.on = None
+        self.when_clauses = ()
+
+    def _column(self, key):
+        return self.target.c[key] if isinstance(key, str) else key
+
+    def _values(self, values):
+        return [(self._column(key), _as_expression(self._column(key), value)) for key, value in values.items()]
+
+    def _add_when(self, *clause):
+        new = self._generate()
+        new.when_clauses = self.when_clauses + (clause,)
+        return new
+
+    def using(self, source, on):
+        """Merge rows from ``source`` (table, alias or subquery) matched by ``on``"""
+        new = self._generate()
+        new.source = source
+        new.on = on
+        return new
+
+    def from_parameters(self, key_columns=None, name="src"):
+        """Merge one row per parameter set, for use with executemany.
+
+        The source is a one-row SELECT of bind parameters named after the
+        target columns.  Rows are matched on ``key_columns`` (the primary key
+        by default); matched rows have all other columns updated, unmatched
+        rows are inserted.
+        """
+        if key_columns is None:
+            key_columns = list(self.target.primary_key)
+        key_columns = [self._column(column) for column in key_columns]
+        key_names = set(column.name for column in key_columns)
+
+        source = select(
+            *[
+                cast(bindparam(column.name, type_=column.type), _parameter_type(column.type)).label(column.name)
+                for column in self.target.c
+            ]
+        ).subquery(name)
+        on = and_(*[column == source.c[column.name] for column in key_columns])
+
+        new = self.using(source, on)
+        updates = dict((column, source.c[column.name]) for column in self.target.c if column.name not in key_names)
+        if updates:
+            new = new.when_matched_then_update(updates)
+        return new.when_not_matched_then_insert(dict((column, source.c[column.name]) for column in self.target.c))
+
+    def when_matched_then_update(self, set_, where=None):
+        """WHEN MATCHED [AND where] THEN UPDATE SET col = value, ..."""
+        return self._add_when("MATCHED", where, "UPDATE", self._values(set_))
+
+    def when_matched_then_delete(self, where=None):
+        """WHEN MATCHED [AND where] THEN DELETE"""
+        return self._add_when("MATCHED", where, "DELETE", None)
+
+    def when_not_matched_then_insert(self, values, where=None):
+        """WHEN NOT MATCHED [AND where] THEN INSERT (cols) VALUES (values)"""
+        return self._add_when("NOT MATCHED", where, "INSERT", self._values(values))
+
+
+def merge(target):
+    """Construct a :class:`Merge` statement into ``target``"""
+    return Merge(target)
@@ -0,0 +1,292 @@
+# ingres/export.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+Export of query results to Parquet and CSV files.
+
+Rows are fetched ``batch_size`` at a time and written as they arrive, so
+memory use is bounded by one batch however large the table:
+
+    paths = to_parquet(connection, sales, "/lake/sales-{:05d}.parquet", max_file_size=512 * 1024 * 1024)
+    to_csv(connection, select(sales).where(sales.c.year == 2023), "/tmp/sales-2023.csv")
+
+The selectable may be a table, a SELECT, a ``text()`` query or a SQL string.
+Parquet column types follow the SQLAlchemy types of the selected columns,
+as reflected through ``ischema_names``; DECIMAL keeps its precision and
+scale (as decimal256 above 38 digits), ANSIDATE becomes DATE, INGRESDATE and
+TIMESTAMP become TIMESTAMP, INTERVAL DAY TO SECOND becomes an Arrow duration
+and INTERVAL YEAR TO MONTH, which Parquet cannot hold as an interval, a 32-bit
+count of months.  Columns of untyped queries are typed
+from the driver's cursor description.  ``column_types`` overrides the Arrow
+type of named columns.
+
+With ``max_file_size`` (bytes) a new file is started once the current one
+reaches that size; ``path`` may contain a ``{}`` format field for the file
+number, otherwise ``-00000``, ``-00001``, ... is added before the extension.
+Both functions return the paths written.
+
+to_parquet() requires pyarrow (``pip install sqlalchemy-ingres[parquet]``).
+"""
+
+import csv
+import datetime
+import decimal
+import os
+
+from sqlalchemy import text, types
+from sqlalchemy_ingres.base import _IngresIntervalYearToMonth
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+DEFAULT_BATCH_SIZE = 100000
+
+
+def _statement(selectable):
+    if isinstance(selectable, str):
+        return text(selectable)
+    if not hasattr(selectable, "selected_columns") and hasattr(selectable, "select"):
+        # Table or other FROM clause
+        return selectable.select()
+    return selectable
+
+
+class _Paths(object):
+    """Names of the files written, numbered when output rolls over by size"""
+
+    def __init__(self, path, numbered):
+        self.path = path
+        self.numbered = numbered
+        self.written = []
+
+    def next(self):
+        if "{" in self.path:
+            path = self.path.format(len(self.written))
+        elif self.numbered:
+            root, ext = os.path.splitext(self.path)
+            path = "%s-%05d%s" % (root, len(self.written), ext)
+        else:
+            path = self.path
+        self.written.append(path)
+        return path
+
+
+def _arrow_decimal(precision, scale):
+    # decimal128 holds at most 38 digits, Ingres DECIMAL up to 39
+    if precision > 38:
+        return pyarrow.decimal256(precision, scale)
+    return pyarrow.decimal128(precision, scale)
+
+
+def _months(value):
+    """Number of months of an INTERVAL YEAR TO MONTH value, which the driver gives as text such as "1-02"."""
+    if value is None or isinstance(value, int):
+        return value
+    text = str(value).strip()
+    sign = -1 if text.startswith("-") else 1
+    years, _, months = text.lstrip("+-").partition("-")
+    return sign * (int(years) * 12 + int(months or 0))
+
+
+def _arrow_type(type_, description):
+    """pyarrow type for a column of SQLAlchemy type ``type_`` and DBAPI cursor description entry"""
+    pa = pyarrow
+    precision, scale = description[4], description[5]
+    if isinstance(type_, _IngresIntervalYearToMonth):
+        # Parquet has no interval of months, so it is stored as a count of months
+        return pa.int32()
+    if isinstance(type_, types.Interval):
+        return pa.duration("us")
+    if isinstance(type_, types.Boolean):
+        return pa.bool_()
+    if isinstance(type_, types.BigInteger):
+        return pa.int64()
+    if isinstance(type_, types.SmallInteger):
+        return pa.int16()
+    if isinstance(type_, types.Integer):
+        return pa.int32()
+    if isinstance(type_, types.Float) or (isinstance(type_, types.Numeric) and not type_.asdecimal):
+        return pa.float64()
+    if isinstance(type_, types.Numeric):
+        # MONEY and DECIMAL without declared precision take it from the driver
+        precision = type_.precision or precision or 38
+        scale = type_.scale if type_.scale is not None else scale or 0
+        return _arrow_decimal(precision, scale)
+    if isinstance(type_, types.DateTime):
+        return pa.timestamp("us", tz="UTC" if type_.timezone else None)
+    if isinstance(type_, types.Date):
+        return pa.date32()
+    if isinstance(type_, types.Time):
+        return pa.time64("us")
+    if isinstance(type_, types._Binary):
+        return pa.binary()
+    if isinstance(type_, types.String):
+        return pa.string()
+
+    # untyped column, e.g. of a text() query: use the Python type reported by the driver
+    type_code = description[1]
+    if isinstance(type_code, type):
+        if issubclass(type_code, bool):
+            return pa.bool_()
+        if issubclass(type_code, int):
+            return pa.int64()
+        if issubclass(type_code, float):
+            return pa.float64()
+        if issubclass(type_code, decimal.Decimal):
+            return _arrow_decimal(precision or 38, scale or 0)
+        if issubclass(type_code, datetime.datetime):
+            return pa.timestamp("us")
+        if issubclass(type_code, datetime.date):
+            return pa.date32()
+        if issubclass(type_code, datetime.time):
+            return pa.time64("us")
+        if issubclass(type_code, datetime.timedelta):
+            return pa.duration("us")
+        if issubclass(type_code, (bytes, bytearray)):
+            return pa.binary()
+    return pa.string()
+
+
+def _column_types(statement, result):
+    # results served from a buffer or cache carry their own description
+    description = getattr(result.cursor_strategy, "alternate_cursor_description", None) or result.cursor.description
+    columns = getattr(statement, "selected_columns", None)
+    if columns is None or len(columns) != len(description):
+        column_types = [types.NULLTYPE] * len(description)
+    else:
+        column_types = [column.type for column in columns]
+    return description, column_types
+
+
+def to_parquet(
+    connection,
+    selectable,
+    path,
+    batch_size=DEFAULT_BATCH_SIZE,
+    row_group_size=None,
+    max_file_size=None,
+    column_types=None,
+    compression="snappy",
+):
+    """Write the rows of ``selectable`` to Parquet file(s) at ``path``; returns the paths written.
+
+    Each batch of ``batch_size`` rows is written as one or more row groups
+    of at most ``row_group_size`` rows.
+    """
+    if pyarrow is None:
+        raise ImportError("to_parquet() requires pyarrow: pip install sqlalchemy-ingres[parquet]")
+    pa = pyarrow
+
+    statement = _statement(selectable)
+    result = connection.execute(statement)
+    try:
+        description, sa_types = _column_types(statement, result)
+        names = list(result.keys())
+        overrides = column_types or {}
+        schema = pa.schema(
+            [
+                pa.field(name, overrides[name] if name in overrides else _arrow_type(type_, entry))
+                for name, type_, entry in zip(names, sa_types, description)
+            ]
+        )
+
+        converters = [
+            _months if isinstance(type_, _IngresIntervalYearToMonth) and name not in overrides else None
+            for name, type_ in zip(names, sa_types)
+        ]
+
+        paths = _Paths(path, max_file_size is not None)
+        sink = writer = None
+
+        def open_writer():
+            # the writer buffers pages, so the size written is what the sink has been given
+            sink = pa.OSFile(paths.next(), "wb")
+            try:
+                return sink, pa.parquet.ParquetWriter(sink, schema, compression=compression)
+            except BaseException:
+                sink.close()
+                raise
+
+        try:
+            for rows in result.partitions(batch_size):
+                if writer is None:
+                    sink, writer = open_writer()
+                arrays = [
+                    pa.array(
+                        [convert(row[i]) for row in rows] if convert is not None else [row[i] for row in rows],
+                        type=field.type,
+                    )
+                    for i, (field, convert) in enumerate(zip(schema, converters))
+                ]
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema), row_group_size=row_group_size)
+                if max_file_size is not None and sink.tell() >= max_file_size:
+                    writer.close()
+                    sink.close()
+                    sink = writer = None
+            if not paths.written:
+                # empty result: still write a file with the schema
+                sink, writer = open_writer()
+        finally:
+            if writer is not None:
+                writer.close()
+            if sink is not None:
+                sink.close()
+    finally:
+        result.close()
+    return paths.written
+
+
+def _csv_value(value):
+    if isinstance(value, (bytes, bytearray)):
+        return value.hex()
+    return value
+
+
+def to_csv(
+    connection,
+    selectable,
+    path,
+    batch_size=DEFAULT_BATCH_SIZE,
+    max_file_size=None,
+    header=True,
+    encoding="utf-8",
+    **fmtparams
+):
+    """Write the rows of ``selectable`` to CSV file(s) at ``path``; returns the paths written.
+
+    ``fmtparams`` are passed to ``csv.writer()``.  NULLs are written as empty
+    fields and binary values as hexadecimal; each file starts with a header
+    row of column names unless ``header`` is false.
+    """
+    statement = _statement(selectable)
+    result = connection.execute(statement)
+    try:
+        names = list(result.keys())
+        paths = _Paths(path, max_file_size is not None)
+        f = None
+        try:
+            for rows in result.partitions(batch_size):
+                if f is None:
+                    f = open(paths.next(), "w", newline="", encoding=encoding)
+                    writer = csv.writer(f, **fmtparams)
+                    if header:
+                        writer.writerow(names)
+                writer.writerows([_csv_value(value) for value in row] for row in rows)
+                if max_file_size is not None and f.tell() >= max_file_size:
+                    f.close()
+                    f = None
+            if not paths.written:
+                f = open(paths.next(), "w", newline="", encoding=encoding)
+                if header:
+                    csv.writer(f, **fmtparams).writerow(names)
+        finally:
+            if f is not None:
+                f.close()
+    finally:
+        result.close()
+    return paths.written
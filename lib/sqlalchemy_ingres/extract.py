@@ -0,0 +1,209 @@
+# ingres/extract.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+Partitioned parallel extraction of large tables.
+
+A single connection reads a table with one client thread and one server
+session.  These helpers split the scan into slices, either key ranges over an
+integer key column or hash buckets of any key column, and read the slices
+concurrently on separate pooled connections.
+
+    for batch in partitioned_extract(engine, big_table, workers=8):
+        process(batch)
+
+    extract_to_shards(engine, big_table, csv_shard_writer("big_table-%03d.csv"), workers=8)
+
+Memory use is bounded: each worker holds at most one batch of ``batch_size``
+rows, and at most ``queue_size`` finished batches wait for the consumer.
+The key column defaults to the first column of the primary key (or first
+unique index); the number of slices defaults to the row estimate in
+iitables divided by ``rows_per_partition``, and no more workers are used
+than there are slices.  Lower ``rows_per_partition`` to read a smaller table
+with more workers.
+"""
+
+import csv
+import math
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import and_, func, or_, select, types
+
+from sqlalchemy_ingres.pagination import keyset_columns
+
+_DONE = object()
+
+
+def _row_estimate(connection, table):
+    return connection.dialect.get_table_stats(connection, table.name, schema=table.schema)["row_count"]
+
+
+def split_partitions(connection, table, key=None, partitions=None, rows_per_partition=1000000, min_partitions=1):
+    """Return a list of WHERE criteria which together cover ``table`` exactly once.
+
+    Integer keys are split into contiguous ranges between MIN(key) and
+    MAX(key); other keys are split by MOD(ABS(HASH(key)), partitions).
+    Rows with a NULL key belong to the first partition.
+    """
+    if key is None:
+        key = keyset_columns(connection, table)[0]
+    if partitions is None:
+        estimate = _row_estimate(connection, table) or 0
+        partitions = max(min_partitions, int(math.ceil(float(estimate) / rows_per_partition)))
+    if partitions <= 1:
+        return [None]
+
+    if isinstance(key.type, types.Integer):
+        low, high = connection.execute(select(func.min(key), func.max(key))).one()
+        if low is None:
+            return [None]
+        step = int(math.ceil(float(high - low + 1) / partitions))
+        bounds = list(range(low + step, high + 1, step))
+        if not bounds:
+            return [None]
+        # open-ended first and last ranges also cover rows outside [low, high]
+        criteria = [or_(key < bounds[0], key.is_(None))]
+        for start, end in zip(bounds, bounds[1:]):
+            criteria.append(and_(key >= start, key < end))
+        criteria.append(key >= bounds[-1])
+        return criteria
+
+    bucket = func.mod(func.abs(func.hash(key)), partitions)
+    return [or_(bucket == 0, key.is_(None))] + [bucket == i for i in range(1, partitions)]
+
+
+def _partition_select(table, columns, criterion):
+    stmt = select(*columns) if columns else select(table)
+    if criterion is not None:
+        stmt = stmt.where(criterion)
+    return stmt
+
+
+def _iter_batches(connection, stmt, batch_size):
+    result = connection.execute(stmt)
+    try:
+        while True:
+            batch = result.fetchmany(batch_size)
+            if not batch:
+                return
+            yield batch
+    finally:
+        result.close()
+
+
+def _plan(engine, table, key, partitions, rows_per_partition, workers):
+    """WHERE criteria of the slices, and the number of workers to read them with"""
+    with engine.connect() as connection:
+        criteria = split_partitions(
+            connection, table, key=key, partitions=partitions, rows_per_partition=rows_per_partition
+        )
+    return criteria, max(min(workers, len(criteria)), 1)
+
+
+def partitioned_extract(
+    engine,
+    table,
+    columns=None,
+    key=None,
+    partitions=None,
+    workers=4,
+    batch_size=10000,
+    queue_size=None,
+    rows_per_partition=1000000,
+):
+    """Yield batches (lists of rows) of ``table`` read concurrently by ``workers`` connections.
+
+    Batches from different slices are interleaved in arrival order.  Closing
+    the generator early stops the workers.
+    """
+    criteria, workers = _plan(engine, table, key, partitions, rows_per_partition, workers)
+    batches = queue.Queue(maxsize=queue_size or workers)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def work(criterion):
+        try:
+            with engine.connect() as connection:
+                stmt = _partition_select(table, columns, criterion)
+                for batch in _iter_batches(connection, stmt, batch_size):
+                    if not put(batch):
+                        return
+        except BaseException as err:
+            put(err)
+        finally:
+            put(_DONE)
+
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        for criterion in criteria:
+            pool.submit(work, criterion)
+        remaining = len(criteria)
+        while remaining:
+            item = batches.get()
+            if item is _DONE:
+                remaining -= 1
+            elif isinstance(item, BaseException):
+                raise item
+            else:
+                yield item
+    finally:
+        stop.set()
+        pool.shutdown(wait=True)
+
+
+def extract_to_shards(
+    engine,
+    table,
+    write_shard,
+    columns=None,
+    key=None,
+    partitions=None,
+    workers=4,
+    batch_size=10000,
+    rows_per_partition=1000000,
+):
+    """Write each slice of ``table`` as a separate shard.
+
+    ``write_shard(index, column_names, batches)`` is called on a worker thread
+    for every slice with an iterator of row batches; its return values are
+    returned in slice order.
+    """
+    criteria, workers = _plan(engine, table, key, partitions, rows_per_partition, workers)
+
+    def work(index):
+        with engine.connect() as connection:
+            stmt = _partition_select(table, columns, criteria[index])
+            names = [column.name for column in stmt.selected_columns]
+            return write_shard(index, names, _iter_batches(connection, stmt, batch_size))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(work, range(len(criteria))))
+
+
+def csv_shard_writer(path_template, **fmtparams):
+    """Return a ``write_shard`` callable writing CSV files named ``path_template % index``."""
+
+    def write_shard(index, column_names, batches):
+        path = path_template % index
+        rows = 0
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f, **fmtparams)
+            writer.writerow(column_names)
+            for batch in batches:
+                writer.writerows(batch)
+                rows += len(batch)
+        return path, rows
+
+    return write_shard
@@ -0,0 +1,229 @@
+# ingres/ima.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+Server resource usage of application code paths.
+
+A :class:`SessionMonitor` reads the server-side counters of the session
+behind a connection before and after a block of work and records the
+differences under a label, so server CPU and I/O can be attributed to the
+code that caused them:
+
+    monitor = SessionMonitor(sample_rate=0.05, reporter=log_usage)
+
+    with engine.connect() as connection:
+        with monitor.measure(connection, "monthly-report"):
+            connection.execute(report_query).fetchall()
+
+    print(monitor.report())
+
+By default the counters are the session statistics returned by ``dbmsinfo()``
+(CPU milliseconds, direct and buffered I/O, page faults).  ``locks=True``
+adds the session's lock usage from the IMA table ``ima_locklist_info``
+(:data:`LOCK_QUERY`), and further IMA counters can be added with
+``ima_query``, a query returning one row of numbers for the session id
+bound as ``:session_id``.  The IMA tables must be registered in the
+database (see "Using IMA" in the Actian documentation):
+
+    monitor = SessionMonitor(locks=True, ima_query=my_session_query)
+
+Counters are recorded as the difference over the block, except ``gauges``
+such as the number of locks held, which are recorded as their value at the
+end of the block; the totals keep the highest value seen.
+
+Only a ``sample_rate`` fraction of blocks is measured, so the snapshot
+queries run before and after a measured block can be afforded in
+production.  They add slightly to the counters themselves.
+"""
+
+import collections
+import random
+import threading
+import time
+
+from sqlalchemy import text
+
+# counter name -> dbmsinfo() request
+DBMSINFO_COUNTERS = collections.OrderedDict(
+    [
+        ("cpu_ms", "_cpu_ms"),
+        ("direct_io", "_dio_cnt"),
+        ("buffered_io", "_bio_cnt"),
+        ("page_faults", "_pfault_cnt"),
+    ]
+)
+
+# locks held by a session, counted over its lock lists
+LOCK_QUERY = """
+    SELECT
+        COUNT(*) AS lock_lists,
+        SUM(locklist_lock_count) AS locks,
+        SUM(locklist_logical_count) AS logical_locks
+    FROM
+        ima_locklist_info
+    WHERE
+        locklist_session_id = :session_id"""
+
+# LOCK_QUERY columns that are levels rather than running totals
+LOCK_GAUGES = frozenset(["lock_lists", "locks", "logical_locks"])
+
+SessionUsage = collections.namedtuple("SessionUsage", "label session_id elapsed counters")
+
+
+class _UsageTotals(object):
+    def __init__(self):
+        self.count = 0
+        self.elapsed = 0.0
+        self.counters = collections.defaultdict(float)
+
+
+def session_id(connection):
+    """Server session id of ``connection``, from ``dbmsinfo('session_id')``"""
+    try:
+        info = connection.info
+    except NotImplementedError:
+        info = {}
+    sid = info.get("ingres_session_id")
+    if sid is None:
+        # stays the same for the life of the DBAPI connection
+        sid = info["ingres_session_id"] = connection.exec_driver_sql("SELECT dbmsinfo('session_id')").scalar().strip()
+    return sid
+
+
+def _number(value):
+    if value is None:
+        return 0.0
+    if isinstance(value, str):
+        value = value.strip() or 0
+    return float(value)
+
+
+class SessionMonitor(object):
+    """Measures server session counters around blocks of work.
+
+    ``counters`` maps counter names to ``dbmsinfo()`` requests (by default
+    :data:`DBMSINFO_COUNTERS`); ``locks`` adds the columns of
+    :data:`LOCK_QUERY` and ``ima_query`` those of a query with a
+    ``:session_id`` parameter.  Names in ``gauges`` (and the lock counts)
+    are recorded as values rather than differences.  Each measured block is
+    passed to ``reporter`` as a :class:`SessionUsage` and added to the
+    totals for its label.
+    """
+
+    def __init__(self, counters=None, ima_query=None, sample_rate=1.0, reporter=None, locks=False, gauges=()):
+        self.counters = collections.OrderedDict(DBMSINFO_COUNTERS if counters is None else counters)
+        self.ima_queries = []
+        self.gauges = set(gauges)
+        if locks:
+            self.ima_queries.append(text(LOCK_QUERY))
+            self.gauges.update(LOCK_GAUGES)
+        if ima_query is not None:
+            self.ima_queries.append(text(ima_query) if isinstance(ima_query, str) else ima_query)
+        self.sample_rate = sample_rate
+        self.reporter = reporter
+        self.totals = collections.defaultdict(_UsageTotals)
+        self._lock = threading.Lock()
+
+    def snapshot(self, connection):
+        """Current counter values of the session of ``connection``, as a dict"""
+        values = collections.OrderedDict()
+        if self.counters:
+            row = connection.exec_driver_sql(
+                "SELECT %s" % ", ".join("dbmsinfo('%s')" % request for request in self.counters.values())
+            ).first()
+            for name, value in zip(self.counters, row):
+                values[name] = _number(value)
+        for query in self.ima_queries:
+            row = connection.execute(query, {"session_id": session_id(connection)}).mappings().first()
+            if row is not None:
+                for name, value in row.items():
+                    values[name] = _number(value)
+        return values
+
+    def _sampled(self):
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def measure(self, connection, label):
+        """Context manager measuring the counter deltas of the block under ``label``"""
+        return _Measurement(self, connection, label) if self._sampled() else _NOT_SAMPLED
+
+    def _record(self, usage):
+        with self._lock:
+            totals = self.totals[usage.label]
+            totals.count += 1
+            totals.elapsed += usage.elapsed
+            for name, value in usage.counters.items():
+                if name in self.gauges:
+                    totals.counters[name] = max(totals.counters.get(name, value), value)
+                else:
+                    totals.counters[name] += value
+        if self.reporter is not None:
+            self.reporter(usage)
+
+    def reset(self):
+        with self._lock:
+            self.totals.clear()
+
+    def report(self):
+        """Text report of the measured totals per label, most server CPU first"""
+        with self._lock:
+            rows = sorted(self.totals.items(), key=lambda item: item[1].counters.get("cpu_ms", 0.0), reverse=True)
+            names = []
+            for _, totals in rows:
+                names.extend(name for name in totals.counters if name not in names)
+            lines = ["%8s %10s %s  label" % ("count", "elapsed s", " ".join("%12s" % name for name in names))]
+            for label, totals in rows:
+                lines.append(
+                    "%8d %10.2f %s  %s"
+                    % (
+                        totals.count,
+                        totals.elapsed,
+                        " ".join("%12.0f" % totals.counters.get(name, 0.0) for name in names),
+                        label,
+                    )
+                )
+        return "\n".join(lines)
+
+
+class _Measurement(object):
+    def __init__(self, monitor, connection, label):
+        self.monitor = monitor
+        self.connection = connection
+        self.label = label
+
+    def __enter__(self):
+        self.before = self.monitor.snapshot(self.connection)
+        self.start = time.time()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.time() - self.start
+        try:
+            after = self.monitor.snapshot(self.connection)
+        except Exception:
+            if exc_info[0] is not None:
+                # e.g. the transaction was aborted; keep the block's own error
+                return False
+            raise
+        gauges = self.monitor.gauges
+        deltas = collections.OrderedDict(
+            (name, after[name] if name in gauges else after[name] - self.before.get(name, 0.0)) for name in after
+        )
+        self.usage = SessionUsage(self.label, session_id(self.connection), elapsed, deltas)
+        self.monitor._record(self.usage)
+        return False
+
+
+class _NotSampled(object):
+    usage = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NOT_SAMPLED = _NotSampled()
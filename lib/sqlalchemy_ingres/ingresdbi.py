@@ -6,18 +6,54 @@
 """
 Ingres DB connector for the ingresdbi module, which can be downloaded from
 http://esd.ingres.com.
+
+ingresdbi uses the Ingres OpenAPI directly rather than ODBC.  Engine
+parameters:
+
+    arraysize       cursor.arraysize, the number of rows fetched by
+                    fetchmany() without a size (also the execution option
+                    ``ingres_arraysize``)
+    setinputsizes   declare the DB-API type of each parameter with
+                    cursor.setinputsizes() before executing, so values are
+                    bound as native Ingres types rather than inferred from
+                    their Python type
+    batch_dml       send executemany INSERTs as multi-row INSERT statements
+                    (see IngresDialect)
 """
-from sqlalchemy.engine.default import DefaultExecutionContext
 from sqlalchemy_ingres.base import IngresDialect
+from sqlalchemy_ingres.base import IngresExecutionContext
 from sqlalchemy_ingres.base import sqlalchemy_version_tuple
 
 
+class IngresExecutionContext_ingresdbi(IngresExecutionContext):
+    def create_cursor(self):
+        cursor = IngresExecutionContext.create_cursor(self)
+        arraysize = self.execution_options.get("ingres_arraysize", self.dialect.arraysize)
+        if arraysize:
+            cursor.arraysize = arraysize
+        return cursor
+
+
 class Ingres_ingresdbi(IngresDialect):
     driver = "ingresdbi"
     supports_statement_cache = False  # NOTE `IngresDialect.supports_statement_cache` is not actually picked up by SA warning code, _generate_cache_attrs() checks dict of subclass, not the entire class
+    execution_ctx_cls = IngresExecutionContext_ingresdbi
+    arraysize = None
 
-    def __init__(self, **kwargs):
+    def __init__(self, arraysize=None, setinputsizes=False, **kwargs):
         IngresDialect.__init__(self, **kwargs)
+        self.arraysize = arraysize
+        if setinputsizes:
+            if sqlalchemy_version_tuple >= (2, 0):
+                from sqlalchemy.engine.interfaces import BindTyping
+
+                self.bind_typing = BindTyping.SETINPUTSIZES
+            else:
+                self.use_setinputsizes = True
+
+    def do_set_input_sizes(self, cursor, list_of_tuples, context):
+        # positional parameters; None leaves a parameter's type to the driver
+        cursor.setinputsizes([dbtype for _, dbtype, _ in list_of_tuples])
 
     if sqlalchemy_version_tuple >= (2, 0):
 
@@ -38,12 +74,4 @@ class Ingres_ingresdbi(IngresDialect):
         return ([], opts)
 
 
-class IngresExecutionContext(DefaultExecutionContext):
-    def __init__(self, **kwargs):
-        DefaultExecutionContext.__init__(self, **kwargs)
-
-    def create_cursor(self):
-        return self._connection.connection.cursor()
-
-
 dialect = Ingres_ingresdbi
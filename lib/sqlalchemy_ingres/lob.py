@@ -0,0 +1,194 @@
+# ingres/lob.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+Chunked access to LONG VARCHAR, LONG NVARCHAR and LONG BYTE values.
+
+pyodbc always materializes a complete LOB value on fetch and on bind, so
+these helpers move large values in pieces instead; reads use SUBSTRING() on
+the server and writes append to the value with CONCAT(), one chunk per
+round trip.  The row holding the value is identified by a WHERE clause,
+typically on the primary key, which must match exactly one row.
+
+Each chunk is a separate statement, and neither is free for a large value:
+the server reads the value from its start to find a SUBSTRING() offset, and
+every CONCAT() append rewrites the whole value so far.  Moving a value of
+n bytes in chunks of c therefore costs on the order of n * n / (2 * c) bytes
+of server I/O.  Chunks are large by default (16MB) to keep that down; use
+the largest chunk that fits comfortably in memory, and plain SELECT / UPDATE
+for values that fit in memory whole.
+
+    with open_lob(connection, documents.c.body, documents.c.id == 42) as lob:
+        for chunk in lob:
+            out.write(chunk)
+
+    with open("big.pdf", "rb") as f:
+        write_lob(connection, documents.c.body, documents.c.id == 42, f)
+"""
+
+from sqlalchemy import bindparam, func, select, types
+from sqlalchemy.sql.elements import ColumnElement
+
+DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+class _Substring(ColumnElement):
+    """SUBSTRING(value FROM start FOR length), the form Ingres accepts for LOB values"""
+
+    __visit_name__ = "ingres_lob_substring"
+    inherit_cache = False  # custom construct, not part of the statement cache
+
+    def __init__(self, value, start, length):
+        self.value = value
+        self.start = bindparam(None, start, type_=types.Integer, unique=True)
+        self.length = bindparam(None, length, type_=types.Integer, unique=True)
+        self.type = value.type
+
+    @property
+    def _from_objects(self):
+        return self.value._from_objects
+
+
+class LOBReader(object):
+    """Read-only file-like object over a single LOB value.
+
+    Reads return ``bytes`` for LONG BYTE columns and ``str`` for LONG
+    VARCHAR / LONG NVARCHAR columns; positions are in bytes or characters
+    respectively.  At most ``chunk_size`` units are fetched per query.
+    """
+
+    def __init__(self, connection, column, whereclause, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.connection = connection
+        self.column = column
+        self.whereclause = whereclause
+        self.chunk_size = chunk_size
+        self.closed = False
+        self._position = 0
+        self._length = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def writable(self):
+        return False
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=0):
+        if whence == 0:
+            position = offset
+        elif whence == 1:
+            position = self._position + offset
+        elif whence == 2:
+            position = len(self) + offset
+        else:
+            raise ValueError("invalid whence (%r, should be 0, 1 or 2)" % whence)
+        self._position = max(position, 0)
+        return self._position
+
+    def __len__(self):
+        if self._length is None:
+            stmt = select(func.length(self.column)).where(self.whereclause)
+            self._length = self.connection.execute(stmt).scalar() or 0
+        return self._length
+
+    def _empty(self):
+        return _empty_value(self.column)
+
+    def _fetch(self, position, size):
+        # SUBSTRING() positions are 1-based
+        stmt = select(_Substring(self.column, position + 1, size)).where(self.whereclause)
+        value = self.connection.execute(stmt).scalar()
+        return self._empty() if value is None else value
+
+    def read(self, size=-1):
+        if self.closed:
+            raise ValueError("I/O operation on closed LOB")
+
+        remaining = len(self) - self._position
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        if size <= 0:
+            return self._empty()
+
+        chunks = []
+        while size > 0:
+            chunk = self._fetch(self._position, min(size, self.chunk_size))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            self._position += len(chunk)
+            size -= len(chunk)
+        return self._empty().join(chunks)
+
+
+def open_lob(connection, column, whereclause, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Return a :class:`LOBReader` for ``column`` in the row matching ``whereclause``."""
+    return LOBReader(connection, column, whereclause, chunk_size=chunk_size)
+
+
+def _empty_value(column):
+    return b"" if column.type.python_type is bytes else ""
+
+
+def _iter_chunks(source, chunk_size):
+    if isinstance(source, (bytes, bytearray, str)):
+        for start in range(0, len(source), chunk_size):
+            yield source[start : start + chunk_size]
+    elif hasattr(source, "read"):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        for chunk in source:
+            if chunk:
+                yield chunk
+
+
+def write_lob(connection, column, whereclause, source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Store ``source`` into ``column`` of the row matching ``whereclause``.
+
+    ``source`` may be a ``str``/``bytes`` value, a file-like object with a
+    ``read()`` method, or an iterable of chunks; it is sent ``chunk_size`` at
+    a time so only one chunk is held in memory.  Any existing value is
+    replaced.  Returns the number of bytes or characters written.
+    """
+    table = column.table
+    chunk = bindparam("chunk", type_=column.type)
+    replace = table.update().where(whereclause).values({column.name: chunk})
+    append = table.update().where(whereclause).values({column.name: func.concat(column, chunk)})
+
+    written = 0
+    stmt = replace
+    for data in _iter_chunks(source, chunk_size):
+        connection.execute(stmt, {"chunk": data})
+        written += len(data)
+        stmt = append
+
+    if written == 0:
+        connection.execute(replace, {"chunk": _empty_value(column)})
+    return written
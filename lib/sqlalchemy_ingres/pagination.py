@@ -0,0 +1,142 @@
+# ingres/pagination.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+Keyset (seek) pagination.
+
+OFFSET n FETCH FIRST m ROWS ONLY makes the server produce and discard n rows
+for every page, so deep pages get slower as the offset grows.  Keyset
+pagination instead remembers the ordering key of the last row returned and
+asks for rows after it, which an index or key on the ordering columns turns
+into a range scan of constant cost per page.
+
+The ordering columns must be unique together and NOT NULL (a primary key or
+unique index is ideal), and must be part of the SELECT list.  They are
+``order_by`` if given, else the statement's own ORDER BY, else the primary
+key of the selected table; the page query's ORDER BY is always the ordering
+columns, replacing any ORDER BY of the statement.
+
+    stmt = select(orders)
+    rows, key = fetch_page(connection, stmt, page_size=100)             # first page
+    rows, key = fetch_page(connection, stmt, page_size=100, after=key)  # next page
+
+    for page in iter_pages(connection, stmt, page_size=10000):          # batch export
+        write(page)
+"""
+
+import weakref
+
+from sqlalchemy import and_, inspect, or_
+from sqlalchemy.exc import ArgumentError
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import UnaryExpression
+
+# key column names found by reflection, per Table
+_reflected_keys = weakref.WeakKeyDictionary()
+
+
+def keyset_columns(connection, table):
+    """Return the columns of ``table`` suitable for keyset ordering.
+
+    Uses the primary key declared on ``table`` if there is one, otherwise
+    the primary key or first unique index reported by reflection, which is
+    looked up once per table.
+    """
+    if len(table.primary_key):
+        return list(table.primary_key)
+
+    names = _reflected_keys.get(table)
+    if names is None:
+        insp = inspect(connection)
+        names = insp.get_pk_constraint(table.name, schema=table.schema)["constrained_columns"]
+        if not names:
+            for index in insp.get_indexes(table.name, schema=table.schema):
+                if index["unique"]:
+                    names = index["column_names"]
+                    break
+        if not names:
+            raise ArgumentError("Table %r has no primary key or unique index to paginate on" % table.name)
+        _reflected_keys[table] = names
+    return [table.c[name] for name in names]
+
+
+def _split_order_by(order_by):
+    """Return (column, descending) pairs for ORDER BY expressions."""
+    keys = []
+    for expr in order_by:
+        if isinstance(expr, UnaryExpression) and expr.modifier in (operators.desc_op, operators.asc_op):
+            keys.append((expr.element, expr.modifier is operators.desc_op))
+        else:
+            keys.append((expr, False))
+    return keys
+
+
+def keyset_predicate(order_by, values):
+    """Return a WHERE criterion selecting rows after ``values`` in ``order_by`` order.
+
+    For keys (a, b, c) ascending this renders
+    a >= :a AND (a > :a OR (a = :a AND b > :b) OR (a = :a AND b = :b AND c > :c)),
+    the leading term letting the optimizer start a range scan on ``a``.
+    """
+    keys = _split_order_by(order_by)
+    if len(keys) != len(values):
+        raise ArgumentError("Expected %d key values, got %d" % (len(keys), len(values)))
+
+    alternatives = []
+    for i, (column, descending) in enumerate(keys):
+        terms = [keys[j][0] == values[j] for j in range(i)]
+        terms.append(column < values[i] if descending else column > values[i])
+        alternatives.append(and_(*terms))
+
+    first_column, first_descending = keys[0]
+    bound = first_column <= values[0] if first_descending else first_column >= values[0]
+    return and_(bound, or_(*alternatives))
+
+
+def _default_order_by(connection, stmt):
+    if stmt._order_by_clauses:
+        return list(stmt._order_by_clauses)
+    froms = stmt.get_final_froms() if hasattr(stmt, "get_final_froms") else stmt.froms
+    if len(froms) != 1 or not hasattr(froms[0], "primary_key"):
+        raise ArgumentError("order_by is required unless the statement selects from a single table")
+    return keyset_columns(connection, froms[0])
+
+
+def fetch_page(connection, stmt, order_by=None, page_size=1000, after=None):
+    """Fetch one page of ``stmt`` ordered by ``order_by``.
+
+    ``after`` is the key returned for the previous page, or None for the
+    first page.  Returns ``(rows, key)`` where ``key`` is the ordering key
+    of the last row, to be passed as ``after`` for the next page, or None
+    when there are no further rows.
+    """
+    if order_by is None:
+        order_by = _default_order_by(connection, stmt)
+    key_columns = [column for column, _ in _split_order_by(order_by)]
+
+    page = stmt
+    if after is not None:
+        page = page.where(keyset_predicate(order_by, after))
+    page = page.order_by(None).order_by(*order_by).limit(page_size)
+
+    rows = connection.execute(page).fetchall()
+    if len(rows) < page_size:
+        key = None
+    else:
+        mapping = rows[-1]._mapping
+        key = tuple(mapping[column] for column in key_columns)
+    return rows, key
+
+
+def iter_pages(connection, stmt, order_by=None, page_size=1000, after=None):
+    """Yield successive pages (lists of rows) of ``stmt`` using keyset pagination."""
+    if order_by is None:
+        order_by = _default_order_by(connection, stmt)
+    while True:
+        rows, after = fetch_page(connection, stmt, order_by, page_size, after)
+        if rows:
+            yield rows
+        if after is None:
+            return
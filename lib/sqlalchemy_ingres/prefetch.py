@@ -0,0 +1,147 @@
+# ingres/prefetch.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+Background fetching of result rows.
+
+Normally the next rowset is only fetched from the server once the current
+one has been processed, so the client alternates between waiting on the
+network and working.  With the ``ingres_prefetch`` execution option a
+background thread fetches rowsets of ``ingres_prefetch_rows`` rows (default
+1000) into a queue holding up to ``ingres_prefetch`` rowsets, while the
+application processes the rows already fetched:
+
+    result = connection.execution_options(ingres_prefetch=4).execute(big_query)
+    for row in result:
+        process(row)
+
+pyodbc releases the GIL while it waits for the driver, so fetching overlaps
+with Python code in the application thread.  Memory use is bounded by
+``ingres_prefetch + 1`` rowsets.  The cursor must not be used by anything else
+until the result is exhausted or closed.
+"""
+
+import collections
+import queue
+import threading
+
+from sqlalchemy.engine import cursor as _cursor
+
+_END = ()
+
+
+def _fetch_rowsets(cursor, size, rowsets, stop):
+    """Thread body: fetch rowsets into ``rowsets`` until the cursor is exhausted or ``stop`` is set"""
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                rowsets.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    try:
+        while not stop.is_set():
+            rows = cursor.fetchmany(size)
+            if not rows:
+                put(_END)
+                return
+            if not put(rows):
+                return
+    except BaseException as err:
+        put(err)
+
+
+class _PrefetchCursorFetchStrategy(_cursor.CursorFetchStrategy):
+    """Fetch strategy reading rowsets fetched by a background thread"""
+
+    def __init__(self, dbapi_cursor, depth, size, alternate_description=None):
+        self.alternate_cursor_description = alternate_description
+        self._rows = collections.deque()
+        self._rowsets = queue.Queue(max(depth, 1))
+        self._stop = threading.Event()
+        self._exhausted = False
+        # the thread holds no reference to the strategy, so an abandoned result
+        # is still collected, and __del__ stops the thread
+        self._thread = threading.Thread(
+            target=_fetch_rowsets,
+            args=(dbapi_cursor, size, self._rowsets, self._stop),
+            name="ingres-prefetch",
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def __del__(self):
+        self._stop.set()
+
+    def _stop_thread(self):
+        self._stop.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            # waits for a fetch in progress; the cursor may be closed after this
+            self._thread.join()
+        self._exhausted = True
+
+    def _next_rowset(self):
+        """Add the next rowset to the buffer; False once the result is exhausted"""
+        if self._exhausted:
+            return False
+        item = self._rowsets.get()
+        if isinstance(item, BaseException):
+            self._exhausted = True
+            raise item
+        if item is _END:
+            self._exhausted = True
+            return False
+        self._rows.extend(item)
+        return True
+
+    def soft_close(self, result, dbapi_cursor):
+        self._stop_thread()
+        self._rows.clear()
+        super(_PrefetchCursorFetchStrategy, self).soft_close(result, dbapi_cursor)
+
+    def hard_close(self, result, dbapi_cursor):
+        self._stop_thread()
+        self._rows.clear()
+        super(_PrefetchCursorFetchStrategy, self).hard_close(result, dbapi_cursor)
+
+    def yield_per(self, result, dbapi_cursor, num):
+        # rowsets are already being fetched at the prefetch size
+        pass
+
+    def fetchone(self, result, dbapi_cursor, hard_close=False):
+        try:
+            if not self._rows and not self._next_rowset():
+                result._soft_close(hard=hard_close)
+                return None
+            return self._rows.popleft()
+        except BaseException as e:
+            self.handle_exception(result, dbapi_cursor, e)
+
+    def fetchmany(self, result, dbapi_cursor, size=None):
+        if size is None:
+            return self.fetchall(result, dbapi_cursor)
+        try:
+            while len(self._rows) < size and self._next_rowset():
+                pass
+            rows = [self._rows.popleft() for _ in range(min(size, len(self._rows)))]
+            if not rows:
+                result._soft_close()
+            return rows
+        except BaseException as e:
+            self.handle_exception(result, dbapi_cursor, e)
+
+    def fetchall(self, result, dbapi_cursor):
+        try:
+            while self._next_rowset():
+                pass
+            rows = list(self._rows)
+            self._rows.clear()
+            result._soft_close()
+            return rows
+        except BaseException as e:
+            self.handle_exception(result, dbapi_cursor, e)
@@ -0,0 +1,264 @@
+# ingres/profiling.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+Per-phase statement profiling.
+
+Pass a :class:`Profiler` as the ``ingres_profiler`` execution option and each
+statement executed with it is timed by phase:
+
+    compile   SQL compilation of the statement
+    pre_exec  preparation, such as loading large IN lists
+    execute   cursor.execute() / executemany() in the driver
+    post_exec follow-up work such as SELECT last_identity()
+    fetch     fetching rows from the driver
+    process   result processors converting fetched values
+
+Timings are aggregated per SQL string:
+
+    profiler = Profiler(slowest=5, cprofile=True)
+    with engine.connect() as connection:
+        connection = connection.execution_options(ingres_profiler=profiler)
+        connection.execute(report_query).fetchall()
+    print(profiler.report())
+    profiler.slowest[0].stats.sort_stats("cumulative").print_stats(20)
+
+A statement's timings are recorded when its cursor is closed, which is when
+its result is exhausted or closed.  Compilation is timed once the option has
+been used with the engine, and counts only for executions that compiled the
+statement rather than finding it in the compiled cache.
+"""
+
+import collections
+import contextlib
+import cProfile
+import heapq
+import itertools
+import pstats
+import threading
+import time
+import tracemalloc
+
+PHASES = ("compile", "pre_exec", "execute", "post_exec", "fetch", "process")
+
+Sample = collections.namedtuple("Sample", "elapsed statement phases stats peak_memory")
+
+
+class _StatementTotals(object):
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.phases = dict((phase, 0.0) for phase in PHASES)
+
+
+class _Execution(object):
+    """Timings of one execution, filled in by IngresExecutionContext"""
+
+    def __init__(self, profiler, statement):
+        self.profiler = profiler
+        self.statement = statement
+        self.phases = dict((phase, 0.0) for phase in PHASES)
+        self.finished = False
+        self.peak_memory = None
+        self._phase = None
+        self._profile = None
+        self._profiling = 0
+        self._thread = threading.get_ident()
+        if profiler.cprofile:
+            self._profile = cProfile.Profile()
+        if profiler.tracemalloc and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+
+    def add(self, phase, elapsed):
+        self.phases[phase] += elapsed
+
+    @contextlib.contextmanager
+    def profiling(self):
+        """Run cProfile, if requested, while the block runs.
+
+        The profiler is only enabled during calls made for the statement, so
+        it is never left running by a result that is not closed, and only in
+        the thread that executed the statement.
+        """
+        if self._profile is None or self.finished or threading.get_ident() != self._thread:
+            yield
+            return
+        if not self._profiling:
+            try:
+                self._profile.enable()
+            except ValueError:
+                # another profiler is active in this thread
+                yield
+                return
+        self._profiling += 1
+        try:
+            yield
+        finally:
+            self._profiling -= 1
+            if not self._profiling:
+                self._profile.disable()
+
+    @contextlib.contextmanager
+    def timing(self, phase):
+        """Time a phase; cursor calls made meanwhile count towards it"""
+        self._phase = phase
+        start = time.perf_counter()
+        try:
+            with self.profiling():
+                yield
+        finally:
+            self._phase = None
+            self.add(phase, time.perf_counter() - start)
+
+    def finish(self):
+        if self.finished:
+            return
+        self.finished = True
+        if self.profiler.tracemalloc and tracemalloc.is_tracing():
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+        self.profiler._record(self)
+
+
+class _ProfilingCursor(object):
+    """DBAPI cursor proxy timing execute and fetch calls"""
+
+    def __init__(self, cursor, execution):
+        object.__setattr__(self, "_cursor", cursor)
+        object.__setattr__(self, "_execution", execution)
+
+    def _timed(self, phase, method, *args):
+        if self._execution._phase is not None:
+            return method(*args)
+        start = time.perf_counter()
+        try:
+            with self._execution.profiling():
+                return method(*args)
+        finally:
+            self._execution.add(phase, time.perf_counter() - start)
+
+    def execute(self, *args):
+        return self._timed("execute", self._cursor.execute, *args)
+
+    def executemany(self, *args):
+        return self._timed("execute", self._cursor.executemany, *args)
+
+    def fetchone(self):
+        return self._timed("fetch", self._cursor.fetchone)
+
+    def fetchmany(self, *args):
+        return self._timed("fetch", self._cursor.fetchmany, *args)
+
+    def fetchall(self):
+        return self._timed("fetch", self._cursor.fetchall)
+
+    def close(self):
+        try:
+            self._cursor.close()
+        finally:
+            self._execution.finish()
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._cursor, name, value)
+
+
+def _timed_processor(processor, execution):
+    def process(value):
+        start = time.perf_counter()
+        try:
+            with execution.profiling():
+                return processor(value)
+        finally:
+            execution.add("process", time.perf_counter() - start)
+
+    return process
+
+
+class Profiler(object):
+    """Collects per-phase timings of the statements executed with it.
+
+    ``slowest`` executions are kept as :class:`Sample` entries with, if
+    ``cprofile`` is set, a ``pstats.Stats`` of the Python work done in the
+    statement's execute, fetch and processing calls, and if ``tracemalloc`` is set (and tracemalloc
+    is tracing), the peak memory traced meanwhile.  Both add overhead to every
+    profiled statement.
+    """
+
+    def __init__(self, slowest=10, cprofile=False, tracemalloc=False):
+        self.keep = slowest
+        self.cprofile = cprofile
+        self.tracemalloc = tracemalloc
+        self.statements = collections.defaultdict(_StatementTotals)
+        self._slowest = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def _start(self, statement):
+        return _Execution(self, statement)
+
+    def _record(self, execution):
+        elapsed = sum(execution.phases.values())
+        with self._lock:
+            totals = self.statements[execution.statement]
+            totals.count += 1
+            totals.total += elapsed
+            totals.max = max(totals.max, elapsed)
+            for phase, value in execution.phases.items():
+                totals.phases[phase] += value
+
+            if self.keep:
+                entry = (elapsed, next(self._counter), execution)
+                if len(self._slowest) < self.keep:
+                    heapq.heappush(self._slowest, entry)
+                elif elapsed > self._slowest[0][0]:
+                    heapq.heapreplace(self._slowest, entry)
+
+    @property
+    def slowest(self):
+        """The slowest executions as :class:`Sample` entries, slowest first"""
+        with self._lock:
+            entries = sorted(self._slowest, reverse=True)
+        samples = []
+        for elapsed, _, execution in entries:
+            stats = pstats.Stats(execution._profile) if execution._profile is not None else None
+            samples.append(Sample(elapsed, execution.statement, dict(execution.phases), stats, execution.peak_memory))
+        return samples
+
+    def reset(self):
+        with self._lock:
+            self.statements.clear()
+            self._slowest = []
+
+    def report(self, limit=20):
+        """Text report of the statements taking the most total time"""
+        with self._lock:
+            rows = sorted(self.statements.items(), key=lambda item: item[1].total, reverse=True)[:limit]
+        lines = [
+            "%8s %10s %10s %s  statement"
+            % ("count", "total ms", "max ms", " ".join("%10s" % (phase + " ms") for phase in PHASES))
+        ]
+        for statement, totals in rows:
+            lines.append(
+                "%8d %10.2f %10.2f %s  %s"
+                % (
+                    totals.count,
+                    totals.total * 1000,
+                    totals.max * 1000,
+                    " ".join("%10.2f" % (totals.phases[phase] * 1000) for phase in PHASES),
+                    " ".join(statement.split())[:120],
+                )
+            )
+        return "\n".join(lines)
+
+    def dump(self, file):
+        """Write :meth:`report` to a path or file object"""
+        if hasattr(file, "write"):
+            file.write(self.report() + "\n")
+        else:
+            with open(file, "w") as f:
+                f.write(self.report() + "\n")
@@ -5,11 +5,33 @@
 # the Apache-2.0 License: https://opensource.org/license/apache-2-0/
 """
 Ingres DB connector for the pyodbc/pypyodbc module
+
+Several servers may be given, either comma separated in the host part of the
+URL (all using the URL port) or as repeated ``host`` query parameters; read
+replicas are given as ``replica_host`` query parameters:
+
+    ingres://user:pw@node1,node2,node3:21064/db
+    ingres://user:pw@/db?host=node1:21064&host=node2:21071&replica_host=node3:21064
+
+New connections are spread over the servers according to ``load_balance``
+("round_robin", "least_connections" or "latency"); a server that cannot be
+reached (SQLSTATE 08xxx) or drops a connection is skipped for
+``host_retry_interval`` seconds.  Other connect errors, such as a bad
+password or unknown database, are raised without trying the other servers.
+Engines created with ``read_only=True`` connect to the replicas (falling back
+to the other servers) and mark their sessions READ ONLY.
 """
 
+import collections
+import math
 import os
+import threading
+import time
+
+from sqlalchemy import event
 from sqlalchemy.engine.default import DefaultExecutionContext
 from sqlalchemy_ingres.base import IngresDialect
+from sqlalchemy_ingres.base import _raw_dbapi_connection
 from sqlalchemy_ingres.base import sqlalchemy_version_tuple
 
 try:
@@ -19,36 +41,155 @@ except NameError:
     ModuleNotFoundError = ImportError
 
 
+_import_lock = threading.Lock()
+
+
+class _HostRouter(object):
+    """Chooses the server for each new DBAPI connection and tracks server health"""
+
+    policies = ("round_robin", "least_connections", "latency")
+
+    def __init__(self, hosts, replicas=(), policy="round_robin", retry_interval=30.0):
+        if policy not in self.policies:
+            raise ValueError("load_balance must be one of %s, not %r" % (", ".join(self.policies), policy))
+        self.hosts = list(hosts)
+        self.replicas = list(replicas)
+        self.policy = policy
+        self.retry_interval = retry_interval
+        self._lock = threading.Lock()
+        self._turn = 0
+        self._open = collections.Counter()
+        self._latency = {}
+        self._down_until = {}
+        self._connections = {}  # id(dbapi_connection) -> host
+
+    def _order(self, hosts):
+        if self.policy == "round_robin":
+            self._turn += 1
+            start = self._turn % len(hosts) if hosts else 0
+            return hosts[start:] + hosts[:start]
+        if self.policy == "least_connections":
+            return sorted(hosts, key=lambda host: self._open[host])
+        # latency: servers not yet measured are tried first
+        return sorted(hosts, key=lambda host: self._latency.get(host, 0.0))
+
+    def candidates(self, read_only=False):
+        """Servers to try, in order: healthy ones by policy, then those marked down"""
+        groups = [self.replicas, self.hosts] if read_only and self.replicas else [self.hosts + self.replicas]
+        now = time.time()
+        ordered, down = [], []
+        with self._lock:
+            for group in groups:
+                healthy = [host for host in group if self._down_until.get(host, 0) <= now]
+                down.extend(host for host in group if host not in healthy)
+                ordered.extend(self._order(healthy))
+            down.sort(key=lambda host: self._down_until[host])
+        return ordered + down
+
+    def connect(self, connect, read_only=False, errors=(Exception,), unavailable=None):
+        """Call ``connect(host)`` for each candidate until one succeeds.
+
+        A server whose connect error satisfies ``unavailable`` (any of
+        ``errors`` by default) is marked down and the next one is tried; other
+        errors, such as bad credentials, are raised as they are.
+        """
+        error = None
+        for host in self.candidates(read_only):
+            start = time.time()
+            try:
+                dbapi_connection = connect(host)
+            except errors as err:
+                if unavailable is not None and not unavailable(err):
+                    raise
+                self.mark_down(host)
+                error = err
+                continue
+            self._connected(host, dbapi_connection, time.time() - start)
+            return dbapi_connection
+        raise error
+
+    def _connected(self, host, dbapi_connection, elapsed):
+        with self._lock:
+            self._down_until.pop(host, None)
+            self._open[host] += 1
+            self._connections[id(dbapi_connection)] = host
+            previous = self._latency.get(host)
+            self._latency[host] = elapsed if previous is None else 0.8 * previous + 0.2 * elapsed
+
+    def host_for(self, dbapi_connection):
+        return self._connections.get(id(dbapi_connection))
+
+    def released(self, dbapi_connection):
+        with self._lock:
+            host = self._connections.pop(id(dbapi_connection), None)
+            if host is not None:
+                self._open[host] -= 1
+
+    def mark_down(self, host):
+        with self._lock:
+            self._down_until[host] = time.time() + self.retry_interval
+
+
+def _split_hosts(value, default_port):
+    hosts = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        if ":" in item:
+            name, port = item.rsplit(":", 1)
+            hosts.append((name, port))
+        else:
+            hosts.append((item, default_port))
+    return hosts
+
+
+def _query_hosts(url, key):
+    values = url.query.get(key, ())
+    hosts = []
+    for value in (values,) if isinstance(values, str) else values:
+        hosts.extend(_split_hosts(value, url.port))
+    return hosts
+
+
 class Ingres_pyodbc(IngresDialect):
     driver = "pyodbc"
+    supports_statement_timeout = True
     supports_statement_cache = False  # quiesce https://sqlalche.me/e/14/cprf  NOTE `IngresDialect.supports_statement_cache` is not actually picked up by SA warning code, _generate_cache_attrs() checks dict of subclass, not the entire class
 
-    def __init__(self, **kwargs):
+    def __init__(
+        self, load_balance="round_robin", read_only=False, host_retry_interval=30.0, fast_executemany=False, **kwargs
+    ):
         IngresDialect.__init__(self, **kwargs)
+        self.fast_executemany = fast_executemany
+        self.load_balance = load_balance
+        self.read_only = read_only
+        self.host_retry_interval = host_retry_interval
+        self._router = None
 
-    if sqlalchemy_version_tuple >= (2, 0):
-
-        @classmethod
-        def import_dbapi(cls):
+    @classmethod
+    def _import_driver(cls):
+        # first connects may run concurrently; only publish the driver name once it imports
+        with _import_lock:
             try:
-                driver = __import__(Ingres_pyodbc.driver)
+                return __import__(Ingres_pyodbc.driver)
             except ModuleNotFoundError:
                 # fallback to pure Python version
+                driver = __import__("pypyodbc")
                 Ingres_pyodbc.driver = "pypyodbc"
-                driver = __import__(Ingres_pyodbc.driver)
-            return driver
+                return driver
+
+    if sqlalchemy_version_tuple >= (2, 0):
+
+        @classmethod
+        def import_dbapi(cls):
+            return cls._import_driver()
 
     else:
 
         @classmethod
         def dbapi(cls):
-            try:
-                driver = __import__(Ingres_pyodbc.driver)
-            except ModuleNotFoundError:
-                # fallback to pure Python version
-                Ingres_pyodbc.driver = "pypyodbc"
-                driver = __import__(Ingres_pyodbc.driver)
-            return driver
+            return cls._import_driver()
 
     def create_connect_args(self, url):
         opts = url.translate_connect_args(username="uid", password="pwd", host="vnode")
@@ -61,12 +202,18 @@ class Ingres_pyodbc(IngresDialect):
         if url.database:
             # database may not be needed for dialect operations without a database connnection
             conn_list.append("Database=" + url.database)
-        if not url.host:
+        hosts = _split_hosts(url.host or "", url.port) + _query_hosts(url, "host")
+        replicas = _query_hosts(url, "replica_host")
+
+        if len(hosts) > 1 or replicas:
+            # HostName/ListenAddress are added per connection by connect()
+            self._router = _HostRouter(hosts, replicas, self.load_balance, self.host_retry_interval)
+        elif not hosts:
             conn_list.append("Server=(local)")
         else:
             # conn_list.append('Server=' + url.host)  # for vnodes only - FIXME look at handling vnodes
-            conn_list.append("HostName=" + url.host)
-            conn_list.append("ListenAddress=" + str(url.port))
+            conn_list.append("HostName=" + hosts[0][0])
+            conn_list.append("ListenAddress=" + str(hosts[0][1]))
             # FIXME port - str(url.port)
 
         if url.username:
@@ -78,9 +225,92 @@ class Ingres_pyodbc(IngresDialect):
 
         opts = {}
         opts.update(url.query)
+        opts.pop("host", None)
+        opts.pop("replica_host", None)
 
         return ([connection_str], opts)
 
+    def connect(self, *cargs, **cparams):
+        if self._router is None:
+            return IngresDialect.connect(self, *cargs, **cparams)
+
+        def connect_to(host):
+            name, port = host
+            address = ";HostName=%s" % name
+            if port:
+                address += ";ListenAddress=%s" % port
+            return IngresDialect.connect(self, cargs[0] + address, *cargs[1:], **cparams)
+
+        return self._router.connect(
+            connect_to, read_only=self.read_only, errors=(self.dbapi.Error,), unavailable=self._is_unavailable
+        )
+
+    def _is_unavailable(self, e):
+        # SQLSTATE class 08, connection exception: the server could not be reached
+        sqlstate, _ = self._error_codes(e)
+        return sqlstate is not None and sqlstate.startswith("08")
+
+    def _create_timeout_cursor(self, dbapi_connection, timeout):
+        # pyodbc applies Connection.timeout to cursors created while it is set
+        raw = _raw_dbapi_connection(dbapi_connection)
+        previous = raw.timeout
+        raw.timeout = int(math.ceil(timeout))
+        try:
+            return raw.cursor()
+        finally:
+            raw.timeout = previous
+
+    def do_executemany(self, cursor, statement, parameters, context=None):
+        if self.fast_executemany or self.batch_dml:
+            # bind all parameter sets as ODBC parameter arrays in one call
+            cursor.fast_executemany = True
+        IngresDialect.do_executemany(self, cursor, statement, parameters, context=context)
+
+    def _insert_inlist(self, cursor, table_name, values, context):
+        # IN-list values are scalars, so parameter arrays are always safe here
+        cursor.fast_executemany = True
+        IngresDialect.do_executemany(
+            self, cursor, "INSERT INTO %s (v) VALUES (?)" % table_name, [(value,) for value in values], context
+        )
+
+    def on_connect(self):
+        if not self.read_only:
+            return None
+
+        def set_read_only(dbapi_connection):
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute("SET SESSION READ ONLY")
+            finally:
+                cursor.close()
+
+        return set_read_only
+
+    @classmethod
+    def engine_created(cls, engine):
+        super().engine_created(engine)
+        router = engine.dialect._router
+        if router is None:
+            return
+
+        @event.listens_for(engine, "close")
+        def _released(dbapi_connection, connection_record):
+            router.released(dbapi_connection)
+
+        @event.listens_for(engine, "close_detached")
+        def _released_detached(dbapi_connection):
+            router.released(dbapi_connection)
+
+        @event.listens_for(engine, "handle_error")
+        def _failover(context):
+            # a dropped connection takes its server out of rotation, so the
+            # pool reconnects elsewhere
+            if context.is_disconnect and context.connection is not None:
+                fairy = context.connection.connection
+                host = router.host_for(getattr(fairy, "dbapi_connection", None) or fairy.connection)
+                if host is not None:
+                    router.mark_down(host)
+
 
 # FIXME push into base
 class IngresExecutionContext(DefaultExecutionContext):
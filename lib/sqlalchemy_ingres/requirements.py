@@ -51,4 +51,13 @@ class Requirements(SuiteRequirements):
 
     @property
     def temp_table_reflection(self):
+        return supported()
+
+    @property
+    def has_temp_table(self):
+        return supported()
+
+    @property
+    def temp_table_reflect_indexes(self):
+        # indexes of session tables are not in iiindexes
         return unsupported()
@@ -0,0 +1,111 @@
+# ingres/resultcache.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+Cache of query results.
+
+Create the engine with ``result_cache_size`` to keep up to that many
+results in an LRU cache, then opt statements in with the ``ingres_cache_ttl``
+execution option, the number of seconds a result may be reused:
+
+    engine = create_engine("ingres:///demodb", result_cache_size=500)
+
+    rates = select(currency.c.rate).where(currency.c.code == bindparam("code"))
+    with engine.connect() as connection:
+        connection = connection.execution_options(ingres_cache_ttl=60)
+        rate = connection.execute(rates, {"code": "EUR"}).scalar()
+
+Results are keyed by SQL text and parameter values, including the values
+of IN lists longer than ``inlist_threshold``.  INSERT, UPDATE and
+DELETE statements executed through the engine drop the cached results of
+the tables they touch, both when executed and when their transaction ends;
+statements whose tables are not known, such as textual SQL, drop the whole
+cache.  A transaction that has changed data bypasses the cache until it
+ends, so its uncommitted rows are never shared.  Changes made by other
+engines or applications are only seen once the TTL expires, or after
+``engine.dialect.result_cache.invalidate()``.
+"""
+
+import collections
+import re
+import threading
+import time
+
+# textual statements that may change data or schema
+_MODIFYING = re.compile(
+    r"\s*(INSERT|UPDATE|DELETE|MERGE|COPY|TRUNCATE|MODIFY|CREATE|DROP|ALTER|CALL|EXECUTE)\b", re.IGNORECASE
+)
+
+_Entry = collections.namedtuple("_Entry", "expires description rows tables")
+
+
+class _ResultCache(object):
+    """Thread-safe LRU cache of result rows for one engine.
+
+    Each table has a generation number, advanced when it is invalidated, so
+    a result read while a table was being changed is not stored.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self._entries = collections.OrderedDict()
+        self._generations = {}
+        self._epoch = 0  # advanced when everything is invalidated
+        self._changes = 0  # advanced on every invalidation
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def snapshot(self, tables):
+        with self._lock:
+            return self._epoch, self._versions(tables)
+
+    def _versions(self, tables):
+        # results of statements with unknown tables are stale after any change
+        if tables is None:
+            return self._changes
+        return tuple(self._generations.get(table, 0) for table in tables)
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= now:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, ttl, description, rows, tables, snapshot):
+        with self._lock:
+            if snapshot != (self._epoch, self._versions(tables)):
+                return
+            self._entries[key] = _Entry(time.time() + ttl, description, rows, tables)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, tables=None):
+        """Drop cached results using any of ``tables`` (table names), or all results"""
+        with self._lock:
+            self._changes += 1
+            if tables is None:
+                self._epoch += 1
+                self._entries.clear()
+                return
+            tables = set(table.lower() for table in tables)
+            for table in tables:
+                self._generations[table] = self._generations.get(table, 0) + 1
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if entry.tables is None or not tables.isdisjoint(entry.tables)
+            ]
+            for key in stale:
+                del self._entries[key]
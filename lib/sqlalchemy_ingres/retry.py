@@ -0,0 +1,121 @@
+# ingres/retry.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+Retry of transactions aborted by deadlocks and lock timeouts.
+
+When Ingres detects a deadlock it rolls back one of the transactions
+involved; re-running that transaction usually succeeds.  :func:`run_transaction`
+runs a function in a transaction and, if the transaction fails with a
+deadlock or lock timeout (see ``IngresDialect.is_retryable()``), runs it
+again in a new transaction after a randomized, exponentially growing delay:
+
+    def transfer(connection):
+        connection.execute(debit, {"id": 1, "amount": 10})
+        connection.execute(credit, {"id": 2, "amount": 10})
+
+    run_transaction(engine, transfer)
+
+The function must be idempotent apart from its database work, since it may
+run several times.  Defaults can be set as engine execution options:
+
+    engine = engine.execution_options(ingres_retries=8, ingres_retry_backoff=0.1)
+
+Retries and abandoned transactions are counted in :data:`counters`, or in
+the :class:`RetryCounters` passed as ``counters``.
+"""
+
+import functools
+import random
+import threading
+import time
+
+from sqlalchemy import exc
+
+
+class RetryCounters(object):
+    """Thread-safe counts of retried and abandoned transactions"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.transactions = 0
+            self.deadlocks = 0
+            self.lock_timeouts = 0
+            self.retries = 0
+            self.aborted = 0
+
+    def _add(self, **counts):
+        with self._lock:
+            for name, count in counts.items():
+                setattr(self, name, getattr(self, name) + count)
+
+    def as_dict(self):
+        with self._lock:
+            return {
+                "transactions": self.transactions,
+                "deadlocks": self.deadlocks,
+                "lock_timeouts": self.lock_timeouts,
+                "retries": self.retries,
+                "aborted": self.aborted,
+            }
+
+
+counters = RetryCounters()
+_default_counters = counters
+
+
+def run_transaction(engine, fn, retries=None, backoff=None, max_backoff=None, counters=None):
+    """Call ``fn(connection)`` in a transaction, retrying it after deadlocks and lock timeouts.
+
+    Makes up to ``retries`` further attempts, sleeping a random time of up
+    to ``backoff * 2 ** attempt`` seconds (at most ``max_backoff``) before
+    each.  Returns the result of ``fn``; the error of the last attempt, or
+    any error that is not a deadlock or lock timeout, is raised.
+    """
+    options = engine.get_execution_options()
+    if retries is None:
+        retries = options.get("ingres_retries", 5)
+    if backoff is None:
+        backoff = options.get("ingres_retry_backoff", 0.05)
+    if max_backoff is None:
+        max_backoff = options.get("ingres_retry_max_backoff", 2.0)
+    if counters is None:
+        counters = _default_counters
+
+    dialect = engine.dialect
+    counters._add(transactions=1)
+    attempt = 0
+    while True:
+        try:
+            with engine.begin() as connection:
+                return fn(connection)
+        except exc.DBAPIError as err:
+            deadlock = dialect.is_deadlock(err)
+            lock_timeout = not deadlock and dialect.is_lock_timeout(err)
+            counters._add(deadlocks=int(deadlock), lock_timeouts=int(lock_timeout))
+            if not (deadlock or lock_timeout) or attempt >= retries:
+                counters._add(aborted=1)
+                raise
+        attempt += 1
+        counters._add(retries=1)
+        # "full jitter": spreads out the retries of transactions that deadlocked together
+        time.sleep(random.uniform(0, min(max_backoff, backoff * 2 ** (attempt - 1))))
+
+
+def retrying(engine, **kwargs):
+    """Decorator form of :func:`run_transaction`; the decorated function receives the connection first"""
+
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kw):
+            return run_transaction(engine, lambda connection: fn(connection, *args, **kw), **kwargs)
+
+        return wrapper
+
+    return decorate
@@ -0,0 +1,132 @@
+# ingres/spill.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+Buffered results that spill to disk.
+
+A buffered result fetches all of its rows when the statement is executed,
+freeing the cursor before the rows are used.  With the ``ingres_buffer_rows``
+execution option a result is buffered this way, but only that many rows are
+kept in memory; the remainder are written to a temporary file in chunks and
+read back a chunk at a time as the result is iterated:
+
+    with engine.connect() as connection:
+        result = connection.execution_options(ingres_buffer_rows=50000).execute(big_query)
+        for row in result:
+            connection.execute(audit.insert(), {"id": row.id})
+
+Memory use is bounded by the cap plus one chunk, however large the result.
+The temporary file is created in the default temporary directory (see
+``tempfile.gettempdir()``) and removed when the result is closed.
+"""
+
+import collections
+import pickle
+import tempfile
+
+from sqlalchemy.engine import cursor as _cursor
+
+_CHUNK_ROWS = 1000
+
+
+class _SpillBuffer(object):
+    """FIFO of rows holding up to ``limit`` rows in memory and the rest in a temporary file"""
+
+    def __init__(self, limit, chunk_rows=_CHUNK_ROWS):
+        self.limit = limit
+        self.chunk_rows = chunk_rows
+        self._memory = collections.deque()
+        self._pending = []  # rows waiting to be written as one chunk
+        self._file = None
+        self._chunks = 0  # chunks written and not yet read back
+        self._spilled = 0  # rows in the file and _pending
+        self._writing = True
+
+    def append(self, row):
+        if self._file is None and len(self._memory) < self.limit:
+            self._memory.append(row)
+            return
+        # pyodbc rows are stored as plain tuples, which pickle compactly
+        self._pending.append(tuple(row))
+        self._spilled += 1
+        if len(self._pending) >= self.chunk_rows:
+            self._write_chunk()
+
+    def extend(self, rows):
+        for row in rows:
+            self.append(row)
+
+    def _write_chunk(self):
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(prefix="sqlalchemy_ingres_")
+        pickle.dump(self._pending, self._file, pickle.HIGHEST_PROTOCOL)
+        self._pending = []
+        self._chunks += 1
+
+    def _refill(self):
+        """Move the next spilled chunk into memory"""
+        if self._writing:
+            # all rows have been added; switch the file to reading
+            self._writing = False
+            if self._file is not None:
+                self._file.seek(0)
+        if self._chunks:
+            rows = pickle.load(self._file)
+            self._chunks -= 1
+        else:
+            rows, self._pending = self._pending, []
+        self._spilled -= len(rows)
+        self._memory.extend(rows)
+        if not self._spilled:
+            self._close_file()
+
+    def popleft(self):
+        if not self._memory:
+            self._refill()
+        return self._memory.popleft()
+
+    def __len__(self):
+        return len(self._memory) + self._spilled
+
+    def __bool__(self):
+        return bool(self._memory) or self._spilled > 0
+
+    __nonzero__ = __bool__
+
+    def __iter__(self):
+        while self:
+            yield self.popleft()
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._chunks = 0
+
+    def clear(self):
+        self._memory.clear()
+        self._pending = []
+        self._spilled = 0
+        self._close_file()
+
+
+class _SpillingCursorFetchStrategy(_cursor.FullyBufferedCursorFetchStrategy):
+    """Fully buffered fetch strategy keeping at most ``limit`` rows in memory"""
+
+    def __init__(self, dbapi_cursor, limit, alternate_description=None):
+        self.alternate_cursor_description = alternate_description
+        self._rowbuffer = buffer = _SpillBuffer(limit)
+        batch_size = max(getattr(dbapi_cursor, "arraysize", 1) or 1, _CHUNK_ROWS)
+        while True:
+            rows = dbapi_cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            buffer.extend(rows)
+
+    def fetchall(self, result, dbapi_cursor):
+        rows = self._rowbuffer
+        self._rowbuffer = collections.deque()
+        result._soft_close()
+        return list(rows)
@@ -89,6 +89,9 @@ setup(
         "pypyodbc": [
             "pypyodbc",
         ],
+        "parquet": [
+            "pyarrow",
+        ],
         "all": [
             "pypyodbc",
             "pyodbc",
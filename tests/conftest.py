@@ -0,0 +1,32 @@
+# tests/conftest.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+Tests of dialect features that run against the sqlite-backed stand-in
+driver in standin.py, without an Ingres server.  The dialect compliance
+suite against a real server is described in README.testsuite.md.
+
+    pip install -e . pytest
+    python -m pytest tests
+"""
+
+import pytest
+
+import standin
+
+
+@pytest.fixture
+def make_engine(tmp_path):
+    """Factory of engines sharing one stand-in database file"""
+    engines = []
+
+    def make_engine(**kwargs):
+        engine = standin.engine(str(tmp_path / "standin.db"), **kwargs)
+        engines.append(engine)
+        return engine
+
+    yield make_engine
+    for engine in engines:
+        engine.dispose()
@@ -0,0 +1,347 @@
+# tests/standin.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+"""
+sqlite-backed stand-in for an Ingres ODBC connection, for the tests and
+benchmarks that exercise dialect code paths without an Ingres server.
+
+The module is a DBAPI module in its own right and is used by the
+``ingres+standin`` and ``ingres+standin_ingresdbi`` dialects, which are
+:class:`Ingres_pyodbc` and :class:`Ingres_ingresdbi` with this module as
+their driver:
+
+    engine = standin.engine("/tmp/demo.db", latency=0.001)
+
+Just enough of Ingres is emulated for the dialect: transactional DDL,
+``session`` tables (DECLARE GLOBAL TEMPORARY TABLE), ``iidbcapabilities``,
+``iitables`` and ``iicolumns`` kept in step with CREATE / DROP TABLE,
+``dbmsinfo()``, ``last_identity()`` and the ANSI ``SUBSTRING(x FROM y FOR z)``.
+WITH clauses and identity columns are accepted but ignored.
+
+``latency`` (seconds) is added to every round trip to the "server": one per
+execute(), one per executemany() parameter set (all of them in one trip with
+``fast_executemany``) and one per block of fetched rows, of ``arraysize``
+rows or :data:`PREFETCH_ROWS` when arraysize is 1.  :data:`stats` counts the
+round trips and prepared statements.
+"""
+
+import collections
+import math
+import re
+import sqlite3
+import sys
+import threading
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import registry
+from sqlalchemy_ingres.ingresdbi import Ingres_ingresdbi
+from sqlalchemy_ingres.pyodbc import Ingres_pyodbc
+
+apilevel = "2.0"
+threadsafety = 1
+paramstyle = "qmark"
+
+Warning = sqlite3.Warning
+Error = sqlite3.Error
+InterfaceError = sqlite3.InterfaceError
+DatabaseError = sqlite3.DatabaseError
+DataError = sqlite3.DataError
+OperationalError = sqlite3.OperationalError
+IntegrityError = sqlite3.IntegrityError
+InternalError = sqlite3.InternalError
+ProgrammingError = sqlite3.ProgrammingError
+NotSupportedError = sqlite3.NotSupportedError
+
+Binary = bytes
+STRING = "STRING"
+NUMBER = "NUMBER"
+DATETIME = "DATETIME"
+BINARY = "BINARY"
+ROWID = "ROWID"
+
+USER = "testuser"
+
+# rows sent per fetch round trip by the driver when arraysize is 1
+PREFETCH_ROWS = 100
+
+stats = collections.Counter()
+_stats_lock = threading.Lock()
+
+_CATALOG = """
+    CREATE TABLE IF NOT EXISTS iidbcapabilities (cap_capability, cap_value);
+    CREATE TABLE IF NOT EXISTS iitables (
+        table_name, table_owner, table_type, num_rows, number_pages, overflow_pages,
+        storage_structure, phys_partitions, is_journalled, table_stats, table_pagesize, is_compressed
+    );
+    CREATE TABLE IF NOT EXISTS iicolumns (
+        table_name, table_owner, column_name, column_datatype, column_nulls, column_default_val,
+        column_length, column_scale, column_always_ident, column_bydefault_ident, column_sequence, key_sequence
+    );
+    CREATE TABLE IF NOT EXISTS iikeys (constraint_name, table_name, schema_name, column_name, key_position);
+    CREATE TABLE IF NOT EXISTS iiconstraints (constraint_name, constraint_type);
+    CREATE TABLE IF NOT EXISTS iiref_constraints (ref_constraint_name, unique_constraint_name);
+    CREATE TABLE IF NOT EXISTS iiindexes (index_name, index_owner, base_name, unique_rule, system_use);
+    CREATE TABLE IF NOT EXISTS iiindex_columns (index_name, index_owner, column_name, key_sequence);
+    CREATE TABLE IF NOT EXISTS iidb_subcomments (object_name, subobject_name, object_owner, long_remark);
+    CREATE TABLE IF NOT EXISTS iistats (
+        table_name, table_owner, column_name, num_unique, pct_nulls, has_unique, rept_factor, num_cells
+    );
+"""
+
+_REWRITES = [
+    (re.compile(r"^\s*DECLARE GLOBAL TEMPORARY TABLE\b", re.IGNORECASE), "CREATE TABLE"),
+    (re.compile(r"\n(ON COMMIT|WITH) [^\n]*", re.IGNORECASE), ""),
+    (re.compile(r" GENERATED (BY DEFAULT|ALWAYS) AS IDENTITY(\s*\([^)]*\))?", re.IGNORECASE), ""),
+    (re.compile(r"\bSUBSTRING\((.+?) FROM (.+?) FOR (.+?)\)", re.IGNORECASE), r"substr(\1, \2, \3)"),
+    (re.compile(r"\blast_identity\(\)", re.IGNORECASE), "last_insert_rowid()"),
+]
+_DDL = re.compile(r"^\s*(CREATE|DECLARE|DROP)\b", re.IGNORECASE)
+_CREATE_TABLE = re.compile(r'^\s*CREATE TABLE "?(\w+)"?\s*[(]', re.IGNORECASE)
+_DROP_TABLE = re.compile(r'^\s*DROP TABLE "?(\w+)"?\s*$', re.IGNORECASE)
+_TYPE = re.compile(r"^([A-Z ]+?)\s*(?:\((\d+)(?:,\s*(\d+))?\))?$")
+
+
+def _count(name, n=1):
+    with _stats_lock:
+        stats[name] += n
+
+
+def _translate(sql):
+    if _DDL.match(sql):
+        for pattern, replacement in _REWRITES[:3]:
+            sql = pattern.sub(replacement, sql)
+    for pattern, replacement in _REWRITES[3:]:
+        sql = pattern.sub(replacement, sql)
+    return sql
+
+
+def _hash(value):
+    # stable across processes, unlike hash()
+    return sum((i + 1) * ord(c) for i, c in enumerate(str(value))) % 2147483647
+
+
+def _dbmsinfo(request):
+    if request == "username":
+        return USER
+    if request == "session_id":
+        return "%016x" % threading.get_ident()
+    if request.startswith("_"):
+        # session statistics
+        return str(int(time.process_time() * 1000))
+    return ""
+
+
+class Cursor(object):
+    arraysize = 1
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.timeout = connection.timeout
+        self.fast_executemany = False
+        self.inputsizes = None
+        self._cursor = connection._db.cursor()
+        self._statement = None
+        self._buffered = 0
+        self._closed = False
+
+    def _check(self):
+        if self._closed:
+            raise ProgrammingError("Attempt to use a closed cursor.")
+
+    def _prepare(self, sql):
+        if sql != self._statement:
+            # like pyodbc, the statement is prepared again only when the SQL text changes
+            _count("prepares")
+            self._statement = sql
+        self.connection._begin()
+        return _translate(sql)
+
+    def execute(self, sql, params=()):
+        self._check()
+        self.connection._round_trip()
+        self._buffered = 0
+        self._cursor.execute(self._prepare(sql), params)
+        self.connection._catalog(sql)
+        return self
+
+    def executemany(self, sql, seq_of_params):
+        self._check()
+        seq_of_params = list(seq_of_params)
+        self.connection._round_trip(1 if self.fast_executemany else max(len(seq_of_params), 1))
+        self._cursor.executemany(self._prepare(sql), seq_of_params)
+        return self
+
+    def setinputsizes(self, sizes):
+        self.inputsizes = sizes
+
+    def setoutputsize(self, size, column=None):
+        pass
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    def _fetch(self, rows):
+        # rows arrive in blocks, the next block is requested once the last one is used up
+        needed = len(rows) - self._buffered
+        if needed > 0 or not rows and not self._buffered:
+            block = self.arraysize if self.arraysize > 1 else PREFETCH_ROWS
+            trips = max(int(math.ceil(needed / float(block))), 1)
+            self.connection._round_trip(trips)
+            self._buffered = trips * block - max(needed, 0)
+        else:
+            self._buffered -= len(rows)
+        return rows
+
+    def fetchone(self):
+        self._check()
+        row = self._cursor.fetchone()
+        self._fetch([row] if row is not None else [])
+        return row
+
+    def fetchmany(self, size=None):
+        self._check()
+        return self._fetch(self._cursor.fetchmany(self.arraysize if size is None else size))
+
+    def fetchall(self):
+        self._check()
+        return self._fetch(self._cursor.fetchall())
+
+    def cancel(self):
+        self._check()
+        self.connection._db.interrupt()
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            self._cursor.close()
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+
+class Connection(object):
+    def __init__(self, database=":memory:", latency=0.0, **kwargs):
+        self.latency = float(latency)
+        self.timeout = 0
+        self._db = sqlite3.connect(database, timeout=30, isolation_level=None, check_same_thread=False)
+        if database != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("ATTACH DATABASE ':memory:' AS session")
+        self._db.executescript(_CATALOG)
+        if self._db.execute("SELECT count(*) FROM iidbcapabilities").fetchone()[0] == 0:
+            self._db.execute("INSERT INTO iidbcapabilities VALUES ('DBMS_TYPE', 'INGRES')")
+        self._db.create_function("dbmsinfo", 1, _dbmsinfo)
+        self._db.create_function("concat", 2, lambda a, b: None if a is None or b is None else a + b)
+        self._db.create_function("mod", 2, lambda a, b: None if a is None else a % b)
+        self._db.create_function("hash", 1, lambda value: None if value is None else _hash(value))
+        _count("connects")
+
+    def _round_trip(self, n=1):
+        _count("round_trips", n)
+        if self.latency:
+            time.sleep(self.latency * n)
+
+    def _begin(self):
+        # as in Ingres, every statement including DDL runs in a transaction
+        if not self._db.in_transaction:
+            self._db.execute("BEGIN")
+
+    def _catalog(self, sql):
+        """Keep iitables and iicolumns in step with CREATE TABLE / DROP TABLE"""
+        match = _CREATE_TABLE.match(sql)
+        if match:
+            name = match.group(1).lower()
+            self._db.execute(
+                "INSERT INTO iitables VALUES (?, ?, 'T', 0, 1, 0, 'HEAP', 0, 'N', 'N', 8192, 'N')", (name, USER)
+            )
+            for cid, column, declared, notnull, default, pk in self._db.execute('PRAGMA table_info("%s")' % name):
+                type_match = _TYPE.match(declared.upper())
+                datatype, length, scale = type_match.groups() if type_match else (declared.upper(), None, None)
+                if datatype == "BIGINT":
+                    datatype, length = "INTEGER", 8
+                elif datatype == "INTEGER":
+                    length = 4
+                self._db.execute(
+                    "INSERT INTO iicolumns VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'N', 'N', ?, ?)",
+                    (
+                        name,
+                        USER,
+                        column,
+                        datatype,
+                        "N" if notnull else "Y",
+                        default,
+                        int(length or 0),
+                        int(scale or 0),
+                        cid + 1,
+                        pk,
+                    ),
+                )
+            return
+        match = _DROP_TABLE.match(sql)
+        if match:
+            name = match.group(1).lower()
+            self._db.execute("DELETE FROM iitables WHERE table_name = ?", (name,))
+            self._db.execute("DELETE FROM iicolumns WHERE table_name = ?", (name,))
+
+    def cursor(self):
+        return Cursor(self)
+
+    def commit(self):
+        if self._db.in_transaction:
+            self._round_trip()
+            self._db.execute("COMMIT")
+
+    def rollback(self):
+        if self._db.in_transaction:
+            self._round_trip()
+            self._db.execute("ROLLBACK")
+
+    def close(self):
+        self._db.close()
+
+
+def connect(database=":memory:", latency=0.0, **kwargs):
+    return Connection(database, latency, **kwargs)
+
+
+class _StandinDriver(object):
+    supports_statement_cache = False
+
+    @classmethod
+    def import_dbapi(cls):
+        return sys.modules[__name__]
+
+    def create_connect_args(self, url):
+        opts = {"database": url.database or ":memory:"}
+        opts.update(url.query)
+        return [], opts
+
+
+class Ingres_standin(_StandinDriver, Ingres_pyodbc):
+    supports_statement_cache = False
+
+
+class Ingres_standin_ingresdbi(_StandinDriver, Ingres_ingresdbi):
+    supports_statement_cache = False
+
+
+registry.register("ingres.standin", __name__, "Ingres_standin")
+registry.register("ingres.standin_ingresdbi", __name__, "Ingres_standin_ingresdbi")
+# as the package's entry point does, for ingres_ table keyword arguments
+registry.register("ingres", "sqlalchemy_ingres.pyodbc", "Ingres_pyodbc")
+
+
+def engine(database=":memory:", latency=0.0, driver="pyodbc", **kwargs):
+    """Engine for the stand-in database file ``database``, with the pyodbc or ingresdbi connector"""
+    url = "ingres+%s:///%s" % ("standin" if driver == "pyodbc" else "standin_" + driver, database)
+    if latency:
+        url += "?latency=%s" % latency
+    return create_engine(url, **kwargs)
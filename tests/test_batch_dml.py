@@ -0,0 +1,35 @@
+# tests/test_batch_dml.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+from sqlalchemy import Column, Integer, MetaData, Table, event, func, select
+
+COLUMNS = 30
+
+
+def test_insert_pages_stay_within_parameter_limit(make_engine):
+    engine = make_engine(batch_dml=True)
+    table = Table(
+        "wide",
+        MetaData(),
+        Column("id", Integer, primary_key=True, autoincrement=False),
+        *[Column("c%d" % i, Integer) for i in range(COLUMNS - 1)]
+    )
+    table.create(engine)
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT"):
+            statements.append(len(parameters))
+
+    rows = [dict({"id": n}, **{"c%d" % i: n for i in range(COLUMNS - 1)}) for n in range(500)]
+    with engine.begin() as connection:
+        connection.execute(table.insert(), rows)
+        assert connection.execute(select(func.count()).select_from(table)).scalar() == 500
+
+    assert engine.dialect.insertmanyvalues_page_size == 100
+    assert max(statements) <= engine.dialect.insertmanyvalues_max_parameters
+    assert sum(statements) == 500 * COLUMNS
@@ -0,0 +1,55 @@
+# tests/test_bulk.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, exc, func, select
+
+from sqlalchemy_ingres.bulk import bulk_insert
+
+
+def _table(engine):
+    table = Table("bulk", MetaData(), Column("id", Integer, primary_key=True, autoincrement=False), Column("v", String(10)))
+    table.create(engine)
+    return table
+
+
+def _count(engine, table):
+    with engine.connect() as connection:
+        return connection.execute(select(func.count()).select_from(table)).scalar()
+
+
+def test_commit_every(make_engine):
+    engine = make_engine()
+    table = _table(engine)
+    progress = []
+    with engine.connect() as connection:
+        rows = ((i, str(i)) for i in range(25))
+        assert bulk_insert(connection, table, rows, batch_size=4, commit_every=2, progress=progress.append) == 25
+        assert not connection.in_transaction()
+    assert _count(engine, table) == 25
+    assert [p.rows for p in progress][-2:] == [24, 25]
+
+
+def test_commit_every_rolls_back_failed_transaction(make_engine):
+    engine = make_engine()
+    table = _table(engine)
+    with engine.connect() as connection:
+        rows = [(i, str(i)) for i in range(10)] + [(0, "duplicate")]
+        with pytest.raises(exc.IntegrityError):
+            bulk_insert(connection, table, rows, batch_size=3, commit_every=2)
+        assert not connection.in_transaction()
+    # batches 1-2 were committed, batches 3-4 rolled back
+    assert _count(engine, table) == 6
+
+
+def test_caller_transaction(make_engine):
+    engine = make_engine()
+    table = _table(engine)
+    with engine.begin() as connection:
+        assert bulk_insert(connection, table, [{"id": 1, "v": "a"}, {"id": 2, "v": "b"}]) == 2
+        with pytest.raises(exc.ArgumentError):
+            bulk_insert(connection, table, [(3, "c")], commit_every=1)
+    assert _count(engine, table) == 2
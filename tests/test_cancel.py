@@ -0,0 +1,71 @@
+# tests/test_cancel.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+import threading
+import time
+
+import pytest
+from sqlalchemy import exc, text
+
+from sqlalchemy_ingres.cancel import cancel
+
+# runs for minutes unless cancelled
+SLOW_QUERY = "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c LIMIT 1000000000) SELECT max(x) FROM c"
+
+
+def test_timeout_cursor(make_engine):
+    engine = make_engine(cursor_cache_size=4)
+    with engine.connect() as connection:
+        result = connection.execution_options(ingres_timeout=2.5).execute(text("SELECT 1"))
+        assert result.context.cursor.timeout == 3
+        assert connection.connection.dbapi_connection.timeout == 0
+
+
+def test_timeout_needs_pyodbc(make_engine):
+    engine = make_engine(driver="ingresdbi")
+    with engine.connect() as connection:
+        with pytest.raises(exc.ArgumentError, match="ingres_timeout"):
+            connection.execution_options(ingres_timeout=5)
+        with pytest.raises(exc.StatementError, match="ingres_timeout") as raised:
+            connection.execute(text("SELECT 1").execution_options(ingres_timeout=5))
+        assert isinstance(raised.value.orig, exc.ArgumentError)
+
+
+def test_finished_statements_are_not_cancelled(make_engine):
+    engine = make_engine()
+    with engine.connect() as connection:
+        assert not cancel(connection)
+        connection.exec_driver_sql("CREATE TABLE t (id INTEGER)")
+        assert "ingres_active_cursor" not in connection.info
+
+        result = connection.exec_driver_sql("SELECT 1 UNION ALL SELECT 2")
+        assert connection.info["ingres_active_cursor"] is not None
+        result.fetchall()
+        # the exhausted result closed its cursor
+        assert not cancel(connection)
+
+        connection.exec_driver_sql("SELECT 1")
+        connection.commit()
+        assert "ingres_active_cursor" not in connection.info
+
+
+def test_cancel_from_another_thread(make_engine):
+    engine = make_engine()
+    with engine.connect() as connection:
+        cancelled = []
+        timer = threading.Timer(0.2, lambda: cancelled.append(cancel(connection)))
+        timer.start()
+        start = time.time()
+        try:
+            with pytest.raises(exc.DBAPIError, match="interrupted"):
+                connection.exec_driver_sql(SLOW_QUERY).scalar()
+        finally:
+            timer.cancel()
+        assert cancelled == [True]
+        assert time.time() - start < 10
+        connection.rollback()
+        # the connection is usable again
+        assert connection.exec_driver_sql("SELECT 1").scalar() == 1
@@ -0,0 +1,44 @@
+# tests/test_concurrency.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import text
+
+THREADS = 64
+
+
+def _together(fn):
+    barrier = threading.Barrier(THREADS)
+
+    def run(i):
+        barrier.wait()
+        return fn(i)
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        return list(pool.map(run, range(THREADS)))
+
+
+def test_concurrent_first_connect(make_engine):
+    engine = make_engine(pool_size=THREADS, max_overflow=0)
+
+    def first_connect(i):
+        with engine.connect() as connection:
+            return dict(connection.dialect.iidbcapabilities)
+
+    assert all(capabilities == {"DBMS_TYPE": "INGRES"} for capabilities in _together(first_connect))
+
+
+def test_concurrent_cursor_cache(make_engine):
+    engine = make_engine(pool_size=8, max_overflow=0, cursor_cache_size=4)
+    statements = [text("SELECT %d" % i) for i in range(6)]
+
+    def work(i):
+        with engine.connect() as connection:
+            return [connection.execute(statements[(i + j) % 6]).scalar() for j in range(30)]
+
+    assert _together(work) == [[(i + j) % 6 for j in range(30)] for i in range(THREADS)]
@@ -0,0 +1,65 @@
+# tests/test_ctas.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, select
+
+from sqlalchemy_ingres import create_table_as
+
+
+def _sales(engine):
+    sales = Table("sales", MetaData(), Column("id", Integer), Column("year", Integer), Column("region", String(10)))
+    sales.create(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            sales.insert(), [{"id": i, "year": 2020 + i % 5, "region": "r%d" % (i % 3)} for i in range(50)]
+        )
+    return sales
+
+
+def test_with_clause(make_engine):
+    engine = make_engine()
+    sales = Table("sales", MetaData(), Column("id", Integer), Column("year", Integer))
+    stmt = create_table_as(
+        "sales_2024",
+        select(sales),
+        columns=["sale_id", "sale_year"],
+        ingres_structure="BTREE",
+        ingres_structure_keys=["sale_id"],
+        ingres_structure_key_unique=True,
+        ingres_nojournaling=True,
+    )
+    sql = str(stmt.compile(dialect=engine.dialect))
+    assert sql.startswith("\nCREATE TABLE sales_2024 (sale_id, sale_year) AS\nSELECT sales.id, sales.year")
+    assert sql.endswith("WITH STRUCTURE=BTREE, KEY=(sale_id), UNIQUE, NOJOURNALING")
+
+
+def test_bound_parameters_are_kept(make_engine):
+    engine = make_engine()
+    sales = _sales(engine)
+    query = select(sales).where(sales.c.year == 2024).where(sales.c.region.in_(["r1", "r2"]))
+    stmt = create_table_as("recent_sales", query)
+    sql = str(stmt.compile(dialect=engine.dialect))
+    assert sql.endswith("WHERE sales.year = ? AND sales.region IN (?, ?)")
+
+    with engine.begin() as connection:
+        result = connection.execute(stmt)
+        assert list(result.context.parameters[0]) == [2024, "r1", "r2"]
+        rows = connection.execute(select(stmt.table).order_by(stmt.table.c.id)).all()
+    assert [row.id for row in rows] == [i for i in range(50) if i % 5 == 4 and i % 3 in (1, 2)]
+
+
+def test_session_table(make_engine):
+    engine = make_engine()
+    sales = _sales(engine)
+    stmt = create_table_as("recent", select(sales.c.id, sales.c.year).where(sales.c.year > 2022), ingres_temporary=True)
+    assert stmt.table.schema == "session"
+    sql = str(stmt.compile(dialect=engine.dialect))
+    assert sql.startswith("\nDECLARE GLOBAL TEMPORARY TABLE session.recent AS\nSELECT")
+    assert "ON COMMIT PRESERVE ROWS\nWITH NORECOVERY" in sql
+
+    with engine.connect() as connection:
+        connection.execute(stmt)
+        assert len(connection.execute(select(stmt.table.c.id)).all()) == 20
@@ -0,0 +1,69 @@
+# tests/test_cursor_cache.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+from sqlalchemy import text
+
+import standin
+
+
+def _cache(connection):
+    return connection.connection.info["ingres_cursor_cache"]
+
+
+def test_reuse(make_engine):
+    engine = make_engine(cursor_cache_size=5)
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1")).all()
+        standin.stats.clear()
+        for _ in range(3):
+            assert connection.execute(text("SELECT 1")).scalar() == 1
+        assert standin.stats["prepares"] == 0
+
+        # bypassing the cache prepares on a fresh cursor
+        connection.execution_options(ingres_cursor_cache=False).execute(text("SELECT 1")).all()
+        assert standin.stats["prepares"] == 1
+
+
+def test_eviction_at_cursor_cache_size(make_engine):
+    engine = make_engine(cursor_cache_size=2)
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1")).all()
+        first = _cache(connection)._idle["SELECT 1"]
+        connection.execute(text("SELECT 2")).all()
+        connection.execute(text("SELECT 3")).all()
+
+        assert list(_cache(connection)._idle) == ["SELECT 2", "SELECT 3"]
+        assert first._closed
+
+        standin.stats.clear()
+        connection.execute(text("SELECT 1")).all()
+        assert standin.stats["prepares"] == 1
+        assert list(_cache(connection)._idle) == ["SELECT 3", "SELECT 1"]
+
+
+def test_cursors_closed_on_connection_close(make_engine):
+    engine = make_engine(cursor_cache_size=5)
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1")).all()
+        cursors = list(_cache(connection)._idle.values())
+    assert not cursors[0]._closed
+
+    engine.dispose()
+    assert cursors[0]._closed
+
+
+def test_cursors_closed_on_invalidate(make_engine):
+    engine = make_engine(cursor_cache_size=5)
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1")).all()
+        record = connection.connection._connection_record
+        cursors = list(_cache(connection)._idle.values())
+        connection.invalidate()
+    assert cursors[0]._closed
+    assert "ingres_cursor_cache" not in record.info
+
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT 1")).scalar() == 1
@@ -0,0 +1,78 @@
+# tests/test_drivers.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, event, select
+
+import standin
+
+# as compared by bench/bench_drivers.py
+CONFIGURATIONS = [
+    ("pyodbc", {}),
+    ("pyodbc", {"fast_executemany": True}),
+    ("ingresdbi", {}),
+    ("ingresdbi", {"arraysize": 1000, "setinputsizes": True, "batch_dml": True}),
+]
+
+
+def _workload(engine, rows=2000):
+    items = Table(
+        "items",
+        MetaData(),
+        Column("id", Integer, primary_key=True, autoincrement=False),
+        Column("name", String(40)),
+        Column("qty", Integer),
+    )
+    items.create(engine)
+    trips = {}
+    standin.stats.clear()
+    with engine.begin() as connection:
+        connection.execute(items.insert(), [{"id": i, "name": "item %d" % i, "qty": i % 7} for i in range(rows)])
+    trips["insert"] = standin.stats["round_trips"]
+    standin.stats.clear()
+    with engine.connect() as connection:
+        selected = [tuple(row) for row in connection.execute(select(items).order_by(items.c.id))]
+    trips["select"] = standin.stats["round_trips"]
+    return selected, trips
+
+
+@pytest.mark.parametrize("driver, kwargs", CONFIGURATIONS)
+def test_same_results(make_engine, driver, kwargs):
+    selected, _ = _workload(make_engine(driver=driver, **kwargs))
+    assert selected == [(i, "item %d" % i, i % 7) for i in range(2000)]
+
+
+@pytest.mark.parametrize("driver", ["pyodbc", "ingresdbi"])
+def test_tuned_settings_take_fewer_round_trips(tmp_path, driver):
+    configurations = [kwargs for name, kwargs in CONFIGURATIONS if name == driver]
+    trips = []
+    for i, kwargs in enumerate(configurations):
+        engine = standin.engine(str(tmp_path / ("%s-%d.db" % (driver, i))), driver=driver, **kwargs)
+        trips.append(_workload(engine)[1])
+        engine.dispose()
+    default, tuned = trips
+    assert tuned["insert"] < default["insert"] / 10
+    if driver == "ingresdbi":
+        assert tuned["select"] < default["select"]
+
+
+def test_ingresdbi_cursor_settings(make_engine):
+    engine = make_engine(driver="ingresdbi", arraysize=500, setinputsizes=True)
+    items = Table("items", MetaData(), Column("id", Integer), Column("name", String(10)))
+    items.create(engine)
+    cursors = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        cursors.append(cursor)
+
+    with engine.connect() as connection:
+        connection.execute(items.insert(), {"id": 1, "name": "a"})
+        assert cursors[-1].arraysize == 500
+        assert len(cursors[-1].inputsizes) == 2
+
+        connection.execution_options(ingres_arraysize=20).execute(select(items)).all()
+        assert cursors[-1].arraysize == 20
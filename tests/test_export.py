@@ -0,0 +1,66 @@
+# tests/test_export.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+import decimal
+import os
+
+import pytest
+from sqlalchemy import DECIMAL, Column, Integer, MetaData, String, Table
+
+from sqlalchemy_ingres.base import ischema_names
+from sqlalchemy_ingres.export import to_parquet
+
+pa = pytest.importorskip("pyarrow")
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def test_parquet_rolls_over_at_max_file_size(make_engine, tmp_path):
+    engine = make_engine()
+    table = Table("exported", MetaData(), Column("id", Integer), Column("name", String(40)))
+    table.create(engine)
+    with engine.begin() as connection:
+        connection.execute(table.insert(), [{"id": i, "name": "row %d" % i} for i in range(5000)])
+
+    with engine.connect() as connection:
+        one = to_parquet(connection, table, str(tmp_path / "one.parquet"), batch_size=500, compression=None)
+        batch_bytes = os.path.getsize(one[0]) / 10.0
+        max_file_size = int(batch_bytes * 3)
+        paths = to_parquet(
+            connection, table, str(tmp_path / "part.parquet"), batch_size=500, max_file_size=max_file_size, compression=None
+        )
+
+    assert len(paths) > 1
+    assert sum(pq.read_metadata(path).num_rows for path in paths) == 5000
+    for path in paths:
+        # a file is closed once the batch reaching the limit has been written
+        assert os.path.getsize(path) < max_file_size + 2 * batch_bytes
+
+
+def test_wide_decimals_and_year_to_month_intervals(make_engine, tmp_path):
+    engine = make_engine()
+    Table("spans", MetaData(), Column("id", Integer), Column("span", String(10))).create(engine)
+    with engine.begin() as connection:
+        connection.exec_driver_sql("INSERT INTO spans VALUES (1, '1-02'), (2, '-0-03'), (3, NULL)")
+    # as reflected from the catalogs
+    spans = Table("spans", MetaData(), Column("id", Integer), Column("span", ischema_names["INTERVAL YEAR TO MONTH"]))
+    amounts = Table("amounts", MetaData(), Column("narrow", DECIMAL(38, 2)), Column("wide", DECIMAL(39, 2)))
+    amounts.create(engine)
+    with engine.begin() as connection:
+        connection.execute(amounts.insert(), [{"narrow": decimal.Decimal("1.25"), "wide": decimal.Decimal("2.50")}])
+
+    with engine.connect() as connection:
+        [spans_path] = to_parquet(connection, spans.select().order_by(spans.c.id), str(tmp_path / "spans.parquet"))
+        [amounts_path] = to_parquet(connection, amounts, str(tmp_path / "amounts.parquet"))
+
+    table = pq.read_table(spans_path)
+    assert table.schema.field("span").type == pa.int32()
+    assert table.column("span").to_pylist() == [14, -3, None]
+
+    table = pq.read_table(amounts_path)
+    assert table.schema.field("narrow").type == pa.decimal128(38, 2)
+    assert table.schema.field("wide").type == pa.decimal256(39, 2)
+    assert table.column("wide").to_pylist() == [decimal.Decimal("2.50")]
@@ -0,0 +1,45 @@
+# tests/test_extract.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, event, func, select
+
+from sqlalchemy_ingres.extract import partitioned_extract, split_partitions
+
+
+@pytest.mark.parametrize("key", ["id", "code"])
+def test_partitions_cover_null_keys(make_engine, key):
+    engine = make_engine()
+    table = Table("parts", MetaData(), Column("id", Integer), Column("code", String(10)))
+    table.create(engine)
+    rows = [{"id": i, "code": "c%d" % i} for i in range(100)] + [{"id": None, "code": None}] * 3
+    with engine.begin() as connection:
+        connection.execute(table.insert(), rows)
+        criteria = split_partitions(connection, table, key=table.c[key], partitions=4)
+        assert len(criteria) == 4
+        counts = [connection.execute(select(func.count()).select_from(table).where(c)).scalar() for c in criteria]
+        assert sum(counts) == len(rows)
+
+
+def _estimate(engine, table, rows):
+    with engine.begin() as connection:
+        connection.exec_driver_sql("UPDATE iitables SET num_rows = ? WHERE table_name = ?", (rows, table.name))
+
+
+@pytest.mark.parametrize("estimate, rows_per_partition, slices", [(10, 1000000, 1), (1000, 250, 4)])
+def test_estimate_drives_partition_count(make_engine, estimate, rows_per_partition, slices):
+    engine = make_engine()
+    table = Table("parts", MetaData(), Column("id", Integer, primary_key=True, autoincrement=False))
+    table.create(engine)
+    with engine.begin() as connection:
+        connection.execute(table.insert(), [{"id": i} for i in range(estimate)])
+    _estimate(engine, table, estimate)
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+    batches = list(partitioned_extract(engine, table, workers=8, rows_per_partition=rows_per_partition))
+    assert sorted(row.id for batch in batches for row in batch) == list(range(estimate))
+    assert len([s for s in statements if s.startswith("SELECT parts.id")]) == slices
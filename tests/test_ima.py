@@ -0,0 +1,76 @@
+# tests/test_ima.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+from sqlalchemy import text
+
+from sqlalchemy_ingres.ima import DBMSINFO_COUNTERS, SessionMonitor, session_id
+
+
+def _lock_lists(engine):
+    # stands in for the IMA table registered in the database
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "CREATE TABLE ima_locklist_info (locklist_session_id, locklist_lock_count, locklist_logical_count)"
+        )
+
+
+def _hold_locks(connection, locks):
+    connection.exec_driver_sql("DELETE FROM ima_locklist_info")
+    connection.exec_driver_sql("INSERT INTO ima_locklist_info VALUES (?, ?, 1)", (session_id(connection), locks))
+
+
+def test_dbmsinfo_counters(make_engine):
+    engine = make_engine()
+    usages = []
+    monitor = SessionMonitor(reporter=usages.append)
+    with engine.connect() as connection:
+        for _ in range(2):
+            with monitor.measure(connection, "work"):
+                connection.execute(text("SELECT 1")).scalar()
+        assert usages[0].session_id == session_id(connection)
+    assert [usage.label for usage in usages] == ["work", "work"]
+    assert list(usages[0].counters) == list(DBMSINFO_COUNTERS)
+    assert monitor.totals["work"].count == 2
+    assert "work" in monitor.report()
+
+
+def test_lock_usage(make_engine):
+    engine = make_engine()
+    _lock_lists(engine)
+    monitor = SessionMonitor(counters={}, locks=True)
+    with engine.connect() as connection:
+        _hold_locks(connection, 3)
+        with monitor.measure(connection, "update") as measured:
+            _hold_locks(connection, 12)
+        # locks held at the end of the block, not the difference
+        assert measured.usage.counters == {"lock_lists": 1, "locks": 12, "logical_locks": 1}
+        with monitor.measure(connection, "update"):
+            _hold_locks(connection, 5)
+    assert monitor.totals["update"].counters["locks"] == 12
+
+
+def test_ima_query_and_gauges(make_engine):
+    engine = make_engine()
+    _lock_lists(engine)
+    query = "SELECT SUM(locklist_lock_count) AS acquired FROM ima_locklist_info WHERE locklist_session_id = :session_id"
+    monitor = SessionMonitor(counters={}, ima_query=query)
+    held = SessionMonitor(counters={}, ima_query=query, gauges=["acquired"])
+    with engine.connect() as connection:
+        _hold_locks(connection, 3)
+        with monitor.measure(connection, "batch") as measured, held.measure(connection, "batch") as measured_held:
+            _hold_locks(connection, 10)
+    assert measured.usage.counters == {"acquired": 7}
+    assert measured_held.usage.counters == {"acquired": 10}
+
+
+def test_sampling(make_engine):
+    engine = make_engine()
+    monitor = SessionMonitor(sample_rate=0.0)
+    with engine.connect() as connection:
+        with monitor.measure(connection, "skipped") as measured:
+            pass
+    assert measured.usage is None
+    assert not monitor.totals
@@ -0,0 +1,73 @@
+# tests/test_inlists.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, select
+
+import standin
+
+
+def _table(engine):
+    table = Table("items", MetaData(), Column("id", Integer), Column("code", String(10)))
+    table.create(engine)
+    with engine.begin() as connection:
+        connection.execute(table.insert(), [{"id": i, "code": "c%d" % i} for i in range(100)])
+    return table
+
+
+def _declared(connection):
+    return connection.connection.info.get("ingres_inlist_tables", {})
+
+
+def test_threshold(make_engine):
+    engine = make_engine(inlist_threshold=3)
+    table = _table(engine)
+    with engine.connect() as connection:
+        short = select(table.c.id).where(table.c.id.in_([1, 2, 3]))
+        assert "session.ingres_inlist" not in str(short.compile(connection))
+        assert connection.execute(short.order_by(table.c.id)).scalars().all() == [1, 2, 3]
+        assert not _declared(connection)
+
+        query = select(table.c.id).where(table.c.id.in_([4, 5, 6, 7])).order_by(table.c.id)
+        assert connection.execute(query).scalars().all() == [4, 5, 6, 7]
+        assert list(_declared(connection)) == ["ingres_inlist_0"]
+
+
+@pytest.mark.parametrize("driver", ["pyodbc", "ingresdbi"])
+def test_values_are_loaded_in_few_round_trips(make_engine, driver):
+    engine = make_engine(inlist_threshold=100, driver=driver)
+    table = _table(engine)
+    with engine.connect() as connection:
+        trips = standin.stats["round_trips"]
+        ids = connection.execute(select(table.c.id).where(table.c.id.in_(range(5000)))).scalars().all()
+        assert sorted(ids) == list(range(100))
+        assert standin.stats["round_trips"] - trips < 15
+
+
+def test_changed_column_type(make_engine):
+    engine = make_engine(inlist_threshold=3)
+    table = _table(engine)
+    with engine.connect() as connection:
+        assert len(connection.execute(select(table.c.id).where(table.c.id.in_(range(10)))).all()) == 10
+        assert "INTEGER" in _declared(connection)["ingres_inlist_0"]
+
+        codes = ["c1", "c2", "c3", "c4", "none"]
+        query = select(table.c.id).where(table.c.code.in_(codes)).order_by(table.c.id)
+        assert connection.execute(query).scalars().all() == [1, 2, 3, 4]
+        assert "VARCHAR(10)" in _declared(connection)["ingres_inlist_0"]
+
+
+def test_reuse_after_rollback(make_engine):
+    engine = make_engine(inlist_threshold=3)
+    table = _table(engine)
+    with engine.connect() as connection:
+        # the session table is declared in this transaction, and the declaration rolled back
+        assert len(connection.execute(select(table.c.id).where(table.c.id.in_(range(5)))).all()) == 5
+        connection.rollback()
+        assert len(connection.execute(select(table.c.id).where(table.c.id.in_(range(8)))).all()) == 8
+        connection.commit()
+        # declared and committed: emptied and reused
+        assert len(connection.execute(select(table.c.id).where(table.c.id.in_(range(4)))).all()) == 4
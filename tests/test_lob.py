@@ -0,0 +1,33 @@
+# tests/test_lob.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+from sqlalchemy import Column, Integer, LargeBinary, MetaData, Table, func, select
+
+from sqlalchemy_ingres.lob import open_lob, write_lob
+
+
+def test_chunked_round_trip(make_engine):
+    engine = make_engine()
+    documents = Table(
+        "documents", MetaData(), Column("id", Integer, primary_key=True, autoincrement=False), Column("body", LargeBinary)
+    )
+    documents.create(engine)
+    value = bytes(range(256)) * 40
+    with engine.begin() as connection:
+        connection.execute(documents.insert(), {"id": 1, "body": None})
+        assert write_lob(connection, documents.c.body, documents.c.id == 1, value, chunk_size=1000) == len(value)
+        with open_lob(connection, documents.c.body, documents.c.id == 1, chunk_size=700) as lob:
+            assert len(lob) == len(value)
+            assert b"".join(lob) == value
+            lob.seek(5000)
+            assert lob.read(10) == value[5000:5010]
+
+
+def test_substring_function_is_not_rewritten(make_engine):
+    # only the LOB helpers use the SUBSTRING(x FROM y FOR z) form
+    documents = Table("documents", MetaData(), Column("body", LargeBinary))
+    sql = str(select(func.substring(documents.c.body, 1, 2)).compile(dialect=make_engine().dialect))
+    assert "substring(documents.body, ?, ?)" in sql
@@ -0,0 +1,28 @@
+# tests/test_merge.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, Text, Unicode
+
+from sqlalchemy_ingres import merge
+from sqlalchemy_ingres.base import IngresDialect
+
+
+def test_from_parameters_casts_strings_with_length():
+    accounts = Table(
+        "accounts",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("code", String(3)),
+        Column("name", String()),
+        Column("title", Unicode()),
+        Column("notes", Text()),
+    )
+    sql = str(merge(accounts).from_parameters().compile(dialect=IngresDialect()))
+    assert "CAST(? AS INTEGER) AS id" in sql
+    assert "CAST(? AS VARCHAR(3)) AS code" in sql
+    assert "CAST(? AS VARCHAR(32000)) AS name" in sql
+    assert "CAST(? AS NVARCHAR(16000)) AS title" in sql
+    assert "CAST(? AS LONG VARCHAR) AS notes" in sql
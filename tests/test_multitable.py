@@ -0,0 +1,49 @@
+# tests/test_multitable.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+from sqlalchemy import Column, Integer, MetaData, Table, select
+
+metadata = MetaData()
+t1 = Table("t1", metadata, Column("id", Integer), Column("x", Integer))
+t2 = Table("t2", metadata, Column("id", Integer), Column("y", Integer))
+t3 = Table("t3", metadata, Column("id", Integer), Column("z", Integer))
+
+
+def _sql(stmt, dialect):
+    return " ".join(str(stmt.compile(dialect=dialect)).split())
+
+
+def test_update_from(make_engine):
+    dialect = make_engine().dialect
+    stmt = t1.update().where(t1.c.id == t2.c.id).values(x=t2.c.y)
+    assert _sql(stmt, dialect) == "UPDATE t1 FROM t2 SET x=t2.y WHERE t1.id = t2.id"
+
+    stmt = t1.update().where(t1.c.id == t2.c.id).where(t2.c.id == t3.c.id).where(t3.c.z > 5).values(x=t3.c.z)
+    assert _sql(stmt, dialect) == (
+        "UPDATE t1 FROM t2, t3 SET x=t3.z WHERE t1.id = t2.id AND t2.id = t3.id AND t3.z > ?"
+    )
+
+    # single-table UPDATE is unchanged
+    assert _sql(t1.update().where(t1.c.id == 1).values(x=2), dialect) == "UPDATE t1 SET x=? WHERE t1.id = ?"
+
+
+def test_delete_exists(make_engine):
+    dialect = make_engine().dialect
+    stmt = t1.delete().where(t1.c.id == t2.c.id).where(t2.c.y > 5)
+    assert _sql(stmt, dialect) == "DELETE FROM t1 WHERE EXISTS (SELECT 1 FROM t2 WHERE t1.id = t2.id AND t2.y > ?)"
+
+    assert _sql(t1.delete().where(t1.c.id == 1), dialect) == "DELETE FROM t1 WHERE t1.id = ?"
+
+
+def test_delete_exists_runs(make_engine):
+    engine = make_engine()
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(t1.insert(), [{"id": i, "x": i} for i in range(10)])
+        connection.execute(t2.insert(), [{"id": i, "y": i % 3} for i in range(0, 10, 2)])
+        result = connection.execute(t1.delete().where(t1.c.id == t2.c.id).where(t2.c.y > 0))
+        assert result.rowcount == 3
+        assert connection.execute(select(t1.c.id).order_by(t1.c.id)).scalars().all() == [0, 1, 3, 5, 6, 7, 9]
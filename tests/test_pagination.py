@@ -0,0 +1,99 @@
+# tests/test_pagination.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, exc, select
+
+import standin
+from sqlalchemy_ingres.pagination import fetch_page, iter_pages
+
+ROWS = [{"region": r, "seq": s, "name": "%d-%d" % (r, s)} for r in range(4) for s in range(5)]
+
+
+def _table(engine, primary_key=True):
+    table = Table(
+        "events",
+        MetaData(),
+        Column("region", Integer, primary_key=primary_key, autoincrement=False),
+        Column("seq", Integer, primary_key=primary_key, autoincrement=False),
+        Column("name", String(10)),
+    )
+    table.create(engine)
+    with engine.begin() as connection:
+        connection.execute(table.insert(), ROWS)
+    return table
+
+
+def _keys(rows):
+    return [(row.region, row.seq) for row in rows]
+
+
+def test_composite_declared_key(make_engine):
+    engine = make_engine()
+    table = _table(engine)
+    with engine.connect() as connection:
+        # the key is declared in MetaData only, the catalogs have none
+        rows, key = fetch_page(connection, select(table), page_size=6)
+        assert _keys(rows) == [(0, 0), (0, 1), (0, 2), (0, 3), (0, 4), (1, 0)]
+        assert key == (1, 0)
+        rows, key = fetch_page(connection, select(table), page_size=6, after=key)
+        assert _keys(rows) == [(1, 1), (1, 2), (1, 3), (1, 4), (2, 0), (2, 1)]
+
+        pages = list(iter_pages(connection, select(table), page_size=6))
+        assert [len(page) for page in pages] == [6, 6, 6, 2]
+        assert [key for page in pages for key in _keys(page)] == [(row["region"], row["seq"]) for row in ROWS]
+
+
+def test_descending_order(make_engine):
+    engine = make_engine()
+    table = _table(engine)
+    order_by = [table.c.region.desc(), table.c.seq]
+    with engine.connect() as connection:
+        rows, key = fetch_page(connection, select(table), order_by=order_by, page_size=3, after=(3, 3))
+        assert _keys(rows) == [(3, 4), (2, 0), (2, 1)]
+        assert key == (2, 1)
+
+
+def test_statement_order_by_is_replaced(make_engine):
+    engine = make_engine()
+    table = _table(engine)
+    with engine.connect() as connection:
+        stmt = select(table).order_by(table.c.region.desc(), table.c.seq.desc())
+        rows, key = fetch_page(connection, stmt, page_size=2)
+        assert _keys(rows) == [(3, 4), (3, 3)]
+        rows, _ = fetch_page(connection, stmt, page_size=2, after=key)
+        assert _keys(rows) == [(3, 2), (3, 1)]
+
+        rows, _ = fetch_page(connection, stmt, order_by=[table.c.region, table.c.seq], page_size=2)
+        assert _keys(rows) == [(0, 0), (0, 1)]
+
+
+def test_reflected_key_is_looked_up_once(make_engine):
+    engine = make_engine()
+    table = _table(engine, primary_key=False)
+    with engine.begin() as connection:
+        connection.exec_driver_sql("INSERT INTO iiconstraints VALUES ('events_pk', 'P')")
+        for position, column in enumerate(["region", "seq"], 1):
+            connection.exec_driver_sql(
+                "INSERT INTO iikeys VALUES ('events_pk', 'events', NULL, ?, ?)", (column, position)
+            )
+    with engine.connect() as connection:
+        rows, key = fetch_page(connection, select(table), page_size=3)
+        assert _keys(rows) == [(0, 0), (0, 1), (0, 2)]
+        trips = standin.stats["round_trips"]
+        fetch_page(connection, select(table), page_size=3, after=key)
+        # one execute and one fetch, no reflection
+        assert standin.stats["round_trips"] - trips == 2
+
+
+def test_no_key(make_engine):
+    engine = make_engine()
+    table = _table(engine, primary_key=False)
+    with engine.connect() as connection:
+        with pytest.raises(exc.ArgumentError, match="no primary key or unique index"):
+            fetch_page(connection, select(table))
+        with pytest.raises(exc.ArgumentError, match="order_by is required"):
+            fetch_page(connection, select(table.c.name, Table("other", MetaData(), Column("x", Integer)).c.x))
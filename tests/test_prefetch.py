@@ -0,0 +1,79 @@
+# tests/test_prefetch.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+import threading
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, exc, func, select
+
+import standin
+from sqlalchemy_ingres.prefetch import _PrefetchCursorFetchStrategy
+
+
+def _table(engine, rows=5000):
+    table = Table("big", MetaData(), Column("id", Integer))
+    table.create(engine)
+    with engine.begin() as connection:
+        connection.execute(table.insert(), [{"id": i} for i in range(rows)])
+    return table
+
+
+def _prefetch_threads():
+    return [thread for thread in threading.enumerate() if thread.name == "ingres-prefetch"]
+
+
+def test_rows_are_fetched_in_the_background(make_engine):
+    engine = make_engine()
+    table = _table(engine)
+    with engine.connect() as connection:
+        options = {"ingres_prefetch": 2, "ingres_prefetch_rows": 300}
+        result = connection.execution_options(**options).execute(select(table.c.id).order_by(table.c.id))
+        strategy = result.cursor_strategy
+        assert isinstance(strategy, _PrefetchCursorFetchStrategy)
+        assert strategy._thread.is_alive() or strategy._rowsets.qsize()
+
+        assert result.fetchone().id == 0
+        assert [row.id for row in result.fetchmany(500)] == list(range(1, 501))
+        assert [row.id for row in result] == list(range(501, 5000))
+        assert not strategy._thread.is_alive()
+    assert not _prefetch_threads()
+
+
+def test_early_close_stops_the_thread(make_engine):
+    engine = make_engine()
+    table = _table(engine)
+    with engine.connect() as connection:
+        result = connection.execution_options(ingres_prefetch=1, ingres_prefetch_rows=100).execute(select(table))
+        thread = result.cursor_strategy._thread
+        assert len(result.fetchmany(10)) == 10
+        # the queue is full, so the thread waits to hand over its next rowset
+        result.close()
+        assert not thread.is_alive()
+
+        # the connection can be used once the result is closed
+        assert connection.execute(select(func.count()).select_from(table)).scalar() == 5000
+    assert not _prefetch_threads()
+
+
+def test_fetch_errors_are_raised_in_the_application_thread(make_engine, monkeypatch):
+    engine = make_engine()
+    table = _table(engine)
+    fetchmany = standin.Cursor.fetchmany
+    calls = []
+
+    def failing_fetchmany(self, *args):
+        calls.append(threading.current_thread().name)
+        if len(calls) > 2:
+            raise standin.OperationalError("HY000", "connection lost")
+        return fetchmany(self, *args)
+
+    monkeypatch.setattr(standin.Cursor, "fetchmany", failing_fetchmany)
+    with engine.connect() as connection:
+        result = connection.execution_options(ingres_prefetch=1, ingres_prefetch_rows=100).execute(select(table))
+        with pytest.raises(exc.OperationalError, match="connection lost"):
+            result.fetchall()
+    assert set(calls) == {"ingres-prefetch"}
+    assert not _prefetch_threads()
@@ -0,0 +1,96 @@
+# tests/test_profiling.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+import sys
+
+from sqlalchemy import Column, Integer, MetaData, Table, select, text
+
+from sqlalchemy_ingres.profiling import Profiler
+
+SLOW_QUERY = text(
+    "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 200000) SELECT count(*) FROM n"
+)
+
+
+def _table(engine):
+    table = Table("items", MetaData(), Column("id", Integer))
+    table.create(engine)
+    with engine.begin() as connection:
+        connection.execute(table.insert(), [{"id": i} for i in range(50)])
+    return table
+
+
+def test_phase_attribution(make_engine):
+    engine = make_engine(latency=0.01)
+    table = _table(engine)
+    profiler = Profiler()
+    query = select(table.c.id).where(table.c.id > 10)
+    with engine.connect() as connection:
+        connection = connection.execution_options(ingres_profiler=profiler)
+        for _ in range(2):
+            assert len(connection.execute(query).all()) == 39
+
+    [(statement, totals)] = profiler.statements.items()
+    assert "FROM items" in statement
+    assert totals.count == 2
+    # one round trip per execute, plus the first fetch of each result
+    assert totals.phases["execute"] >= 0.02
+    assert totals.phases["fetch"] >= 0.02
+    assert totals.phases["compile"] > 0
+
+    # the dialect has no compiled cache, so each execution compiled its statement
+    assert all(sample.phases["compile"] > 0 for sample in profiler.slowest)
+    assert "count" in profiler.report().splitlines()[0]
+
+
+def test_compilation_not_timed_without_profiler(make_engine):
+    engine = make_engine()
+    table = _table(engine)
+    with engine.connect() as connection:
+        result = connection.execute(select(table.c.id))
+        assert result.context.compiled._ingres_compile_time == 0.0
+        assert not engine.dialect._ingres_profiling
+
+
+def test_slowest_are_kept(make_engine):
+    engine = make_engine()
+    profiler = Profiler(slowest=2)
+    with engine.connect() as connection:
+        connection = connection.execution_options(ingres_profiler=profiler)
+        for i in range(5):
+            connection.execute(text("SELECT %d" % i)).all()
+        connection.execute(SLOW_QUERY).all()
+        for i in range(5):
+            connection.execute(text("SELECT %d" % i)).all()
+
+    assert len(profiler.statements) == 6
+    slowest = profiler.slowest
+    assert len(slowest) == 2
+    assert slowest[0].statement == SLOW_QUERY.text
+    assert slowest[0].elapsed >= slowest[1].elapsed
+    assert slowest[0].stats is None
+
+    profiler.reset()
+    assert profiler.slowest == []
+    assert not profiler.statements
+
+
+def test_cprofile_stops_with_unclosed_result(make_engine):
+    engine = make_engine()
+    table = _table(engine)
+    profiler = Profiler(slowest=1, cprofile=True)
+    with engine.connect() as connection:
+        connection = connection.execution_options(ingres_profiler=profiler)
+        result = connection.execute(select(table.c.id).order_by(table.c.id))
+        assert result.fetchone() == (0,)
+        # the result is still open, yet the profiler is not running
+        assert sys.getprofile() is None
+
+        result.close()
+        assert sys.getprofile() is None
+
+    [sample] = profiler.slowest
+    assert sample.stats.total_calls > 0
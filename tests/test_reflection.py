@@ -0,0 +1,66 @@
+# tests/test_reflection.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+import threading
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, event, inspect
+
+
+def _tables(metadata, names):
+    for name in names:
+        Table(name, metadata, Column("id", Integer, primary_key=True, autoincrement=False), Column("v", String(10)))
+
+
+def test_parallel_reflection(make_engine):
+    engine = make_engine(reflection_workers=4)
+    metadata = MetaData()
+    _tables(metadata, ["r%d" % i for i in range(10)])
+    metadata.create_all(engine)
+
+    reflected = MetaData()
+    reflected.reflect(engine)
+    assert sorted(reflected.tables) == sorted(metadata.tables)
+    assert [column.name for column in reflected.tables["r7"].columns] == ["id", "v"]
+
+
+def test_uncommitted_tables_are_reflected(make_engine):
+    engine = make_engine(reflection_workers=4)
+    committed = MetaData()
+    _tables(committed, ["c%d" % i for i in range(4)])
+    committed.create_all(engine)
+
+    with engine.connect() as connection:
+        uncommitted = MetaData()
+        _tables(uncommitted, ["u%d" % i for i in range(4)])
+        uncommitted.create_all(connection)
+
+        reflected = MetaData()
+        reflected.reflect(connection)
+        assert sorted(reflected.tables) == sorted(list(committed.tables) + list(uncommitted.tables))
+        assert inspect(connection).get_multi_columns()[(None, "u3")][1]["name"] == "v"
+        connection.rollback()
+
+
+def test_workers_use_the_callers_execution_options(make_engine):
+    engine = make_engine(reflection_workers=4)
+    metadata = MetaData()
+    _tables(metadata, ["o%d" % i for i in range(8)])
+    metadata.create_all(engine)
+
+    seen = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if threading.current_thread() is not threading.main_thread():
+            seen.append(conn.get_execution_options().get("schema_translate_map"))
+
+    translate = {"other": None}
+    with engine.connect() as connection:
+        connection = connection.execution_options(schema_translate_map=translate)
+        reflected = MetaData()
+        reflected.reflect(connection)
+    assert sorted(reflected.tables) == sorted(metadata.tables)
+    assert seen and all(value == translate for value in seen)
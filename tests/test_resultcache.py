@@ -0,0 +1,50 @@
+# tests/test_resultcache.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+from sqlalchemy import Column, Integer, MetaData, Table, func, select
+
+import standin
+
+
+def _table(engine):
+    table = Table("cached", MetaData(), Column("id", Integer, primary_key=True, autoincrement=False))
+    table.create(engine)
+    with engine.begin() as connection:
+        connection.execute(table.insert(), [{"id": i} for i in range(1, 11)])
+    return table
+
+
+def _ids(connection, table, values):
+    query = select(table.c.id).where(table.c.id.in_(values)).order_by(table.c.id)
+    return connection.execution_options(ingres_cache_ttl=60).execute(query).scalars().all()
+
+
+def test_large_in_lists_are_part_of_the_key(make_engine):
+    engine = make_engine(inlist_threshold=3, result_cache_size=10)
+    table = _table(engine)
+    with engine.connect() as connection:
+        assert _ids(connection, table, [1, 2, 3, 4]) == [1, 2, 3, 4]
+        assert _ids(connection, table, [5, 6, 7, 8]) == [5, 6, 7, 8]
+
+        trips = standin.stats["round_trips"]
+        assert _ids(connection, table, [1, 2, 3, 4]) == [1, 2, 3, 4]
+        # served from the cache without loading the IN list
+        assert standin.stats["round_trips"] == trips
+
+
+
+def test_uncommitted_changes_are_not_cached(make_engine):
+    engine = make_engine(result_cache_size=10)
+    table = _table(engine)
+    highest = select(func.max(table.c.id))
+    with engine.connect() as writer, engine.connect() as reader:
+        writer.execute(table.update().where(table.c.id == 10).values(id=99))
+        assert writer.execution_options(ingres_cache_ttl=60).execute(highest).scalar() == 99
+        # the reader must not see the writer's uncommitted change, neither before nor after the rollback
+        assert reader.execution_options(ingres_cache_ttl=60).execute(highest).scalar() == 10
+        writer.rollback()
+        assert reader.execution_options(ingres_cache_ttl=60).execute(highest).scalar() == 10
+        assert writer.execution_options(ingres_cache_ttl=60).execute(highest).scalar() == 10
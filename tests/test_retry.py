@@ -0,0 +1,67 @@
+# tests/test_retry.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+import pytest
+from sqlalchemy import exc, text
+
+import standin
+from sqlalchemy_ingres.retry import RetryCounters, run_transaction
+
+DEADLOCK = standin.OperationalError(
+    "40001", "[40001] [Actian][Ingres ODBC Driver][Ingres]Deadlock detected, your transaction was aborted. (4700) (SQLExecDirectW)"
+)
+DEADLOCK_CODE = standin.OperationalError(
+    "HY000", "[HY000] [Actian][Ingres ODBC Driver][Ingres]Transaction aborted. (4700) (SQLExecDirectW)"
+)
+LOCK_TIMEOUT = standin.OperationalError(
+    "HY000", "[HY000] [Actian][Ingres ODBC Driver][Ingres]Timeout occurred while waiting for a lock. (4702) (SQLExecDirectW)"
+)
+UNRELATED = standin.ProgrammingError(
+    "42000", "[42000] [Actian][Ingres ODBC Driver][Ingres]Table 'deadlock_log' (4700 rows) does not exist. (2117) (SQLExecDirectW)"
+)
+
+
+def _wrapped(error):
+    return exc.DBAPIError.instance("SELECT 1", {}, error, standin.Error)
+
+
+@pytest.mark.parametrize(
+    "error, deadlock, lock_timeout",
+    [(DEADLOCK, True, False), (DEADLOCK_CODE, True, False), (LOCK_TIMEOUT, False, True), (UNRELATED, False, False)],
+)
+def test_classification(make_engine, error, deadlock, lock_timeout):
+    dialect = make_engine().dialect
+    for e in (error, _wrapped(error)):
+        assert dialect.is_deadlock(e) is deadlock
+        assert dialect.is_lock_timeout(e) is lock_timeout
+        assert dialect.is_retryable(e) is (deadlock or lock_timeout)
+
+
+def test_run_transaction_retries(make_engine):
+    engine = make_engine()
+    errors = [DEADLOCK, LOCK_TIMEOUT]
+    counters = RetryCounters()
+
+    def work(connection):
+        result = connection.execute(text("SELECT 1")).scalar()
+        if errors:
+            raise _wrapped(errors.pop(0))
+        return result
+
+    assert run_transaction(engine, work, backoff=0.001, counters=counters) == 1
+    assert counters.as_dict() == {"transactions": 1, "deadlocks": 1, "lock_timeouts": 1, "retries": 2, "aborted": 0}
+
+
+def test_run_transaction_raises_other_errors(make_engine):
+    engine = make_engine()
+    counters = RetryCounters()
+
+    def work(connection):
+        raise _wrapped(UNRELATED)
+
+    with pytest.raises(exc.ProgrammingError):
+        run_transaction(engine, work, backoff=0.001, counters=counters)
+    assert counters.as_dict() == {"transactions": 1, "deadlocks": 0, "lock_timeouts": 0, "retries": 0, "aborted": 1}
@@ -0,0 +1,55 @@
+# tests/test_router.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+import pytest
+
+from sqlalchemy_ingres.pyodbc import Ingres_pyodbc, _HostRouter
+
+
+class Error(Exception):
+    pass
+
+
+def _connect(errors):
+    def connect(host):
+        if host in errors:
+            raise Error(errors[host], "[Actian][Ingres ODBC Driver] connect failed")
+        return object()
+
+    return connect
+
+
+def test_unreachable_server_is_skipped():
+    router = _HostRouter([("a", 1), ("b", 1)])
+    tried = []
+
+    def connect(host):
+        tried.append(host)
+        if len(tried) == 1:
+            raise Error("08001", "[Actian][Ingres ODBC Driver] server not reachable")
+        return object()
+
+    router.connect(connect, errors=(Error,), unavailable=Ingres_pyodbc()._is_unavailable)
+    assert len(tried) == 2
+    assert list(router._down_until) == [tried[0]]
+
+
+def test_other_errors_are_raised_without_marking_down():
+    router = _HostRouter([("a", 1), ("b", 1)])
+    dialect = Ingres_pyodbc()
+    failing = {("a", 1): "28000", ("b", 1): "28000"}
+    with pytest.raises(Error) as raised:
+        router.connect(_connect(failing), errors=(Error,), unavailable=dialect._is_unavailable)
+    assert raised.value.args[0] == "28000"
+    assert router._down_until == {}
+
+
+def test_all_servers_down():
+    router = _HostRouter([("a", 1), ("b", 1)])
+    failing = {("a", 1): "08001", ("b", 1): "08004"}
+    with pytest.raises(Error):
+        router.connect(_connect(failing), errors=(Error,), unavailable=Ingres_pyodbc()._is_unavailable)
+    assert sorted(router._down_until) == [("a", 1), ("b", 1)]
@@ -0,0 +1,73 @@
+# tests/test_session_tables.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+from sqlalchemy import Column, Integer, MetaData, Table, insert, inspect, select
+from sqlalchemy.schema import CreateTable
+
+from sqlalchemy_ingres import ddl
+
+
+def _metadata():
+    metadata = MetaData()
+    Table("stage", metadata, Column("id", Integer), prefixes=["TEMPORARY"])
+    Table("scratch", metadata, Column("id", Integer), ingres_temporary=True)
+    Table("kept", metadata, Column("id", Integer, primary_key=True, autoincrement=False))
+    return metadata
+
+
+def test_create_all_twice_and_drop_all(make_engine):
+    engine = make_engine()
+    metadata = _metadata()
+    with engine.connect() as connection:
+        for create_all in (metadata.create_all, metadata.create_all, lambda bind: ddl.create_all(bind, metadata)):
+            create_all(connection)
+            connection.commit()
+            for name in ("stage", "scratch", "kept"):
+                assert inspect(connection).has_table(name)
+
+        metadata.drop_all(connection)
+        connection.commit()
+        for name in ("stage", "scratch", "kept"):
+            assert not inspect(connection).has_table(name)
+        metadata.create_all(connection)
+
+
+def test_rolled_back_declaration(make_engine):
+    engine = make_engine()
+    metadata = _metadata()
+    with engine.connect() as connection:
+        metadata.tables["stage"].create(connection)
+        connection.rollback()
+        assert not inspect(connection).has_table("stage")
+        metadata.tables["stage"].create(connection, checkfirst=True)
+
+
+def test_schema_translate_map_keeps_session(make_engine):
+    engine = make_engine()
+    stage = _metadata().tables["stage"]
+    with engine.connect() as connection:
+        connection = connection.execution_options(schema_translate_map={None: "other"})
+        stage.create(connection)
+        connection.execute(insert(stage), {"id": 1})
+        assert connection.execute(select(stage)).all() == [(1,)]
+        assert "session.stage" in str(CreateTable(stage).compile(dialect=engine.dialect))
+
+
+def test_reflect_columns(make_engine):
+    engine = make_engine()
+    metadata = _metadata()
+    kept = Table("stage", MetaData(), Column("other", Integer, primary_key=True, autoincrement=False))
+    with engine.connect() as connection:
+        # a permanent table of the same name does not hide the session table
+        kept.create(connection)
+        metadata.tables["stage"].create(connection)
+        metadata.tables["scratch"].create(connection)
+        for name in ("stage", "scratch"):
+            assert [c["name"] for c in inspect(connection).get_columns(name)] == ["id"]
+            assert inspect(connection).get_pk_constraint(name)["constrained_columns"] == []
+            reflected = Table(name, MetaData(), autoload_with=connection)
+            assert list(reflected.c.keys()) == ["id"]
+        assert [c["name"] for c in inspect(connection).get_columns("stage", schema="session")] == ["id"]
@@ -0,0 +1,80 @@
+# tests/test_spill.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, func, select
+
+from sqlalchemy_ingres.spill import _SpillBuffer
+
+
+def _table(engine, rows=3500):
+    table = Table("big", MetaData(), Column("id", Integer), Column("name", String(20)))
+    table.create(engine)
+    with engine.begin() as connection:
+        connection.execute(table.insert(), [{"id": i, "name": "n%d" % i} for i in range(rows)])
+    return table
+
+
+def test_buffer_keeps_order_across_memory_and_file():
+    buffer = _SpillBuffer(5, chunk_rows=4)
+    buffer.extend((i,) for i in range(23))
+    assert len(buffer) == 23
+    assert len(buffer._memory) == 5
+    assert buffer._chunks == 4 and len(buffer._pending) == 2
+    assert [buffer.popleft() for _ in range(7)] == [(i,) for i in range(7)]
+    assert list(buffer) == [(i,) for i in range(7, 23)]
+    assert not buffer and buffer._file is None
+
+
+def test_rows_beyond_the_limit_are_spilled(make_engine):
+    engine = make_engine()
+    table = _table(engine)
+    with engine.connect() as connection:
+        result = connection.execution_options(ingres_buffer_rows=100).execute(select(table).order_by(table.c.id))
+        buffer = result.cursor_strategy._rowbuffer
+        assert len(buffer) == 3500
+        assert len(buffer._memory) == 100
+        assert buffer._file is not None
+
+        # the cursor is free while the buffered rows are used
+        ids = []
+        for row in result:
+            ids.append(row.id)
+            if row.id % 1000 == 0:
+                assert connection.execute(select(func.count()).select_from(table)).scalar() == 3500
+        assert ids == list(range(3500))
+        assert buffer._file is None
+
+
+def test_fetchmany_and_fetchall(make_engine):
+    engine = make_engine()
+    table = _table(engine)
+    with engine.connect() as connection:
+        result = connection.execution_options(ingres_buffer_rows=10).execute(select(table.c.id).order_by(table.c.id))
+        assert [row.id for row in result.fetchmany(15)] == list(range(15))
+        assert result.fetchone().id == 15
+        assert [row.id for row in result.fetchall()] == list(range(16, 3500))
+
+
+def test_close_removes_the_file(make_engine):
+    engine = make_engine()
+    table = _table(engine)
+    with engine.connect() as connection:
+        result = connection.execution_options(ingres_buffer_rows=10).execute(select(table))
+        buffer = result.cursor_strategy._rowbuffer
+        spill_file = buffer._file
+        result.fetchmany(5)
+        result.close()
+        assert spill_file.closed
+        assert buffer._file is None and not buffer
+
+
+def test_small_results_stay_in_memory(make_engine):
+    engine = make_engine()
+    table = _table(engine, rows=50)
+    with engine.connect() as connection:
+        result = connection.execution_options(ingres_buffer_rows=100).execute(select(table))
+        assert result.cursor_strategy._rowbuffer._file is None
+        assert len(result.all()) == 50
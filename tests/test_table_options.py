@@ -0,0 +1,34 @@
+# tests/test_table_options.py
+# Copyright 2020 Actian Corporation
+#
+# This module is part of SQLAlchemy and is released under
+# the Apache-2.0 License: https://opensource.org/license/apache-2-0/
+
+from sqlalchemy import Column, Integer, MetaData, Table
+from sqlalchemy.schema import CreateTable
+
+
+def _reflect(engine, **execution_options):
+    with engine.connect() as connection:
+        metadata = MetaData()
+        metadata.reflect(connection.execution_options(**execution_options))
+        return metadata.tables["opts"]
+
+
+def test_table_options_are_opt_in(make_engine):
+    engine = make_engine()
+    Table("opts", MetaData(), Column("id", Integer, primary_key=True, autoincrement=False)).create(engine)
+
+    table = _reflect(engine)
+    assert not any(key.startswith("ingres_") for key in table.kwargs)
+    assert "WITH" not in str(CreateTable(table).compile(dialect=engine.dialect))
+
+    table = _reflect(engine, ingres_reflect_table_options=True)
+    assert table.kwargs["ingres_structure"] == "HEAP"
+    assert "WITH STRUCTURE=HEAP" in str(CreateTable(table).compile(dialect=engine.dialect))
+
+
+def test_engine_parameter(make_engine):
+    engine = make_engine(reflect_table_options=True)
+    Table("opts", MetaData(), Column("id", Integer, primary_key=True, autoincrement=False)).create(engine)
+    assert _reflect(engine).kwargs["ingres_nojournaling"] is True